@@ -3,13 +3,13 @@
 import logging
 
 from drf_yasg.utils import swagger_auto_schema
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
 from vng_api_common.authorizations.models import Applicatie
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
 from openzaak.utils.pagination import OptimizedPagination
 
 from ._schema_overrides import ApplicatieConsumerAutoSchema
@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+import time
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from openzaak.utils.cache import (
+    LocalLRUCache,
+    get_cache_generation,
+    invalidate_cache_generation,
+)
+from openzaak.utils.constants import AUTHORIZATIONS_CACHE_GENERATION
+
+applicatie_auth_cache = LocalLRUCache(maxsize=1000)
+
+
+def _invalidate() -> None:
+    invalidate_cache_generation(AUTHORIZATIONS_CACHE_GENERATION)
+
+
+def invalidate_authorizations_cache() -> None:
+    """
+    Invalidate all cached authorization data, in every process.
+
+    The cache is invalidated right away, so the changes are visible within the
+    current transaction, and again after the commit, since other processes could
+    have cached the old state in the meantime.
+    """
+    _invalidate()
+    transaction.on_commit(_invalidate)
+
+
+def get_cached_applicatie_auth(client_id: str, resolve: Callable[[], Any]) -> Any:
+    """
+    Return the applications and authorizations of a client, calling ``resolve`` only
+    if they are not cached yet.
+
+    The result is cached in the process itself and in the default cache, so other
+    processes can pick it up. Both are keyed on the authorizations cache generation,
+    which is bumped on every change to applications and their authorizations. The
+    entries store when they expire, so changes that bypass the signals are picked
+    up within ``AUTHORIZATIONS_CACHE_TIMEOUT`` seconds in every process as well.
+    """
+    timeout = settings.AUTHORIZATIONS_CACHE_TIMEOUT
+    if not timeout:
+        return resolve()
+
+    generation = get_cache_generation(AUTHORIZATIONS_CACHE_GENERATION)
+    key = f"applicatie-auth:{generation}:{client_id}"
+    now = time.time()
+
+    cached = applicatie_auth_cache.get(key)
+    if cached is None or cached[0] <= now:
+        cached = cache.get(key)
+        if cached is None or cached[0] <= now:
+            cached = (now + timeout, resolve())
+            cache.set(key, cached, timeout=timeout)
+        applicatie_auth_cache.set(key, cached)
+    return cached[1]
@@ -27,6 +27,7 @@ from openzaak.components.catalogi.models import (
 from openzaak.utils.auth import get_auth
 from openzaak.utils.validators import ResourceValidator
 
+from .cache import invalidate_authorizations_cache
 from .constants import RelatedTypeSelectionMethods
 from .utils import (
     get_applicatie_serializer,
@@ -411,6 +412,8 @@ class AutorisatieForm(forms.Form):
                     )
 
             Autorisatie.objects.bulk_create(autorisaties)
+            # bulk_create does not send signals
+            invalidate_authorizations_cache()
 
 
 class AutorisatieBaseFormSet(forms.BaseFormSet):
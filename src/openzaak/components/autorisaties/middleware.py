@@ -1,20 +1,206 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
-from typing import List, Union
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import product
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 import jwt
 from rest_framework.exceptions import PermissionDenied
-from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.middleware import (
     AuthMiddleware as _AuthMiddleware,
     JWTAuth as _JWTAuth,
 )
+from vng_api_common.scopes import OPERATOR_AND, OPERATOR_OR, Scope
 
+from openzaak.utils.cache import LocalLRUCache
 from openzaak.utils.constants import COMPONENT_MAPPING
 
+from .cache import get_cached_applicatie_auth
+
+# number of memoized granted scope masks per set of authorizations
+GRANTED_MASKS_CACHE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class AutorisatieData:
+    """
+    Plain representation of an :class:`Autorisatie`, cheap to (un)pickle.
+    """
+
+    component: str
+    scopes: Tuple[str, ...]
+    zaaktype: str
+    informatieobjecttype: str
+    besluittype: str
+    max_vertrouwelijkheidaanduiding: str
+
+
+def _get_va_order(value: str) -> Optional[int]:
+    if not value:
+        return None
+    return VertrouwelijkheidsAanduiding.get_choice(value).order
+
+
+class AuthorizationIndex:
+    """
+    Precomputed lookup structure for the authorizations of a client.
+
+    The scopes are interned to bit positions per component, and the scopes granted
+    by the authorizations are indexed per component and (zaaktype,
+    informatieobjecttype, besluittype). Both the granted and the required scopes
+    are memoized as bitmasks, so a repeated permission check boils down to a few
+    dict lookups and a bitmask test.
+    """
+
+    def __init__(self, autorisaties: Iterable[AutorisatieData]):
+        self.scope_bits: Dict[str, Dict[str, int]] = {}
+        self.grants: Dict[
+            str, Dict[Tuple[str, str, str], List[Tuple[Optional[int], int]]]
+        ] = {}
+
+        for autorisatie in autorisaties:
+            bits = self.scope_bits.setdefault(autorisatie.component, {})
+            mask = 0
+            for scope in autorisatie.scopes:
+                if scope not in bits:
+                    bits[scope] = 1 << len(bits)
+                mask |= bits[scope]
+
+            types = (
+                autorisatie.zaaktype,
+                autorisatie.informatieobjecttype,
+                autorisatie.besluittype,
+            )
+            va_order = _get_va_order(autorisatie.max_vertrouwelijkheidaanduiding)
+            self.grants.setdefault(autorisatie.component, {}).setdefault(
+                types, []
+            ).append((va_order, mask))
+
+        # the keys of the granted masks come from the request data, so the number
+        # of entries is bounded
+        self._granted_masks = LocalLRUCache(maxsize=GRANTED_MASKS_CACHE_SIZE)
+        self._required_masks = {}
+
+    def get_granted_mask(
+        self,
+        component: str,
+        zaaktype: Optional[str] = None,
+        informatieobjecttype: Optional[str] = None,
+        besluittype: Optional[str] = None,
+        vertrouwelijkheidaanduiding: Optional[str] = None,
+    ) -> int:
+        """
+        Return the bitmask of all scopes granted for the given object properties.
+
+        ``None`` means that the property is not relevant for the check.
+        """
+        key = (
+            component,
+            zaaktype,
+            informatieobjecttype,
+            besluittype,
+            vertrouwelijkheidaanduiding,
+        )
+        # invalid values (e.g. lists) in the request data are not memoized
+        memoize = all(value is None or isinstance(value, str) for value in key)
+        mask = self._granted_masks.get(key) if memoize else None
+        if mask is not None:
+            return mask
+
+        order_provided = (
+            None
+            if vertrouwelijkheidaanduiding is None
+            else VertrouwelijkheidsAanduiding.get_choice(
+                vertrouwelijkheidaanduiding
+            ).order
+        )
+        mask = 0
+        for types, grants in self.grants.get(component, {}).items():
+            if any(
+                value is not None and value != granted_value
+                for value, granted_value in zip(
+                    (zaaktype, informatieobjecttype, besluittype), types
+                )
+            ):
+                continue
+
+            for va_order, granted_mask in grants:
+                # only authorizations with a max_vertrouwelijkheidaanduiding bigger or
+                # equal than the one of the object are relevant
+                if order_provided is None or (
+                    va_order is not None and va_order >= order_provided
+                ):
+                    mask |= granted_mask
+
+        if memoize:
+            self._granted_masks.set(key, mask)
+        return mask
+
+    def get_required_masks(self, component: str, scope: Scope) -> Tuple[int, ...]:
+        """
+        Convert the (combined) scope to bitmasks, at least one of which must be
+        granted completely.
+
+        Scopes which are not known for the component can't be granted, so
+        alternatives requiring them are left out.
+        """
+        key = (component, repr(scope))
+        masks = self._required_masks.get(key)
+        if masks is None:
+            bits = self.scope_bits.get(component, {})
+            masks = self._required_masks[key] = tuple(self._to_masks(scope, bits))
+        return masks
+
+    def _to_masks(self, scope: Scope, bits: Dict[str, int]) -> List[int]:
+        if not scope.children:
+            return [bits[scope.label]] if scope.label in bits else []
+
+        children = [self._to_masks(child, bits) for child in scope.children]
+        if scope.operator == OPERATOR_OR:
+            return [mask for masks in children for mask in masks]
+        elif scope.operator == OPERATOR_AND:
+            masks = []
+            for combination in product(*children):
+                mask = 0
+                for child_mask in combination:
+                    mask |= child_mask
+                masks.append(mask)
+            return masks
+        else:
+            raise ValueError(f"Unknown operator '{scope.operator}'")
+
+    def has_scopes(self, component: str, scope: Scope, **fields) -> bool:
+        granted = self.get_granted_mask(component, **fields)
+        return any(
+            granted & mask == mask for mask in self.get_required_masks(component, scope)
+        )
+
+
+@dataclass(frozen=True)
+class ApplicatieAuth:
+    """
+    The applications of a client and all their authorizations.
+    """
+
+    applicaties: List[Applicatie]
+    autorisaties: Tuple[AutorisatieData, ...]
+
+    @cached_property
+    def index(self) -> AuthorizationIndex:
+        # built in every process on first use, rather than stored in the cache
+        return AuthorizationIndex(self.autorisaties)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("index", None)
+        return state
+
 
 class JWTAuth(_JWTAuth):
     component = None
@@ -30,11 +216,61 @@ class JWTAuth(_JWTAuth):
             )
 
     @property
-    def applicaties(self) -> Union[models.QuerySet, List, None]:
-        # Add caching, compared to base class since we do a lot of self.applicaties calls
-        if not hasattr(self, "_applicaties_qs"):
-            self._applicaties_qs = super().applicaties
-        return self._applicaties_qs
+    def applicatie_auth(self) -> ApplicatieAuth:
+        """
+        Resolve the applications and authorizations of the client.
+
+        The result is memoized on the request and cached across requests, see
+        :func:`openzaak.components.autorisaties.cache.get_cached_applicatie_auth`.
+        """
+        if not hasattr(self, "_applicatie_auth"):
+            if self.client_id is None:
+                self._applicatie_auth = ApplicatieAuth(applicaties=[], autorisaties=())
+            else:
+                self._applicatie_auth = get_cached_applicatie_auth(
+                    self.client_id, self._resolve_applicatie_auth
+                )
+        return self._applicatie_auth
+
+    def _resolve_applicatie_auth(self) -> ApplicatieAuth:
+        applicaties = list(super().applicaties)
+        autorisaties = (
+            Autorisatie.objects.filter(applicatie__in=applicaties).values_list(
+                "component",
+                "scopes",
+                "zaaktype",
+                "informatieobjecttype",
+                "besluittype",
+                "max_vertrouwelijkheidaanduiding",
+            )
+            if applicaties
+            else []
+        )
+        return ApplicatieAuth(
+            applicaties=applicaties,
+            autorisaties=tuple(
+                AutorisatieData(
+                    component=component,
+                    scopes=tuple(scopes),
+                    zaaktype=zaaktype,
+                    informatieobjecttype=informatieobjecttype,
+                    besluittype=besluittype,
+                    max_vertrouwelijkheidaanduiding=max_vertrouwelijkheidaanduiding,
+                )
+                for (
+                    component,
+                    scopes,
+                    zaaktype,
+                    informatieobjecttype,
+                    besluittype,
+                    max_vertrouwelijkheidaanduiding,
+                ) in autorisaties
+            ),
+        )
+
+    @property
+    def applicaties(self) -> List[Applicatie]:
+        return self.applicatie_auth.applicaties
 
     def _request_auth(self) -> list:
         return []
@@ -69,24 +305,8 @@ class JWTAuth(_JWTAuth):
         if not init_component:
             return False
 
-        autorisaties = self.get_autorisaties(init_component)
-        scopes_provided = set()
-
-        # filter on all additional components
-        for field_name, field_value in fields.items():
-            if hasattr(self, f"filter_{field_name}"):
-                autorisaties = getattr(self, f"filter_{field_name}")(
-                    autorisaties, field_value
-                )
-            else:
-                autorisaties = self.filter_default(
-                    autorisaties, field_name, field_value
-                )
-
-        for autorisatie in autorisaties:
-            scopes_provided.update(autorisatie.scopes)
-
-        return scopes.is_contained_in(list(scopes_provided))
+        component = COMPONENT_MAPPING.get(init_component, init_component)
+        return self.applicatie_auth.index.has_scopes(component, scopes, **fields)
 
 
 class AuthMiddleware(_AuthMiddleware):
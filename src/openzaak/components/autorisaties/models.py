@@ -13,6 +13,8 @@ from vng_api_common.fields import VertrouwelijkheidsAanduidingField
 
 from openzaak.utils import build_absolute_url
 
+from .cache import invalidate_authorizations_cache
+
 COMPONENT_TO_MODEL = {
     ComponentTypes.zrc: "catalogi.ZaakType",
     ComponentTypes.drc: "catalogi.InformatieObjectType",
@@ -149,6 +151,8 @@ class AutorisatieSpec(models.Model):
 
         # created the de-duplicated, missing autorisaties
         Autorisatie.objects.bulk_create(_to_add)
+        # bulk_create does not send signals
+        invalidate_authorizations_cache()
 
         # determine which notifications to send
         changed = {autorisatie.applicatie for autorisatie in (to_delete + _to_add)}
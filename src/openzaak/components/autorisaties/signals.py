@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+import logging
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+
+from openzaak.components.catalogi.models import (
+    BesluitType,
+    InformatieObjectType,
+    ZaakType,
+)
+
+from .cache import invalidate_authorizations_cache
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Applicatie,
+    dispatch_uid="autorisaties.invalidate_cache_applicatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Autorisatie,
+    dispatch_uid="autorisaties.invalidate_cache_autorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakType,
+    dispatch_uid="autorisaties.invalidate_cache_zaaktype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=InformatieObjectType,
+    dispatch_uid="autorisaties.invalidate_cache_informatieobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=BesluitType,
+    dispatch_uid="autorisaties.invalidate_cache_besluittype",
+)
+def invalidate_cache(sender, **kwargs) -> None:
+    logger.debug("Invalidating the authorizations cache after change in %r", sender)
+    invalidate_authorizations_cache()
@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.tests.utils import JWTAuthMixin, QueryBudget, QueryBudgetMixin
+
+from .factories import ApplicatieFactory, AutorisatieFactory
+
+
+def applicatie_list(n: int) -> str:
+    for applicatie in ApplicatieFactory.create_batch(n):
+        AutorisatieFactory.create_batch(2, applicatie=applicatie)
+    return reverse("applicatie-list")
+
+
+def applicatie_detail(n: int) -> str:
+    applicatie = ApplicatieFactory.create()
+    AutorisatieFactory.create_batch(n, applicatie=applicatie)
+    return reverse(applicatie)
+
+
+class AutorisatiesQueryBudgetTests(JWTAuthMixin, QueryBudgetMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    query_budgets = [
+        QueryBudget("applicatie-list", applicatie_list),
+        QueryBudget("applicatie-detail", applicatie_detail),
+    ]
@@ -4,11 +4,6 @@ from django.db import transaction
 from django.utils.translation import ugettext_lazy as _
 
 from django_loose_fk.virtual_models import ProxyMixin
-from notifications_api_common.viewsets import (
-    NotificationCreateMixin,
-    NotificationDestroyMixin,
-    NotificationViewSetMixin,
-)
 from rest_framework import mixins, viewsets
 from rest_framework.exceptions import ValidationError
 from vng_api_common.audittrails.viewsets import (
@@ -22,7 +17,13 @@ from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.components.zaken.api.mixins import ClosedZaakMixin
 from openzaak.components.zaken.api.utils import delete_remote_zaakbesluit
+from openzaak.notifications.viewsets import (
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationViewSetMixin,
+)
 from openzaak.utils.api import delete_remote_oio
+from openzaak.utils.bulk import BulkReadMixin
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
@@ -43,6 +44,7 @@ from .serializers import BesluitInformatieObjectSerializer, BesluitSerializer
 
 @conditional_retrieve()
 class BesluitViewSet(
+    BulkReadMixin,
     CheckQueryParamsMixin,
     NotificationViewSetMixin,
     AuditTrailViewsetMixin,
@@ -113,7 +115,9 @@ class BesluitViewSet(
     - audit trail regels
     """
 
-    queryset = Besluit.objects.select_related("_besluittype").order_by("-pk")
+    queryset = Besluit.objects.select_related(
+        "_besluittype", "_besluittype_base_url", "_zaak", "_zaak_base_url"
+    ).order_by("-pk")
     serializer_class = BesluitSerializer
     filter_class = BesluitFilter
     lookup_field = "uuid"
@@ -122,6 +126,7 @@ class BesluitViewSet(
     required_scopes = {
         "list": SCOPE_BESLUITEN_ALLES_LEZEN,
         "retrieve": SCOPE_BESLUITEN_ALLES_LEZEN,
+        "_bulk_read": SCOPE_BESLUITEN_ALLES_LEZEN,
         "create": SCOPE_BESLUITEN_AANMAKEN,
         "destroy": SCOPE_BESLUITEN_ALLES_VERWIJDEREN,
         "update": SCOPE_BESLUITEN_BIJWERKEN,
@@ -215,7 +220,9 @@ class BesluitInformatieObjectViewSet(
     """
 
     queryset = (
-        BesluitInformatieObject.objects.select_related("besluit", "_informatieobject")
+        BesluitInformatieObject.objects.select_related(
+            "besluit", "_informatieobject", "_informatieobject_base_url"
+        )
         .prefetch_related("_informatieobject__enkelvoudiginformatieobject_set")
         .all()
     )
@@ -2,8 +2,10 @@
 # Copyright (C) 2019 - 2020 Dimpact
 import logging
 import uuid as _uuid
+from functools import partial
 
 from django.apps import apps
+from django.conf import settings
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
@@ -17,7 +19,9 @@ from zgw_consumers.models import ServiceUrlField
 
 from openzaak.components.documenten.loaders import EIOLoader
 from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.utils.constants import DocumentIdentificatieGenerators
 from openzaak.utils.fields import FkOrServiceUrlField, RelativeURLField, ServiceFkField
+from openzaak.utils.identification import SequenceIdentificatieGenerator
 from openzaak.utils.mixins import AuditTrailMixin
 
 from .constants import VervalRedenen
@@ -209,6 +213,14 @@ class Besluit(ETagMixin, AuditTrailMixin, APIMixin, models.Model):
 
     def save(self, *args, **kwargs):
         if not self.identificatie:
+            if (
+                settings.BESLUIT_IDENTIFICATIE_GENERATOR
+                == DocumentIdentificatieGenerators.counter
+            ):
+                identificatie_generator.save(
+                    self, partial(super().save, *args, **kwargs)
+                )
+                return
             self.identificatie = generate_unique_identification(self, "datum")
 
         super().save(*args, **kwargs)
@@ -235,6 +247,11 @@ class Besluit(ETagMixin, AuditTrailMixin, APIMixin, models.Model):
         return None
 
 
+identificatie_generator = SequenceIdentificatieGenerator(
+    Besluit, "verantwoordelijke_organisatie", "datum"
+)
+
+
 class BesluitInformatieObject(ETagMixin, models.Model):
     """
     Aanduiding van het (de) INFORMATIEOBJECT(en) waarin
@@ -2,10 +2,18 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from datetime import date
 
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
+from openzaak.utils.constants import DocumentIdentificatieGenerators
+
+from ...models import identificatie_generator
 from ...tests.factories import BesluitFactory
 
+ORGANISATIE = "517439943"
+OTHER_ORGANISATIE = "111222333"
+
 
 class BesluitTests(TestCase):
     def test_human_readable_1(self):
@@ -20,3 +28,71 @@ class BesluitTests(TestCase):
         besluit = BesluitFactory.create(identificatie="", datum=date(2019, 5, 1))
 
         self.assertEqual(besluit.identificatie, "BESLUIT-2019-0000000021")
+
+
+@override_settings(
+    BESLUIT_IDENTIFICATIE_GENERATOR=DocumentIdentificatieGenerators.counter
+)
+class BesluitCounterTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(identificatie_generator.clear)
+
+    def _create(self, organisation=ORGANISATIE, **kwargs):
+        return BesluitFactory.create(
+            identificatie="",
+            verantwoordelijke_organisatie=organisation,
+            datum=date(2019, 7, 1),
+            **kwargs,
+        )
+
+    def test_numbers_per_organisation(self):
+        besluiten = [self._create(), self._create(), self._create(OTHER_ORGANISATIE)]
+
+        self.assertEqual(
+            [besluit.identificatie for besluit in besluiten],
+            [
+                "BESLUIT-2019-0000000001",
+                "BESLUIT-2019-0000000002",
+                "BESLUIT-2019-0000000001",
+            ],
+        )
+
+    def test_continue_after_existing_identifications(self):
+        BesluitFactory.create(
+            identificatie="BESLUIT-2019-0000000020",
+            verantwoordelijke_organisatie=ORGANISATIE,
+        )
+
+        besluit = self._create()
+
+        self.assertEqual(besluit.identificatie, "BESLUIT-2019-0000000021")
+
+    def test_skip_explicitly_assigned_identifications(self):
+        self._create()
+        for identificatie in ("BESLUIT-2019-0000000002", "BESLUIT-2019-0000000003"):
+            BesluitFactory.create(
+                identificatie=identificatie, verantwoordelijke_organisatie=ORGANISATIE
+            )
+
+        besluit = self._create()
+
+        self.assertEqual(besluit.identificatie, "BESLUIT-2019-0000000004")
+
+    @override_settings(IDENTIFICATIE_BLOCK_SIZE=10)
+    def test_numbers_are_reserved_in_blocks(self):
+        # numbers are only reserved once the sequence is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create()
+        self._create()
+
+        with CaptureQueriesContext(connection) as queries:
+            besluit = self._create()
+
+        self.assertEqual(besluit.identificatie, "BESLUIT-2019-0000000003")
+        self.assertFalse(any("nextval" in query["sql"] for query in queries))
+        # existing identifications are only looked up when the insert fails
+        self.assertFalse(
+            any('FROM "besluiten_besluit"' in query["sql"] for query in queries)
+        )
@@ -114,6 +114,26 @@ class BesluitReadCorrectScopeTests(JWTAuthMixin, APITestCase):
         self.assertEqual(response1.status_code, status.HTTP_200_OK)
         self.assertEqual(response2.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_besluit_bulk_read(self):
+        """
+        Assert the bulk read only returns the BESLUITen of the besluittypes of your
+        authorization
+        """
+        besluit1 = BesluitFactory.create(besluittype=self.besluittype)
+        besluit2 = BesluitFactory.create()
+
+        response = self.client.post(
+            reverse("besluit--bulk-read"),
+            {"urls": [f"http://testserver{reverse(besluit1)}", str(besluit2.uuid)]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(len(response_data), 1)
+        self.assertEqual(
+            response_data[0]["url"], f"http://testserver{reverse(besluit1)}"
+        )
+
     def test_read_superuser(self):
         """
         superuser read everything
@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.tests.utils import JWTAuthMixin, QueryBudget, QueryBudgetMixin
+
+from .factories import BesluitFactory, BesluitInformatieObjectFactory
+
+
+def besluit_list(n: int) -> str:
+    BesluitFactory.create_batch(n, for_zaak=True)
+    return reverse("besluit-list")
+
+
+def besluitinformatieobject_list(n: int) -> str:
+    BesluitInformatieObjectFactory.create_batch(n)
+    return reverse("besluitinformatieobject-list")
+
+
+class BesluitenQueryBudgetTests(JWTAuthMixin, QueryBudgetMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    query_budgets = [
+        QueryBudget("besluit-list", besluit_list),
+        QueryBudget("besluitinformatieobject-list", besluitinformatieobject_list),
+    ]
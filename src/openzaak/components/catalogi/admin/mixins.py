@@ -8,7 +8,7 @@ from django.contrib.admin.templatetags.admin_urls import add_preserved_filters
 from django.contrib.admin.utils import flatten_fieldsets
 from django.core.exceptions import PermissionDenied
 from django.core.management import CommandError, call_command
-from django.http import HttpResponse, HttpResponseRedirect
+from django.http import HttpResponseRedirect, StreamingHttpResponse
 from django.template.response import TemplateResponse
 from django.urls import path, reverse
 from django.utils.html import format_html
@@ -24,6 +24,7 @@ from ..api.viewsets import (
     InformatieObjectTypeViewSet,
     ZaakTypeViewSet,
 )
+from ..export import stream_export
 from ..models import BesluitType, Catalogus, InformatieObjectType, ZaakType
 from .forms import CatalogusImportForm
 from .helpers import AdminForm
@@ -228,16 +229,14 @@ class ExportMixin:
 
             resource_list, id_list = self.get_related_objects(obj)
 
-            response = HttpResponse(content_type="application/zip")
+            # the archive is written while it's being sent
+            response = StreamingHttpResponse(
+                stream_export(resource_list, id_list), content_type="application/zip"
+            )
             filename = slugify(str(obj))
             response["Content-Disposition"] = "attachment;filename={}".format(
                 f"{filename}.zip"
             )
-            call_command(
-                "export", response=response, resource=resource_list, ids=id_list,
-            )
-
-            response["Content-Length"] = len(response.content)
 
             self.message_user(
                 request,
@@ -329,6 +328,7 @@ class ImportMixin:
                         "import",
                         import_file_content=import_file.read(),
                         generate_new_uuids=generate_new_uuids,
+                        verbosity=0,
                     )
                     self.message_user(
                         request,
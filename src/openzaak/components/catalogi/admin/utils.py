@@ -15,6 +15,7 @@ from openzaak.utils.cache import DjangoRequestsCache, requests_cache_enabled
 
 from ..api import serializers
 from ..models import BesluitType, Catalogus, InformatieObjectType
+from ..utils import remap_uuids
 
 factory = APIRequestFactory()
 REQUEST = factory.get("/")
@@ -158,14 +159,23 @@ def import_zaaktype_for_catalogus(
                 data = zip_file.read(f"{resource}.json").decode()
 
                 if resource == "ZaakTypeInformatieObjectType":
-                    for old, new in iotypen_uuid_mapping.items():
-                        data = data.replace(old, str(new.uuid))
+                    data = remap_uuids(
+                        data,
+                        {
+                            old: str(new.uuid)
+                            for old, new in iotypen_uuid_mapping.items()
+                        },
+                    )
                 elif resource == "ZaakType":
-                    for old, new in besluittypen_uuid_mapping.items():
-                        data = data.replace(old, str(new.uuid))
-
-                for old, new in uuid_mapping.items():
-                    data = data.replace(old, new)
+                    data = remap_uuids(
+                        data,
+                        {
+                            old: str(new.uuid)
+                            for old, new in besluittypen_uuid_mapping.items()
+                        },
+                    )
+
+                data = remap_uuids(data, uuid_mapping)
 
                 data = json.loads(data)
 
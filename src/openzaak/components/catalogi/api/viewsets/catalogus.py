@@ -4,6 +4,7 @@ from rest_framework import mixins, viewsets
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.utils.bulk import BulkReadMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 
@@ -15,7 +16,10 @@ from ..serializers import CatalogusSerializer
 
 @conditional_retrieve()
 class CatalogusViewSet(
-    CheckQueryParamsMixin, mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet
+    BulkReadMixin,
+    CheckQueryParamsMixin,
+    mixins.CreateModelMixin,
+    viewsets.ReadOnlyModelViewSet,
 ):
     """
     Opvragen en bewerken van CATALOGUSsen.
@@ -68,6 +72,7 @@ class CatalogusViewSet(
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
         "retrieve": SCOPE_CATALOGI_READ,
+        "_bulk_read": SCOPE_CATALOGI_READ,
         "create": SCOPE_CATALOGI_WRITE,
         "destroy": SCOPE_CATALOGI_WRITE,
     }
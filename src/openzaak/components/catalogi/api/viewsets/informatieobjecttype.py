@@ -1,12 +1,13 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 from drf_yasg.utils import no_body, swagger_auto_schema
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.bulk import BulkReadMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import COMMON_ERROR_RESPONSES, use_ref
@@ -26,6 +27,7 @@ from .mixins import ConceptMixin, M2MConceptDestroyMixin
 
 @conditional_retrieve()
 class InformatieObjectTypeViewSet(
+    BulkReadMixin,
     CheckQueryParamsMixin,
     ConceptMixin,
     M2MConceptDestroyMixin,
@@ -92,6 +94,7 @@ class InformatieObjectTypeViewSet(
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
         "retrieve": SCOPE_CATALOGI_READ,
+        "_bulk_read": SCOPE_CATALOGI_READ,
         "create": SCOPE_CATALOGI_WRITE,
         "update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
         "partial_update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
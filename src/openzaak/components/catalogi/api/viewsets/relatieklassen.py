@@ -8,6 +8,7 @@ from rest_framework.exceptions import ValidationError
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.utils.bulk import BulkReadMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import AutoSchema
@@ -31,6 +32,7 @@ class ZaakTypeInformatieObjectTypeSchema(AutoSchema):
 
 @conditional_retrieve()
 class ZaakTypeInformatieObjectTypeViewSet(
+    BulkReadMixin,
     CheckQueryParamsMixin,
     ConceptFilterMixin,
     ConceptDestroyMixin,
@@ -102,6 +104,7 @@ class ZaakTypeInformatieObjectTypeViewSet(
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
         "retrieve": SCOPE_CATALOGI_READ,
+        "_bulk_read": SCOPE_CATALOGI_READ,
         "create": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
         "update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
         "partial_update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
@@ -4,6 +4,7 @@ from rest_framework import viewsets
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.utils.bulk import BulkReadMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 
@@ -21,7 +22,7 @@ from .mixins import ZaakTypeConceptMixin
 
 @conditional_retrieve()
 class ResultaatTypeViewSet(
-    CheckQueryParamsMixin, ZaakTypeConceptMixin, viewsets.ModelViewSet
+    BulkReadMixin, CheckQueryParamsMixin, ZaakTypeConceptMixin, viewsets.ModelViewSet
 ):
     """
     Opvragen en bewerken van RESULTAATTYPEn van een ZAAKTYPE.
@@ -77,6 +78,7 @@ class ResultaatTypeViewSet(
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
         "retrieve": SCOPE_CATALOGI_READ,
+        "_bulk_read": SCOPE_CATALOGI_READ,
         "create": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
         "update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
         "partial_update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
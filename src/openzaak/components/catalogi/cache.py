@@ -0,0 +1,222 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+"""
+Cache of published zaaktypen and the types that belong to them.
+
+Published types don't change anymore, so the types referenced when creating zaken,
+statussen, rollen, resultaten and zaakeigenschappen are resolved from this cache
+instead of the database.
+"""
+import uuid
+from typing import Dict, Optional, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Prefetch
+from django.urls import get_script_prefix
+
+from django_loose_fk.utils import get_viewset_for_path
+
+from openzaak.utils.cache import (
+    LocalLRUCache,
+    get_cache_generation,
+    invalidate_cache_generation,
+)
+from openzaak.utils.constants import CATALOGI_CACHE_GENERATION
+from openzaak.utils.serializer_fields import CachedResolver
+
+from .models import Eigenschap, ResultaatType, RolType, StatusType, ZaakType
+
+# relation of the zaaktype for each type that is part of its graph
+RELATIONS = {
+    StatusType: "statustypen",
+    RolType: "roltype_set",
+    ResultaatType: "resultaattypen",
+    Eigenschap: "eigenschap_set",
+}
+
+CachedType = Union[ZaakType, StatusType, RolType, ResultaatType, Eigenschap]
+
+zaaktype_graph_cache = LocalLRUCache(maxsize=100)
+# the UUID of the zaaktype each cached type belongs to
+zaaktype_index_cache = LocalLRUCache(maxsize=10000)
+
+# marks objects which are not part of a published zaaktype, so the lookup is not
+# repeated
+NOT_PUBLISHED = ""
+
+
+class ZaakTypeGraph:
+    """
+    A published zaaktype with its statustypen, roltypen, resultaattypen and
+    eigenschappen.
+
+    The related types are prefetched and refer back to the same zaaktype instance, so
+    navigating between them doesn't issue queries. The instances are shared between
+    requests and must not be modified.
+    """
+
+    def __init__(self, zaaktype: ZaakType):
+        self.zaaktype = zaaktype
+        self.types: Dict[str, CachedType] = {
+            self.get_key(ZaakType, zaaktype.uuid): zaaktype
+        }
+        for model, relation in RELATIONS.items():
+            for obj in getattr(zaaktype, relation).all():
+                self.types[self.get_key(model, obj.uuid)] = obj
+
+    @staticmethod
+    def get_key(model: models.Model, _uuid: Union[str, uuid.UUID]) -> str:
+        return f"{model._meta.label_lower}:{_uuid}"
+
+    def get(self, model: models.Model, _uuid: str) -> Optional[CachedType]:
+        return self.types.get(self.get_key(model, _uuid))
+
+
+def _invalidate() -> None:
+    invalidate_cache_generation(CATALOGI_CACHE_GENERATION)
+
+
+def invalidate_catalogi_cache() -> None:
+    """
+    Invalidate all cached zaaktypen, in every process.
+
+    Like the authorizations cache, this happens right away and again after the
+    commit.
+    """
+    _invalidate()
+    transaction.on_commit(_invalidate)
+
+
+def _build_graph(zaaktype_uuid: str) -> Union[ZaakTypeGraph, str]:
+    zaaktype = (
+        ZaakType.objects.filter(uuid=zaaktype_uuid, concept=False)
+        .select_related("catalogus")
+        .prefetch_related(
+            "statustypen",
+            "roltype_set",
+            "resultaattypen",
+            Prefetch(
+                "eigenschap_set",
+                queryset=Eigenschap.objects.select_related(
+                    "specificatie_van_eigenschap"
+                ),
+            ),
+        )
+        .first()
+    )
+    return ZaakTypeGraph(zaaktype) if zaaktype is not None else NOT_PUBLISHED
+
+
+def get_zaaktype_graph(zaaktype_uuid: str) -> Optional[ZaakTypeGraph]:
+    """
+    Return the graph of a published zaaktype, or ``None`` if the zaaktype doesn't
+    exist or is a concept.
+
+    The graph is cached in the process itself and in the default cache, keyed on the
+    catalogi cache generation which is bumped on every change in the catalogi.
+    """
+    timeout = settings.CATALOGI_CACHE_TIMEOUT
+    if not timeout:
+        return None
+
+    generation = get_cache_generation(CATALOGI_CACHE_GENERATION)
+    key = f"zaaktype-graph:{generation}:{zaaktype_uuid}"
+
+    graph = zaaktype_graph_cache.get(key)
+    if graph is None:
+        graph = cache.get(key)
+        if graph is None:
+            graph = _build_graph(zaaktype_uuid)
+            cache.set(key, graph, timeout=timeout)
+        zaaktype_graph_cache.set(key, graph)
+
+        # index the related types, so they can be looked up without the zaaktype
+        if isinstance(graph, ZaakTypeGraph):
+            for type_key in graph.types:
+                zaaktype_index_cache.set(
+                    f"zaaktype-of:{generation}:{type_key}", zaaktype_uuid
+                )
+
+    return graph if isinstance(graph, ZaakTypeGraph) else None
+
+
+def _get_zaaktype_uuid(model: models.Model, _uuid: str, timeout: int) -> str:
+    generation = get_cache_generation(CATALOGI_CACHE_GENERATION)
+    key = f"zaaktype-of:{generation}:{ZaakTypeGraph.get_key(model, _uuid)}"
+
+    zaaktype_uuid = zaaktype_index_cache.get(key)
+    if zaaktype_uuid is None:
+        zaaktype_uuid = cache.get(key)
+        if zaaktype_uuid is None:
+            zaaktype_uuid = (
+                model.objects.filter(uuid=_uuid, zaaktype__concept=False)
+                .values_list("zaaktype__uuid", flat=True)
+                .first()
+            )
+            zaaktype_uuid = str(zaaktype_uuid) if zaaktype_uuid else NOT_PUBLISHED
+            cache.set(key, zaaktype_uuid, timeout=timeout)
+        zaaktype_index_cache.set(key, zaaktype_uuid)
+    return zaaktype_uuid
+
+
+def get_published_type(model: models.Model, _uuid: str) -> Optional[CachedType]:
+    """
+    Return the published (zaak)type with the given UUID from the cache, or ``None``
+    if it's not part of a published zaaktype.
+    """
+    timeout = settings.CATALOGI_CACHE_TIMEOUT
+    if not timeout or (model is not ZaakType and model not in RELATIONS):
+        return None
+
+    try:
+        _uuid = str(uuid.UUID(str(_uuid)))
+    except ValueError:
+        return None
+
+    zaaktype_uuid = (
+        _uuid if model is ZaakType else _get_zaaktype_uuid(model, _uuid, timeout)
+    )
+    if zaaktype_uuid == NOT_PUBLISHED:
+        return None
+
+    graph = get_zaaktype_graph(zaaktype_uuid)
+    return graph.get(model, _uuid) if graph is not None else None
+
+
+def get_published_type_for_path(path: str) -> Optional[CachedType]:
+    """
+    Return the published type the API path points to from the cache, or ``None`` if
+    the path doesn't point to a published type.
+    """
+    if not settings.CATALOGI_CACHE_TIMEOUT:
+        return None
+
+    if settings.FORCE_SCRIPT_NAME and path.startswith(settings.FORCE_SCRIPT_NAME):
+        path = path[len(settings.FORCE_SCRIPT_NAME) :]
+    path = path.replace(get_script_prefix(), "/", 1)
+
+    try:
+        viewset = get_viewset_for_path(path)
+    except (models.ObjectDoesNotExist, AssertionError):
+        return None
+
+    queryset = getattr(viewset, "queryset", None)
+    lookup_url_kwarg = getattr(viewset, "lookup_url_kwarg", None) or getattr(
+        viewset, "lookup_field", None
+    )
+    _uuid = viewset.kwargs.get(lookup_url_kwarg) if lookup_url_kwarg else None
+    if queryset is None or not _uuid:
+        return None
+    return get_published_type(queryset.model, _uuid)
+
+
+class PublishedTypeResolver(CachedResolver):
+    """
+    Resolve local URLs of published types from the cache, falling back to the
+    database for everything else.
+    """
+
+    def get_cached(self, path: str) -> Optional[CachedType]:
+        return get_published_type_for_path(path)
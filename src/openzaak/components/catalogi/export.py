@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+"""
+Export catalogi resources to a .zip archive.
+
+The objects are read from the database and serialized in chunks, and written to
+the archive entries as they are serialized, so exports of large catalogi run in
+bounded memory.
+"""
+import json
+import zipfile
+from itertools import chain, islice
+from typing import IO, Iterator, List
+
+from django.apps import apps
+
+from rest_framework.request import Request
+from rest_framework.versioning import URLPathVersioning
+
+from openzaak.utils import build_fake_request
+
+from .api import serializers
+
+CHUNK_SIZE = 500
+
+
+def get_export_request() -> Request:
+    request = Request(build_fake_request())
+    setattr(request, "versioning_scheme", URLPathVersioning())
+    setattr(request, "version", "1")
+    return request
+
+
+def iter_serialized(resource: str, ids: List[int], request: Request) -> Iterator[list]:
+    """
+    Yield the serialized objects of the resource in chunks of ``CHUNK_SIZE``.
+    """
+    model = apps.get_model("catalogi", resource)
+    serializer = getattr(serializers, f"{resource}Serializer")
+    objects = model.objects.filter(id__in=ids).iterator(chunk_size=CHUNK_SIZE)
+
+    while True:
+        chunk = list(islice(objects, CHUNK_SIZE))
+        if not chunk:
+            return
+
+        data = serializer(instance=chunk, many=True, context={"request": request}).data
+
+        # Because BesluitType is imported before ZaakType, related
+        # ZaakTypen do not exist yet at the time of importing, so the
+        # relations will be left empty when importing BesluitTypen and
+        # they will be set when importing ZaakTypen
+        if resource == "BesluitType":
+            for entry in data:
+                entry["zaaktypen"] = []
+
+        yield data
+
+
+def iter_export(
+    zip_file: zipfile.ZipFile, resources: List[str], ids: List[List[int]]
+) -> Iterator[None]:
+    """
+    Write a ``<resource>.json`` entry to the archive for each resource with objects.
+
+    Yields after every chunk written to the archive.
+    """
+    request = get_export_request()
+
+    for resource, resource_ids in zip(resources, ids):
+        chunks = iter_serialized(resource, resource_ids, request)
+        first = next(chunks, None)
+        if first is None:
+            continue
+
+        # the same output as ``json.dumps`` of the whole list
+        with zip_file.open(f"{resource}.json", "w") as entry:
+            separator = b"["
+            for chunk in chain([first], chunks):
+                for obj in chunk:
+                    entry.write(separator + json.dumps(obj).encode())
+                    separator = b", "
+                yield
+            entry.write(b"]")
+        yield
+
+
+def export_to_file(
+    fileobj: IO[bytes], resources: List[str], ids: List[List[int]], mode: str = "w"
+) -> None:
+    """
+    Write the archive to a file (object), opened with ``mode``.
+    """
+    with zipfile.ZipFile(fileobj, mode) as zip_file:
+        for _ in iter_export(zip_file, resources, ids):
+            pass
+
+
+class _StreamBuffer:
+    """
+    Write-only file object, collecting the written bytes until they're taken.
+
+    It doesn't support ``tell`` or ``seek``, so ``zipfile`` writes the archive
+    sequentially.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_export(resources: List[str], ids: List[List[int]]) -> Iterator[bytes]:
+    """
+    Yield the bytes of the archive as it's being written, for a streaming response.
+    """
+    buffer = _StreamBuffer()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for _ in iter_export(zip_file, resources, ids):
+            data = buffer.take()
+            if data:
+                yield data
+    yield buffer.take()
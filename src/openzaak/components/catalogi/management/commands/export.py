@@ -1,20 +1,10 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
-import io
-import json
-import zipfile
-
-from django.apps import apps
 from django.core.management.base import BaseCommand, CommandError
 from django.http import HttpResponse
 from django.utils.translation import ugettext_lazy as _
 
-from rest_framework.request import Request
-from rest_framework.versioning import URLPathVersioning
-
-from openzaak.utils import build_fake_request
-
-from ...api import serializers
+from ...export import export_to_file
 
 
 class Command(BaseCommand):
@@ -60,40 +50,7 @@ class Command(BaseCommand):
                 _("The number of resources supplied does not match the number of IDs")
             )
 
-        request = Request(build_fake_request())
-        setattr(request, "versioning_scheme", URLPathVersioning())
-        setattr(request, "version", "1")
-
-        results = []
-
-        for resource, ids in zip(all_resources, all_ids):
-            model = apps.get_model("catalogi", resource)
-            serializer = getattr(serializers, f"{resource}Serializer")
-            objects = model.objects.filter(id__in=ids)
-
-            serialized = serializer(
-                instance=objects, many=True, context={"request": request}
-            )
-            data = serialized.data
-
-            # Because BesluitType is imported before ZaakType, related
-            # ZaakTypen do not exist yet at the time of importing, so the
-            # relations will be left empty when importing BesluitTypen and
-            # they will be set when importing ZaakTypen
-            if resource == "BesluitType":
-                for entry in data:
-                    entry["zaaktypen"] = []
-
-            if data:
-                results.append((resource, data))
-
         if response:
-            f = io.BytesIO()
-            for resource, data in results:
-                with zipfile.ZipFile(f, "a") as zip_file:
-                    zip_file.writestr(f"{resource}.json", json.dumps(data))
-            response.content = f.getvalue()
+            export_to_file(response, all_resources, all_ids)
         else:
-            for resource, data in results:
-                with zipfile.ZipFile(archive_name, "a") as zip_file:
-                    zip_file.writestr(f"{resource}.json", json.dumps(data))
+            export_to_file(archive_name, all_resources, all_ids, mode="a")
@@ -2,18 +2,35 @@
 # Copyright (C) 2019 - 2020 Dimpact
 import io
 import json
+import time
+import uuid
 import zipfile
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models.signals import post_save
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework.test import APIRequestFactory
 from rest_framework.versioning import URLPathVersioning
+from vng_api_common.caching.signals import mark_related_instances_for_etag_update
 
 from openzaak.components.catalogi.api import serializers
+from openzaak.components.catalogi.cache import invalidate_catalogi_cache
 from openzaak.components.catalogi.constants import IMPORT_ORDER
-from openzaak.utils.cache import DjangoRequestsCache, requests_cache_enabled
+from openzaak.components.catalogi.utils import remap_uuids
+from openzaak.utils.cache import (
+    DjangoRequestsCache,
+    defer_etag_updates,
+    requests_cache_enabled,
+)
+
+# resources without side effects on save, which are created with a single query
+BULK_CREATE_RESOURCES = ["StatusType", "ZaakTypeInformatieObjectType", "RolType"]
+
+
+def get_uuid(entry: dict) -> str:
+    return entry["url"].split("/")[-1]
 
 
 class Command(BaseCommand):
@@ -44,6 +61,7 @@ class Command(BaseCommand):
         import_file = options.pop("import_file")
         import_file_content = options.pop("import_file_content")
         generate_new_uuids = options.pop("generate_new_uuids")
+        self.verbosity = options["verbosity"]
 
         if import_file and import_file_content:
             raise CommandError(
@@ -55,43 +73,107 @@ class Command(BaseCommand):
         if import_file_content:
             import_file = io.BytesIO(import_file_content)
 
-        uuid_mapping = {}
-
         factory = APIRequestFactory()
         request = factory.get("/")
         setattr(request, "versioning_scheme", URLPathVersioning())
         setattr(request, "version", "1")
+        self.context = {"request": request}
 
         with zipfile.ZipFile(import_file, "r") as zip_file:
-            for resource in IMPORT_ORDER:
-                if f"{resource}.json" in zip_file.namelist():
-                    data = zip_file.read(f"{resource}.json").decode()
-
-                    if generate_new_uuids:
-                        for old, new in uuid_mapping.items():
-                            data = data.replace(old, new)
-
-                    data = json.loads(data)
-
-                    serializer = getattr(serializers, f"{resource}Serializer")
-
-                    for entry in data:
-                        deserialized = serializer(
-                            data=entry, context={"request": request}
-                        )
-
-                        if deserialized.is_valid():
-                            original_uuid = entry["url"].split("/")[-1]
-                            if generate_new_uuids:
-                                deserialized.save()
-                                uuid_mapping[entry["url"].split("/")[-1]] = str(
-                                    deserialized.instance.uuid
-                                )
-                            else:
-                                deserialized.save(uuid=original_uuid)
-                        else:
-                            raise CommandError(
-                                _(
-                                    "A validation error occurred while deserializing a {}\n{}"
-                                ).format(resource, deserialized.errors)
-                            )
+            raw_data = {
+                resource: zip_file.read(f"{resource}.json").decode()
+                for resource in IMPORT_ORDER
+                if f"{resource}.json" in zip_file.namelist()
+            }
+
+        data = {resource: json.loads(content) for resource, content in raw_data.items()}
+
+        # ⚡️ generate the new UUIDs up front, so all references can be replaced in a
+        # single pass over the data
+        if generate_new_uuids:
+            uuid_mapping = {
+                get_uuid(entry): str(uuid.uuid4())
+                for entries in data.values()
+                for entry in entries
+            }
+            data = {
+                resource: json.loads(remap_uuids(raw_data[resource], uuid_mapping))
+                for resource in data
+            }
+
+        start = time.perf_counter()
+        # ⚡️ clear the ETags of the affected objects once at the end, rather than
+        # scheduling an update for every saved object
+        with defer_etag_updates():
+            for resource, entries in data.items():
+                resource_start = time.perf_counter()
+                if resource in BULK_CREATE_RESOURCES:
+                    self.bulk_import(resource, entries)
+                else:
+                    self.import_entries(resource, entries)
+                self.report(resource, len(entries), resource_start)
+
+        # the bulk created objects don't send signals
+        invalidate_catalogi_cache()
+
+        self.report(_("Total"), sum(len(entries) for entries in data.values()), start)
+
+    def report(self, resource: str, count: int, start: float) -> None:
+        if self.verbosity < 1:
+            return
+
+        duration = time.perf_counter() - start
+        self.stdout.write(
+            _("{resource}: imported {count} objects in {duration:.2f}s").format(
+                resource=resource, count=count, duration=duration
+            )
+        )
+
+    def get_error(self, resource: str, errors) -> CommandError:
+        return CommandError(
+            _("A validation error occurred while deserializing a {}\n{}").format(
+                resource, errors
+            )
+        )
+
+    def import_entries(self, resource: str, entries: list) -> None:
+        """
+        Validate and save the entries one by one, since they may refer to each other
+        (like zaaktypen) or have side effects when saved.
+        """
+        serializer = getattr(serializers, f"{resource}Serializer")
+
+        for entry in entries:
+            deserialized = serializer(data=entry, context=self.context)
+            if not deserialized.is_valid():
+                raise self.get_error(resource, deserialized.errors)
+            deserialized.save(uuid=get_uuid(entry))
+
+    def bulk_import(self, resource: str, entries: list) -> None:
+        """
+        Validate all entries first and create them with a single query.
+        """
+        serializer = getattr(serializers, f"{resource}Serializer")
+        model = serializer.Meta.model
+
+        instances = []
+        for entry in entries:
+            deserialized = serializer(data=entry, context=self.context)
+            if not deserialized.is_valid():
+                raise self.get_error(resource, deserialized.errors)
+            instances.append(model(**deserialized.validated_data, uuid=get_uuid(entry)))
+
+        try:
+            # entries are only validated against existing objects, duplicates within
+            # the import are caught by the database
+            with transaction.atomic():
+                model.objects.bulk_create(instances)
+        except IntegrityError as exc:
+            raise self.get_error(resource, exc) from exc
+
+        # bulk_create doesn't send signals, mark the objects that include these
+        # objects as affected
+        for instance in instances:
+            mark_related_instances_for_etag_update(
+                sender=model, instance=instance, signal=post_save, created=True
+            )
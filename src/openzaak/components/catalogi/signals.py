@@ -4,14 +4,25 @@ import logging
 from typing import Union
 
 from django.db.models.base import ModelBase
-from django.db.models.signals import ModelSignal, post_delete
+from django.db.models.signals import ModelSignal, post_delete, post_save
 from django.dispatch import receiver
 
 from vng_api_common.authorizations.models import Applicatie, Autorisatie
 
 from openzaak.utils import build_absolute_url
 
-from .models import BesluitType, InformatieObjectType, ZaakType
+from .cache import invalidate_catalogi_cache
+from .models import (
+    BesluitType,
+    Catalogus,
+    Eigenschap,
+    EigenschapSpecificatie,
+    InformatieObjectType,
+    ResultaatType,
+    RolType,
+    StatusType,
+    ZaakType,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -73,3 +84,43 @@ def sync_autorisaties(
     )
     logger.info("Deleting applications: %s", apps_to_delete)
     apps_to_delete.delete()
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Catalogus,
+    dispatch_uid="catalogi.invalidate_cache_catalogus",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakType,
+    dispatch_uid="catalogi.invalidate_cache_zaaktype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=StatusType,
+    dispatch_uid="catalogi.invalidate_cache_statustype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=RolType,
+    dispatch_uid="catalogi.invalidate_cache_roltype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ResultaatType,
+    dispatch_uid="catalogi.invalidate_cache_resultaattype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Eigenschap,
+    dispatch_uid="catalogi.invalidate_cache_eigenschap",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=EigenschapSpecificatie,
+    dispatch_uid="catalogi.invalidate_cache_eigenschapspecificatie",
+)
+def invalidate_cache(sender: ModelBase, **kwargs) -> None:
+    logger.debug("Invalidating the catalogi cache after change in %r", sender)
+    invalidate_catalogi_cache()
@@ -2,6 +2,7 @@
 # Copyright (C) 2019 - 2020 Dimpact
 import json
 import zipfile
+from io import BytesIO, StringIO
 from pathlib import Path
 from unittest.mock import patch
 
@@ -18,6 +19,7 @@ from zgw_consumers.models import Service
 from openzaak.selectielijst.tests import mock_resource_get, mock_selectielijst_oas_get
 from openzaak.tests.utils import patch_resource_validator
 
+from ...export import stream_export
 from ...models import (
     BesluitType,
     Catalogus,
@@ -207,6 +209,52 @@ class ExportCatalogiTests(ImportExportMixin, TestCase):
 
         self.assertTrue(data["url"].startswith("https://openzaak.example.com:8443/"))
 
+    @patch("openzaak.components.catalogi.export.CHUNK_SIZE", 2)
+    def test_export_in_chunks(self):
+        catalogus = CatalogusFactory.create()
+        informatieobjecttypen = InformatieObjectTypeFactory.create_batch(
+            5, catalogus=catalogus
+        )
+
+        call_command(
+            "export",
+            archive_name=self.filepath,
+            resource=["Catalogus", "InformatieObjectType", "ZaakType"],
+            ids=[[catalogus.id], [iotype.id for iotype in informatieobjecttypen], []],
+        )
+
+        with zipfile.ZipFile(self.filepath, "r") as f:
+            self.assertEqual(
+                f.namelist(), ["Catalogus.json", "InformatieObjectType.json"]
+            )
+            data = json.loads(f.read("InformatieObjectType.json"))
+
+        self.assertEqual(
+            {entry["omschrijving"] for entry in data},
+            {iotype.omschrijving for iotype in informatieobjecttypen},
+        )
+
+    @patch("openzaak.components.catalogi.export.CHUNK_SIZE", 2)
+    def test_stream_export(self):
+        catalogus = CatalogusFactory.create()
+        informatieobjecttypen = InformatieObjectTypeFactory.create_batch(
+            3, catalogus=catalogus
+        )
+
+        chunks = list(
+            stream_export(
+                ["Catalogus", "InformatieObjectType"],
+                [[catalogus.id], [iotype.id for iotype in informatieobjecttypen]],
+            )
+        )
+
+        self.assertGreater(len(chunks), 1)
+        with zipfile.ZipFile(BytesIO(b"".join(chunks)), "r") as f:
+            self.assertEqual(
+                f.namelist(), ["Catalogus.json", "InformatieObjectType.json"]
+            )
+            self.assertEqual(len(json.loads(f.read("InformatieObjectType.json"))), 3)
+
 
 @tag("catalogi-import")
 class ImportCatalogiTests(ImportExportMixin, TestCase):
@@ -412,6 +460,40 @@ class ImportCatalogiTests(ImportExportMixin, TestCase):
         self.assertEqual(zaaktype2.catalogus, imported_catalogus)
         self.assertEqual(zaaktype2.zaaktype_omschrijving, "test2")
 
+    def test_import_bulk_created_resources(self):
+        catalogus = CatalogusFactory.create(rsin="000000000")
+        zaaktype = ZaakTypeFactory.create(
+            catalogus=catalogus, vertrouwelijkheidaanduiding="openbaar"
+        )
+        statustypen = StatusTypeFactory.create_batch(3, zaaktype=zaaktype)
+        roltype = RolTypeFactory.create(zaaktype=zaaktype)
+
+        resources = ["Catalogus", "ZaakType", "StatusType", "RolType"]
+        ids = [
+            [catalogus.id],
+            [zaaktype.id],
+            [statustype.id for statustype in statustypen],
+            [roltype.id],
+        ]
+        call_command("export", archive_name=self.filepath, resource=resources, ids=ids)
+
+        catalogus.delete()
+        stdout = StringIO()
+        call_command(
+            "import", import_file=self.filepath, generate_new_uuids=True, stdout=stdout
+        )
+
+        zaaktype = ZaakType.objects.get()
+        self.assertEqual(
+            sorted(zaaktype.statustypen.values_list("statustypevolgnummer", flat=True)),
+            sorted(statustype.statustypevolgnummer for statustype in statustypen),
+        )
+        self.assertEqual(RolType.objects.get().zaaktype, zaaktype)
+
+        output = stdout.getvalue()
+        self.assertIn("StatusType: imported 3 objects", output)
+        self.assertIn("Total: imported 6 objects", output)
+
     @override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
     @requests_mock.Mocker()
     @patch_resource_validator
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.tests.utils import JWTAuthMixin, QueryBudget, QueryBudgetMixin
+
+from .factories import (
+    BesluitTypeFactory,
+    CatalogusFactory,
+    EigenschapFactory,
+    InformatieObjectTypeFactory,
+    ResultaatTypeFactory,
+    RolTypeFactory,
+    StatusTypeFactory,
+    ZaakTypeFactory,
+    ZaakTypeInformatieObjectTypeFactory,
+    ZaakTypenRelatieFactory,
+)
+
+
+def catalogus_detail(n: int) -> str:
+    catalogus = CatalogusFactory.create()
+    ZaakTypeFactory.create_batch(n, catalogus=catalogus)
+    InformatieObjectTypeFactory.create_batch(n, catalogus=catalogus)
+    BesluitTypeFactory.create_batch(n, catalogus=catalogus)
+    return reverse(catalogus)
+
+
+def zaaktype_list(n: int) -> str:
+    for zaaktype in ZaakTypeFactory.create_batch(n):
+        StatusTypeFactory.create(zaaktype=zaaktype)
+        RolTypeFactory.create(zaaktype=zaaktype)
+    return reverse("zaaktype-list")
+
+
+def zaaktype_detail(n: int) -> str:
+    zaaktype = ZaakTypeFactory.create()
+    StatusTypeFactory.create_batch(n, zaaktype=zaaktype)
+    ResultaatTypeFactory.create_batch(n, zaaktype=zaaktype)
+    EigenschapFactory.create_batch(n, zaaktype=zaaktype)
+    RolTypeFactory.create_batch(n, zaaktype=zaaktype)
+    ZaakTypeInformatieObjectTypeFactory.create_batch(n, zaaktype=zaaktype)
+    BesluitTypeFactory.create_batch(
+        n, catalogus=zaaktype.catalogus, zaaktypen=[zaaktype]
+    )
+    ZaakTypenRelatieFactory.create_batch(n, zaaktype=zaaktype)
+    return reverse(zaaktype)
+
+
+def statustype_list(n: int) -> str:
+    StatusTypeFactory.create_batch(n)
+    return reverse("statustype-list")
+
+
+def informatieobjecttype_list(n: int) -> str:
+    InformatieObjectTypeFactory.create_batch(n)
+    return reverse("informatieobjecttype-list")
+
+
+def besluittype_list(n: int) -> str:
+    BesluitTypeFactory.create_batch(n)
+    return reverse("besluittype-list")
+
+
+class CatalogiQueryBudgetTests(JWTAuthMixin, QueryBudgetMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    query_budgets = [
+        QueryBudget("catalogus-detail", catalogus_detail),
+        QueryBudget("zaaktype-list", zaaktype_list),
+        QueryBudget("zaaktype-detail", zaaktype_detail),
+        QueryBudget("statustype-list", statustype_list),
+        QueryBudget("informatieobjecttype-list", informatieobjecttype_list),
+        QueryBudget("besluittype-list", besluittype_list),
+    ]
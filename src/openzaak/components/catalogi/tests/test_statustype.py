@@ -353,3 +353,48 @@ class StatusTypePaginationTestCase(APITestCase):
         self.assertEqual(response_data["count"], 2)
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
+
+
+class StatusTypeBulkReadTests(APITestCase):
+    def test_bulk_read(self):
+        statustype1, statustype2, statustype3 = StatusTypeFactory.create_batch(
+            3, zaaktype__concept=False
+        )
+
+        response = self.client.post(
+            reverse("statustype--bulk-read"),
+            {
+                "urls": [
+                    f"http://testserver{reverse(statustype1)}",
+                    str(statustype2.uuid),
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {statustype["url"] for statustype in response.json()},
+            {
+                f"http://testserver{reverse(statustype1)}",
+                f"http://testserver{reverse(statustype2)}",
+            },
+        )
+
+    def test_bulk_read_url_of_other_resource(self):
+        roltype = RolTypeFactory.create()
+
+        response = self.client.post(
+            reverse("statustype--bulk-read"),
+            {"urls": [f"http://testserver{reverse(roltype)}"]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "urls")
+        self.assertEqual(error["code"], "invalid-resource")
+
+    def test_bulk_read_without_urls(self):
+        response = self.client.post(reverse("statustype--bulk-read"), {"urls": []})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "urls")
+        self.assertEqual(error["code"], "empty")
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.zaken.models import Status
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..cache import (
+    PublishedTypeResolver,
+    get_published_type,
+    get_published_type_for_path,
+    zaaktype_graph_cache,
+    zaaktype_index_cache,
+)
+from ..models import StatusType, ZaakType
+from .factories import StatusTypeFactory, ZaakTypeFactory
+
+
+class ClearCacheMixin:
+    def setUp(self):
+        super().setUp()
+
+        for cleanup in (zaaktype_graph_cache.clear, zaaktype_index_cache.clear):
+            cleanup()
+            self.addCleanup(cleanup)
+
+
+@override_settings(CATALOGI_CACHE_TIMEOUT=60)
+class PublishedTypeCacheTests(ClearCacheMixin, TestCase):
+    def test_published_types_are_cached(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        statustype1 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=1
+        )
+        statustype2 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=2
+        )
+        get_published_type(StatusType, str(statustype1.uuid))
+
+        with self.assertNumQueries(0):
+            cached1 = get_published_type(StatusType, str(statustype1.uuid))
+            cached2 = get_published_type(StatusType, str(statustype2.uuid))
+            cached_zaaktype = get_published_type(ZaakType, str(zaaktype.uuid))
+
+            self.assertEqual(cached1, statustype1)
+            self.assertEqual(cached2, statustype2)
+            self.assertEqual(cached_zaaktype, zaaktype)
+            self.assertIs(cached1.zaaktype, cached_zaaktype)
+            self.assertFalse(cached1.is_eindstatus())
+            self.assertTrue(cached2.is_eindstatus())
+
+    def test_concept_types_are_not_cached(self):
+        statustype = StatusTypeFactory.create(zaaktype__concept=True)
+
+        self.assertIsNone(get_published_type(StatusType, str(statustype.uuid)))
+        self.assertIsNone(get_published_type(ZaakType, str(statustype.zaaktype.uuid)))
+
+    def test_changes_are_picked_up(self):
+        statustype = StatusTypeFactory.create(
+            zaaktype__concept=False, statustype_omschrijving="old"
+        )
+        get_published_type(StatusType, str(statustype.uuid))
+
+        statustype.statustype_omschrijving = "new"
+        statustype.save()
+
+        cached = get_published_type(StatusType, str(statustype.uuid))
+        self.assertEqual(cached.statustype_omschrijving, "new")
+
+    def test_resolve_path(self):
+        statustype = StatusTypeFactory.create(zaaktype__concept=False)
+
+        self.assertEqual(get_published_type_for_path(reverse(statustype)), statustype)
+        self.assertIsNone(get_published_type_for_path(reverse("statustype-list")))
+        self.assertIsNone(get_published_type_for_path("/some/other/path"))
+
+    def test_resolver(self):
+        statustype = StatusTypeFactory.create(zaaktype__concept=False)
+        url = f"http://testserver{reverse(statustype)}"
+        resolver = PublishedTypeResolver(Status, Status._meta.get_field("statustype"))
+        get_published_type(StatusType, str(statustype.uuid))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resolver.resolve_cached("testserver", url), statustype)
+            self.assertEqual(resolver.resolve("testserver", url), statustype)
+            self.assertIsNone(resolver.resolve_cached("example.com", url))
+
+    @override_settings(CATALOGI_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        statustype = StatusTypeFactory.create(zaaktype__concept=False)
+
+        self.assertIsNone(get_published_type(StatusType, str(statustype.uuid)))
+
+
+@override_settings(CATALOGI_CACHE_TIMEOUT=60)
+class StatusCreateCacheTests(ClearCacheMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_statustype_is_resolved_from_cache(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        statustype = StatusTypeFactory.create(zaaktype=zaaktype, statustypevolgnummer=1)
+        StatusTypeFactory.create(zaaktype=zaaktype, statustypevolgnummer=2)
+        zaak = ZaakFactory.create(zaaktype=zaaktype)
+
+        def create_status(datum: str):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(
+                    reverse("status-list"),
+                    {
+                        "zaak": f"http://testserver{reverse(zaak)}",
+                        "statustype": f"http://testserver{reverse(statustype)}",
+                        "datumStatusGezet": datum,
+                    },
+                )
+
+            self.assertEqual(
+                response.status_code, status.HTTP_201_CREATED, response.data
+            )
+            return [
+                query["sql"]
+                for query in context.captured_queries
+                if '"catalogi_statustype"' in query["sql"]
+            ]
+
+        self.assertNotEqual(create_status("2023-01-01T10:00:00Z"), [])
+        self.assertEqual(create_status("2023-01-02T10:00:00Z"), [])
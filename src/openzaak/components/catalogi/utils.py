@@ -1,8 +1,9 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 import operator
+import re
 from datetime import date
-from typing import Optional
+from typing import Dict, Optional
 
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -13,6 +14,10 @@ from dateutil.relativedelta import relativedelta
 
 from .models import Catalogus
 
+UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+
 
 def has_overlapping_objects(
     model_manager: models.Manager,
@@ -122,3 +127,17 @@ def compare_relativedeltas(
 
     # minutes is the lowest we go, it's already an absurd case
     return rd1.minutes > rd2.minutes
+
+
+def remap_uuids(data: str, uuid_mapping: Dict[str, str]) -> str:
+    """
+    Replace the UUIDs in ``data`` that occur in ``uuid_mapping``.
+
+    All UUIDs are replaced in a single pass over the data, regardless of the size of
+    the mapping.
+    """
+    if not uuid_mapping:
+        return data
+    return UUID_PATTERN.sub(
+        lambda match: uuid_mapping.get(match.group(0), match.group(0)), data
+    )
@@ -13,6 +13,7 @@ from typing import Optional
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile, File
+from django.core.files.storage import FileSystemStorage
 from django.db import transaction
 from django.utils.http import urlencode
 from django.utils.translation import ugettext_lazy as _
@@ -58,7 +59,14 @@ from ..query.django import InformatieobjectRelatedQuerySet
 from ..utils import PrivateMediaStorageWithCMIS
 from .fields import OnlyRemoteOrFKOrURLField
 from .scopes import SCOPE_DOCUMENTEN_GEFORCEERD_BIJWERKEN
-from .utils import create_filename, merge_files
+from .utils import (
+    create_filename,
+    decode_base64_file,
+    merge_files_in_storage,
+    move_file_in_storage,
+    preallocate_file,
+    write_file_at,
+)
 from .validators import (
     InformatieObjectUniqueValidator,
     StatusValidator,
@@ -82,8 +90,24 @@ class AnyBase64File(Base64FileField):
         return "bin"
 
     def to_internal_value(self, base64_data):
+        if base64_data in self.EMPTY_VALUES:
+            return None
+
         try:
-            return super().to_internal_value(base64_data)
+            if not isinstance(base64_data, str):
+                return super().to_internal_value(base64_data)
+
+            data, content_type = base64_data, None
+            if ";base64," in data:
+                header, data = data.split(";base64,")
+                if self.trust_provided_content_type:
+                    content_type = header.replace("data:", "")
+
+            # ⚡️ decode large files to disk in chunks, rather than to memory in one go
+            name = f"{self.get_file_name(None)}.{self.get_file_extension(None, None)}"
+            decoded_file = decode_base64_file(data, name, content_type)
+            # skip the base64 decoding of ``Base64FileField``
+            return serializers.FileField.to_internal_value(self, decoded_file)
         except Exception:
             try:
                 # If validate is False, no check is done to see if the data contains non base-64 alphabet characters
@@ -254,6 +278,19 @@ class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
 
         return valid_attrs
 
+    def update(self, instance, validated_data):
+        inhoud = validated_data.get("inhoud")
+        upload_path = BestandsDeel.get_upload_path(instance.informatieobject_id)
+        if not inhoud or upload_path is None:
+            return super().update(instance, validated_data)
+
+        # ⚡️ write the part straight to its position in the preallocated file, so
+        # the parts can be uploaded concurrently and the unlock doesn't merge them
+        write_file_at(inhoud, upload_path, instance.get_offset())
+        instance._voltooid = True
+        instance.save(update_fields=["_voltooid"])
+        return instance
+
 
 class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
     """
@@ -455,11 +492,25 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             if canonical
             else {"informatieobject_uuid": eio_uuid}
         )
+        if canonical:
+            # ⚡️ the parts are written into a preallocated file, which is moved into
+            # place when the document is unlocked
+            storage = BestandsDeel._meta.get_field("inhoud").storage
+            preallocate_file(
+                Path(storage.path(BestandsDeel.get_upload_name(canonical.pk))),
+                full_size,
+            )
+
         parts = math.ceil(full_size / settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE)
+        bestandsdelen = []
         for i in range(parts):
             chunk_size = min(settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE, full_size)
-            BestandsDeel.objects.create(omvang=chunk_size, volgnummer=i + 1, **kwargs)
+            bestandsdelen.append(
+                BestandsDeel(omvang=chunk_size, volgnummer=i + 1, **kwargs)
+            )
             full_size -= chunk_size
+        # the parts are empty, so there is nothing to do on save
+        BestandsDeel.objects.bulk_create(bestandsdelen)
 
     @transaction.atomic
     def create(self, validated_data):
@@ -782,8 +833,9 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
         else:
             all_parts = self.instance.canonical.bestandsdelen.all()
 
-        complete_upload = all_parts.complete_upload
-        empty_bestandsdelen = all_parts.empty_bestandsdelen
+        uploaded, total = all_parts.upload_status()
+        complete_upload = uploaded == total
+        empty_bestandsdelen = uploaded == 0
 
         if not complete_upload and not empty_bestandsdelen:
             raise serializers.ValidationError(
@@ -819,29 +871,55 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
         else:
             bestandsdelen = self.instance.canonical.bestandsdelen.order_by("volgnummer")
 
-        complete_upload = bestandsdelen.complete_upload
-        empty_bestandsdelen = bestandsdelen.empty_bestandsdelen
+        uploaded, total = bestandsdelen.upload_status()
+        complete_upload = uploaded == total
+        empty_bestandsdelen = uploaded == 0
 
         if empty_bestandsdelen:
             return self.instance
 
         if complete_upload:
-            part_files = [p.inhoud.file for p in bestandsdelen]
             # create the name of target file using the storage backend to the serializer
             name = create_filename(self.instance.bestandsnaam)
             file_field = self.instance._meta.get_field("inhoud")
             rel_path = file_field.generate_filename(self.instance, name)
-            file_name = Path(rel_path).name
-            # merge files
-            file_dir = Path(settings.PRIVATE_MEDIA_ROOT)
-            target_file = merge_files(part_files, file_dir, file_name)
-            # save full file to the instance FileField
-            with open(target_file, "rb") as file_obj:
-                self.instance.inhoud = File(file_obj, name=file_name)
-                self.instance.save()
+            upload_path = (
+                None
+                if settings.CMIS_ENABLED
+                else BestandsDeel.get_upload_path(self.instance.canonical.pk)
+            )
 
-            # Remove the merged file
-            target_file.unlink()
+            if upload_path is not None:
+                # ⚡️ the parts were written into the preallocated file, which is
+                # moved into place without copying
+                self.instance.inhoud = move_file_in_storage(
+                    upload_path, file_field.storage, rel_path
+                )
+                self.instance.save()
+            elif settings.CMIS_ENABLED:
+                part_files = [p.inhoud.file for p in bestandsdelen]
+                # merge files
+                storage = FileSystemStorage(location=settings.PRIVATE_MEDIA_ROOT)
+                file_name = merge_files_in_storage(
+                    part_files, storage, Path(rel_path).name
+                )
+                target_file = Path(storage.path(file_name))
+                # save full file to the instance FileField
+                with open(target_file, "rb") as file_obj:
+                    self.instance.inhoud = File(file_obj, name=file_name)
+                    self.instance.save()
+
+                # Remove the merged file
+                target_file.unlink()
+            else:
+                # parts uploaded before the preallocated files were introduced
+                part_files = [p.inhoud.file for p in bestandsdelen]
+                # ⚡️ merge the files in place at the final location in the storage,
+                # rather than copying the merged file into the storage afterwards
+                self.instance.inhoud = merge_files_in_storage(
+                    part_files, file_field.storage, rel_path
+                )
+                self.instance.save()
         else:
             self.instance.bestandsomvang = None
             self.instance.save()
@@ -1,27 +1,268 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+import binascii
+import errno
+import hashlib
+import io
+import os
 import re
 import shutil
 import uuid
 from pathlib import Path, PurePath
+from typing import Optional, Tuple
 from urllib.parse import urlparse
 
 from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import (
+    SimpleUploadedFile,
+    TemporaryUploadedFile,
+    UploadedFile,
+)
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
 
+from ..utils import CMISStorageFile
 
-def merge_files(part_files, file_dir, file_name) -> str:
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+NON_BASE64_PATTERN = re.compile(r"[^A-Za-z0-9+/]")
+
+
+# errors signalling the kernel doesn't support the operation for these files, try
+# the next method
+KERNEL_COPY_ERRORS = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP)
+
+
+def append_file(source, target) -> None:
+    """
+    Append the rest of the ``source`` file to the ``target`` file.
+
+    ⚡️ The data is copied inside the kernel with ``copy_file_range`` (which can
+    share the blocks on copy-on-write file systems) or ``sendfile``, without passing
+    it through Python. Falls back to a buffered copy for file objects without file
+    descriptor or when the kernel doesn't support the copy.
+    """
+    try:
+        source_fd, target_fd = source.fileno(), target.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        shutil.copyfileobj(source, target, settings.DOCUMENTEN_UPLOAD_READ_CHUNK)
+        return
+
+    target.flush()
+    offset = source.tell()
+    remaining = os.fstat(source_fd).st_size - offset
+    os.lseek(source_fd, offset, os.SEEK_SET)
+    os.lseek(target_fd, 0, os.SEEK_END)
+
+    methods = []
+    if hasattr(os, "copy_file_range"):
+        methods.append(lambda count: os.copy_file_range(source_fd, target_fd, count))
+    if hasattr(os, "sendfile"):
+        methods.append(lambda count: os.sendfile(target_fd, source_fd, None, count))
+
+    for copy in methods:
+        try:
+            while remaining > 0:
+                copied = copy(remaining)
+                if not copied:
+                    break
+                remaining -= copied
+        except OSError as exc:
+            if exc.errno not in KERNEL_COPY_ERRORS:
+                raise
+            continue
+        break
+
+    # sync the file objects with the positions of the file descriptors
+    source.seek(os.lseek(source_fd, 0, os.SEEK_CUR))
+    target.seek(0, os.SEEK_END)
+    if remaining > 0:
+        shutil.copyfileobj(source, target, settings.DOCUMENTEN_UPLOAD_READ_CHUNK)
+
+
+def merge_files(part_files, file_dir, file_name) -> Path:
+    """
+    Merge the part files into the new file ``file_name`` in ``file_dir``.
+
+    The file is created exclusively, :class:`FileExistsError` is raised if it
+    exists already. The partly written file is removed when the merge fails.
+    """
     file_dir_path = Path(file_dir)
-    file_dir_path.mkdir(exist_ok=True)
+    file_dir_path.mkdir(parents=True, exist_ok=True)
     file_path = file_dir_path / file_name
-    with open(file_path, "wb") as output:
-        for file in part_files:
-            with file.open("rb") as fileobj:
-                shutil.copyfileobj(
-                    fileobj, output, settings.DOCUMENTEN_UPLOAD_READ_CHUNK
-                )
+    output = open(file_path, "xb")
+    try:
+        with output:
+            for file in part_files:
+                with file.open("rb") as fileobj:
+                    append_file(fileobj, output)
+    except BaseException:
+        file_path.unlink()
+        raise
     return file_path
 
 
+def merge_files_in_storage(part_files, storage: FileSystemStorage, name: str) -> str:
+    """
+    Merge the part files into a new file ``name`` in the file system ``storage``.
+
+    Like :meth:`FileSystemStorage._save`, another available name is used when a
+    file with the same name is created in the meantime. Returns the name of the
+    merged file.
+    """
+    while True:
+        name = storage.get_available_name(name)
+        try:
+            file_path = merge_files(
+                part_files, Path(storage.path(name)).parent, Path(name).name
+            )
+        except FileExistsError:
+            continue
+        break
+
+    if storage.file_permissions_mode is not None:
+        file_path.chmod(storage.file_permissions_mode)
+    return name
+
+
+def preallocate_file(path: Path, size: int) -> None:
+    """
+    Create the file at ``path`` with a size of ``size`` bytes, replacing an
+    existing file.
+
+    ⚡️ Where the file system supports it, the blocks are allocated up front with
+    ``posix_fallocate``, so writing the parts doesn't run out of disk space halfway
+    and the file isn't fragmented.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as file:
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(file.fileno(), 0, size)
+                return
+            except OSError as exc:
+                if exc.errno not in KERNEL_COPY_ERRORS:
+                    raise
+        file.truncate(size)
+
+
+def write_file_at(source, path: Path, offset: int) -> None:
+    """
+    Write the ``source`` file at ``offset`` in the existing file at ``path``.
+
+    ⚡️ Like :func:`append_file`, the data is copied inside the kernel with
+    ``copy_file_range`` when possible. Writes to different ranges of the file don't
+    affect each other, so the parts of a file can be written concurrently.
+    """
+    source.seek(0)
+    position = 0
+    target_fd = os.open(path, os.O_WRONLY)
+    try:
+        try:
+            source_fd = source.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            source_fd = None
+
+        if source_fd is not None and hasattr(os, "copy_file_range"):
+            remaining = os.fstat(source_fd).st_size
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        source_fd, target_fd, remaining, position, offset + position
+                    )
+                    if not copied:
+                        break
+                    position += copied
+                    remaining -= copied
+            except OSError as exc:
+                if exc.errno not in KERNEL_COPY_ERRORS:
+                    raise
+
+        source.seek(position)
+        while True:
+            chunk = memoryview(source.read(settings.DOCUMENTEN_UPLOAD_READ_CHUNK))
+            if not chunk:
+                break
+            while chunk:
+                written = os.pwrite(target_fd, chunk, offset + position)
+                chunk = chunk[written:]
+                position += written
+    finally:
+        os.close(target_fd)
+
+
+def move_file_in_storage(path: Path, storage: FileSystemStorage, name: str) -> str:
+    """
+    Move the file at ``path`` to a new file ``name`` in the file system ``storage``.
+
+    ⚡️ The file is hard linked at the new name and then removed at the old one, so
+    no data is copied. Like :func:`merge_files_in_storage`, another available name is
+    used when a file with the same name is created in the meantime. Returns the name
+    of the moved file.
+    """
+    while True:
+        name = storage.get_available_name(name)
+        file_path = Path(storage.path(name))
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # unlike a rename, linking fails if the target exists
+            os.link(path, file_path)
+        except FileExistsError:
+            continue
+        break
+
+    path.unlink()
+    if storage.file_permissions_mode is not None:
+        file_path.chmod(storage.file_permissions_mode)
+    return name
+
+
+def decode_base64_file(
+    data: str, name: str, content_type: Optional[str] = None
+) -> UploadedFile:
+    """
+    Decode the base64 data to an uploaded file.
+
+    Like :func:`base64.b64decode`, characters outside of the base64 alphabet are
+    discarded. Raises :class:`binascii.Error` for incorrectly padded data.
+
+    ⚡️ Data that decodes to more than ``FILE_UPLOAD_MAX_MEMORY_SIZE`` is decoded in
+    chunks to a temporary file on disk, rather than in one go to memory. The file
+    system storage moves the temporary file into place when it's saved.
+    """
+    if len(data) * 3 // 4 <= settings.FILE_UPLOAD_MAX_MEMORY_SIZE:
+        return SimpleUploadedFile(
+            name, binascii.a2b_base64(data), content_type=content_type
+        )
+
+    # the padding can only be at the end, the tail from the first padding character
+    # onwards is decoded in one go to match the behaviour of ``b64decode``
+    padding = data.find("=")
+    end = len(data) if padding == -1 else padding
+    step = max(settings.DOCUMENTEN_UPLOAD_READ_CHUNK // 3 * 4, 4)
+
+    file = TemporaryUploadedFile(name, content_type, 0, None)
+    try:
+        rest = ""
+        for start in range(0, end, step):
+            chunk = rest + NON_BASE64_PATTERN.sub(
+                "", data[start : min(start + step, end)]
+            )
+            # decode complete groups of 4 characters, keep the rest for the next chunk
+            split = len(chunk) - len(chunk) % 4
+            file.write(binascii.a2b_base64(chunk[:split]))
+            rest = chunk[split:]
+        file.write(binascii.a2b_base64(rest + data[end:]))
+    except Exception:
+        file.close()
+        raise
+
+    file.size = file.tell()
+    file.seek(0)
+    return file
+
+
 def create_filename(name):
     path = PurePath(name)
     main_part, ext = path.stem, path.suffix
@@ -46,3 +287,88 @@ def check_path(url, resource):
         return False
 
     return True
+
+
+def parse_range_header(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a ``Range`` header with a single byte range into the positions of the first
+    and last byte.
+
+    Return ``None`` if the header is malformed or requests multiple ranges, in which
+    case the complete content is sent. Raise ``ValueError`` if the range can't be
+    satisfied.
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+
+    first, last = match.groups()
+    # suffix range: the last N bytes
+    if not first:
+        if not int(last) or not size:
+            raise ValueError("Unsatisfiable range")
+        return max(size - int(last), 0), size - 1
+
+    if last and int(last) < int(first):
+        return None
+    if int(first) >= size:
+        raise ValueError("Unsatisfiable range")
+    return int(first), (min(int(last), size - 1) if last else size - 1)
+
+
+def get_content_etag(file: CMISStorageFile) -> str:
+    """
+    Return a strong ETag for the content of the file.
+
+    The content of a private working copy changes without a new version, so the
+    modification date is included.
+    """
+    cmis_doc = file.cmis_doc
+    value = f"{cmis_doc.objectId};{cmis_doc.lastModificationDate}"
+    return f'"{hashlib.sha256(value.encode()).hexdigest()}"'
+
+
+def get_download_response(
+    request: HttpRequest, file: CMISStorageFile
+) -> HttpResponseBase:
+    """
+    Stream the content of the file, or the byte range requested with the ``Range``
+    header.
+
+    A range is only sent if the ``If-Range`` header, if any, matches the ETag of the
+    content, so resumed downloads of changed content start over.
+    """
+    # the size of the content according to the DMS, or else the bestandsomvang
+    size = getattr(file.cmis_doc, "contentStreamLength", None) or file.size or 0
+    etag = get_content_etag(file)
+
+    byte_range = None
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if range_header and (if_range is None or if_range == etag):
+        try:
+            byte_range = parse_range_header(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is None:
+        response = StreamingHttpResponse(
+            file.open_content(), content_type="application/octet-stream"
+        )
+        response["Content-Length"] = size
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            file.open_content(start, end),
+            status=206,
+            content_type="application/octet-stream",
+        )
+        response["Content-Length"] = end - start + 1
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    response["Content-Disposition"] = f'attachment; filename="{file.name}"'
+    return response
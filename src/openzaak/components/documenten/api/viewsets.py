@@ -2,14 +2,13 @@
 # Copyright (C) 2019 - 2022 Dimpact
 from django.conf import settings
 from django.db import transaction
-from django.http import FileResponse
+from django.http import Http404
 from django.utils.translation import ugettext_lazy as _
 
 from django_loose_fk.virtual_models import ProxyMixin
 from django_sendfile import sendfile
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
@@ -24,9 +23,11 @@ from vng_api_common.audittrails.viewsets import (
 from vng_api_common.search import SearchMixin
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.bulk import BulkReadMixin
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.mixins import CMISConnectionPoolMixin, ConvertCMISAdapterExceptions
-from openzaak.utils.pagination import OptimizedPagination
+from openzaak.utils.pagination import OptimizedPagination, StreamingListMixin
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import COMMON_ERROR_RESPONSES, use_ref
 
@@ -68,6 +69,7 @@ from .serializers import (
     ObjectInformatieObjectSerializer,
     UnlockEnkelvoudigInformatieObjectSerializer,
 )
+from .utils import get_download_response
 from .validators import CreateRemoteRelationValidator, RemoteRelationValidator
 
 # Openapi query parameters for version querying
@@ -88,9 +90,11 @@ REGISTRATIE_QUERY_PARAM = openapi.Parameter(
 
 @cmis_conditional_retrieve()
 class EnkelvoudigInformatieObjectViewSet(
+    BulkReadMixin,
     CMISConnectionPoolMixin,
     ConvertCMISAdapterExceptions,
     CheckQueryParamsMixin,
+    StreamingListMixin,
     SearchMixin,
     NotificationViewSetMixin,
     ListFilterByAuthorizationsMixin,
@@ -190,7 +194,7 @@ class EnkelvoudigInformatieObjectViewSet(
 
     queryset = (
         EnkelvoudigInformatieObject.objects.select_related(
-            "canonical", "_informatieobjecttype"
+            "canonical", "_informatieobjecttype", "_informatieobjecttype_base_url"
         )
         .prefetch_related("canonical__bestandsdelen")
         .order_by("canonical", "-versie")
@@ -203,6 +207,7 @@ class EnkelvoudigInformatieObjectViewSet(
     required_scopes = {
         "list": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "retrieve": SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        "_bulk_read": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "create": SCOPE_DOCUMENTEN_AANMAKEN,
         "destroy": SCOPE_DOCUMENTEN_ALLES_VERWIJDEREN,
         "update": SCOPE_DOCUMENTEN_BIJWERKEN | SCOPE_DOCUMENTEN_GEFORCEERD_BIJWERKEN,
@@ -304,7 +309,9 @@ class EnkelvoudigInformatieObjectViewSet(
     def download(self, request, *args, **kwargs):
         eio = self.get_object()
         if settings.CMIS_ENABLED:
-            return FileResponse(eio.inhoud.file, as_attachment=True)
+            if not eio.inhoud:
+                raise Http404
+            return get_download_response(request, eio.inhoud)
         else:
             return sendfile(
                 request,
@@ -544,7 +551,7 @@ class ObjectInformatieObjectViewSet(
 
     queryset = (
         ObjectInformatieObject.objects.select_related(
-            "_zaak", "_besluit", "informatieobject"
+            "_zaak", "_besluit", "_object_base_url", "informatieobject"
         )
         .prefetch_related("informatieobject__enkelvoudiginformatieobject_set")
         .all()
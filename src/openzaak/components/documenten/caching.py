@@ -1,7 +1,8 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+import time
 from functools import partial
-from typing import Optional, Set
+from typing import Callable, Hashable, Optional, Set, TypeVar
 
 from django.conf import settings
 from django.core.cache import cache
@@ -11,8 +12,19 @@ from rest_framework_condition.decorators import condition as drf_condition
 from vng_api_common.caching.etags import calculate_etag, etag_func
 from vng_api_common.caching.registry import extract_dependencies
 
+from openzaak.utils.cache import (
+    LocalLRUCache,
+    get_cache_generation,
+    invalidate_cache_generation,
+)
+from openzaak.utils.constants import CMIS_CACHE_GENERATION
 from openzaak.utils.decorators import convert_cmis_adapter_exceptions
 
+T = TypeVar("T")
+
+# CMIS documents hold a reference to their client, so they're cached per process
+cmis_query_cache = LocalLRUCache(maxsize=1000)
+
 
 def get_etag_cache_key(obj: models.Model) -> str:
     resource = obj._meta.model_name
@@ -29,6 +41,41 @@ def get_etag(key: str) -> Optional[str]:
     return cache.get(key)
 
 
+def get_cached_cmis_result(key: Hashable, fetch: Callable[[], T]) -> T:
+    """
+    Return the cached result of a CMIS query, or fetch and cache it.
+
+    The results are cached for ``CMIS_QUERY_CACHE_TIMEOUT`` seconds, or until the
+    documents are changed through Open Zaak in any process. Results are lists, the
+    caller gets a copy of the list but the documents in it are shared and must not be
+    modified - :func:`cmis_doc_to_django_model` converts a (shallow) copy of them.
+    """
+    timeout = settings.CMIS_QUERY_CACHE_TIMEOUT
+    if not timeout:
+        return fetch()
+
+    key = (get_cache_generation(CMIS_CACHE_GENERATION), key)
+    now = time.monotonic()
+
+    cached = cmis_query_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return list(cached[1])
+
+    result = fetch()
+    cmis_query_cache.set(key, (now + timeout, result))
+    return list(result)
+
+
+def invalidate_cmis_cache() -> None:
+    """
+    Invalidate the cached CMIS query results, in every process.
+
+    Call this after every change to documents in the DMS. The DMS is not part of the
+    database transaction, so this happens right away.
+    """
+    invalidate_cache_generation(CMIS_CACHE_GENERATION)
+
+
 class CMISETagMixin:
     """
     Custom ETag management for Document API resources.
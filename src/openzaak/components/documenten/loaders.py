@@ -32,6 +32,17 @@ class EIOLoader(AuthorizedRequestsLoader):
             return self.load_local_object(url, model)
 
         data = self.fetch_object(url)
+        return self.get_model_instance(model, data)
+
+    def get_model_instance(self, model: ModelBase, data: dict):
+        from openzaak.components.documenten.models import (
+            EnkelvoudigInformatieObject,
+            EnkelvoudigInformatieObjectCanonical,
+        )
+
+        if model is EnkelvoudigInformatieObjectCanonical:
+            model = EnkelvoudigInformatieObject
+
         model_instance = get_model_instance(model, data, loader=self)
         self.add_missing_props(model, model_instance, data)
         return model_instance
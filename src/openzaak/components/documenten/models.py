@@ -2,6 +2,9 @@
 # Copyright (C) 2019 - 2020 Dimpact
 import logging
 import uuid as _uuid
+from functools import partial
+from pathlib import Path
+from typing import Optional
 from urllib.parse import urlparse
 
 from django.conf import settings
@@ -21,17 +24,19 @@ from vng_api_common.utils import generate_unique_identification
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 from zgw_consumers.models import ServiceUrlField
 
+from openzaak.utils.constants import DocumentIdentificatieGenerators
 from openzaak.utils.fields import (
     AliasServiceUrlField,
     FkOrServiceUrlField,
     RelativeURLField,
     ServiceFkField,
 )
+from openzaak.utils.identification import SequenceIdentificatieGenerator
 from openzaak.utils.mixins import AuditTrailMixin, CMISClientMixin
 
 from ..besluiten.models import BesluitInformatieObject
 from ..zaken.models import ZaakInformatieObject
-from .caching import CMISETagMixin
+from .caching import CMISETagMixin, invalidate_cmis_cache
 from .constants import (
     ChecksumAlgoritmes,
     ObjectInformatieObjectTypes,
@@ -230,6 +235,15 @@ class InformatieObject(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.identificatie:
+            if (
+                settings.DOCUMENT_IDENTIFICATIE_GENERATOR
+                == DocumentIdentificatieGenerators.counter
+                and not settings.CMIS_ENABLED
+            ):
+                identificatie_generator.save(
+                    self, partial(super().save, *args, **kwargs)
+                )
+                return
             self.identificatie = generate_unique_identification(self, "creatiedatum")
         super().save(*args, **kwargs)
 
@@ -288,6 +302,7 @@ class EnkelvoudigInformatieObjectCanonical(models.Model, CMISClientMixin):
         lock = _uuid.uuid4().hex
         if settings.CMIS_ENABLED:
             self.cmis_client.lock_document(doc_uuid, lock)
+            invalidate_cmis_cache()
         self.lock = lock
 
     def unlock_document(self, doc_uuid, lock, force_unlock=False):
@@ -295,6 +310,7 @@ class EnkelvoudigInformatieObjectCanonical(models.Model, CMISClientMixin):
             self.cmis_client.unlock_document(
                 drc_uuid=doc_uuid, lock=lock, force=force_unlock
             )
+            invalidate_cmis_cache()
         self.lock = ""
 
 
@@ -482,6 +498,7 @@ class EnkelvoudigInformatieObject(
                 for gebruiksrechten_doc in gebruiksrechten:
                     gebruiksrechten_doc.delete()
             self.cmis_client.delete_document(self.uuid)
+            invalidate_cmis_cache()
 
     def destroy(self):
         if settings.CMIS_ENABLED:
@@ -526,6 +543,13 @@ class EnkelvoudigInformatieObject(
             return self.canonical.gebruiksrechten_set.exists()
 
 
+# the versions of a document share their identification, so the database doesn't
+# enforce that it's unique
+identificatie_generator = SequenceIdentificatieGenerator(
+    EnkelvoudigInformatieObject, "bronorganisatie", "creatiedatum", unique=False
+)
+
+
 class BestandsDeel(models.Model):
     uuid = models.UUIDField(
         unique=True, default=_uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
@@ -608,6 +632,38 @@ class BestandsDeel(models.Model):
         informatieobject = self.get_informatieobject()
         return informatieobject.canonical.lock
 
+    @staticmethod
+    def get_upload_name(canonical_id: int) -> str:
+        """
+        Return the storage name of the preallocated file the parts of a document are
+        written to.
+        """
+        return f"part-uploads/{canonical_id}.upload"
+
+    @classmethod
+    def get_upload_path(cls, canonical_id: int) -> Optional[Path]:
+        """
+        Return the path of the preallocated file of the document, if it exists.
+
+        Without a preallocated file, for example with CMIS, every part is stored as
+        a separate file.
+        """
+        if settings.CMIS_ENABLED:
+            return None
+        storage = cls._meta.get_field("inhoud").storage
+        path = Path(storage.path(cls.get_upload_name(canonical_id)))
+        return path if path.exists() else None
+
+    def get_offset(self) -> int:
+        """
+        Return the position of this part in the file.
+        """
+        preceding = BestandsDeel.objects.filter(
+            informatieobject_id=self.informatieobject_id,
+            volgnummer__lt=self.volgnummer,
+        )
+        return preceding.aggregate(offset=models.Sum("omvang"))["offset"] or 0
+
     def save(self, *args, **kwargs) -> None:
         if bool(self.inhoud.name):
             self._voltooid = self.inhoud.size == self.omvang
@@ -908,6 +964,7 @@ class ObjectInformatieObject(CMISETagMixin, models.Model, CMISClientMixin):
             super().delete(*args, **kwargs)
         else:
             self.cmis_client.delete_content_object(self.uuid, object_type="oio")
+            invalidate_cmis_cache()
 
     def get_informatieobject(self, permission_main_object=None):
         """
@@ -4,9 +4,9 @@ import copy
 import datetime
 import logging
 import uuid
-from itertools import groupby
+from itertools import groupby, islice
 from operator import attrgetter, itemgetter
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from django.db import IntegrityError
 from django.db.models import fields
@@ -31,6 +31,7 @@ from ...besluiten.models import Besluit
 from ...catalogi.models.informatieobjecttype import InformatieObjectType
 from ...zaken.models import Zaak
 from ..api.utils import check_path
+from ..caching import get_cached_cmis_result, invalidate_cmis_cache
 from ..utils import Cmisdoc, CMISStorageFile
 from .django import (
     InformatieobjectQuerySet,
@@ -49,6 +50,13 @@ EIO_PROPERTY_MAP = {
 
 
 def sort_results(documents: List, order_by: List[str]) -> List:
+    # if all keys are sorted in the same direction, sort in a single pass
+    if len({order_key.startswith("-") for order_key in order_by}) == 1:
+        attrs = [EIO_PROPERTY_MAP[order_key.lstrip("-")] for order_key in order_by]
+        return sorted(
+            documents, key=attrgetter(*attrs), reverse=order_by[0].startswith("-")
+        )
+
     # mixing ASC/DESC is not possible in a single sorted(...) call with the `reverse`
     # option, so we need to call sorted for every order key, and do this in reverse.
     # if the order key starts with `-` to indicate DESC sorting, we need to reverse
@@ -70,13 +78,36 @@ class CMISDocumentIterable(BaseIterable, CMISClientMixin):
     return_type = "Document"
 
     def __iter__(self):
+        for document, options in self._get_limited_results():
+            yield cmis_doc_to_django_model(document, **options)
+
+    def count(self) -> int:
+        """
+        Count the results without converting the documents, which requires fetching
+        their content.
+        """
+        return sum(1 for _ in self._get_limited_results())
+
+    def _get_limited_results(self) -> Iterator[Tuple[Cmisdoc, dict]]:
+        # the CMIS adapter doesn't support paging in queries, but the results are
+        # generated lazily, so documents after the requested slice are not processed
+        query = self.queryset.query
+        return islice(self._get_results(), query.low_mark, query.high_mark)
+
+    def _get_results(self) -> Iterator[Tuple[Cmisdoc, dict]]:
+        """
+        Yield the documents in the result, with the options to convert them.
+        """
         queryset = self.queryset
 
         filters = self._check_for_pk_filter(queryset._cmis_query)
 
         lhs, rhs = self._normalize_filters(filters)
 
-        documents = queryset.cmis_client.query(self.return_type, lhs, rhs)
+        documents = get_cached_cmis_result(
+            ("query", self.return_type, tuple(lhs), tuple(str(value) for value in rhs)),
+            lambda: queryset.cmis_client.query(self.return_type, lhs, rhs),
+        )
         documents = self._process_intermediate(queryset.query, documents)
 
         version = dict(filters).get("versie")
@@ -99,34 +130,38 @@ class CMISDocumentIterable(BaseIterable, CMISClientMixin):
                 assert (
                     "-versie" in queryset.query.order_by
                 ), "Undefined behaviour w/r to version sorting"
-                eio = cmis_doc_to_django_model(
-                    document,
-                    skip_pwc=False,
-                    version=version,
-                    begin_registratie=begin_registratie,
-                )
-                yield eio
+                yield document, {
+                    "skip_pwc": False,
+                    "version": version,
+                    "begin_registratie": begin_registratie,
+                }
 
             # general query, we want multiple versions of the same document -> get the entire
             # version history
             else:
-                versions = self.cmis_client.get_all_versions(document)
+                versions = get_cached_cmis_result(
+                    ("versions", document.uuid, document.versionLabel),
+                    lambda: self.cmis_client.get_all_versions(document),
+                )
                 versions = sort_results(versions, queryset.query.order_by)
 
                 seen = set()
-                for version in versions:
-                    if version.versie in seen:
+                for document_version in versions:
+                    if document_version.versie in seen:
                         continue
 
-                    uuid_version_combination = (version.uuid, version.versie)
+                    uuid_version_combination = (
+                        document_version.uuid,
+                        document_version.versie,
+                    )
                     if uuid_version_combination in uuid_version_tuples_seen:
                         continue
 
                     # mark version as seen in both scopes
-                    seen.add(version.versie)
+                    seen.add(document_version.versie)
                     uuid_version_tuples_seen.add(uuid_version_combination)
 
-                    yield cmis_doc_to_django_model(version, skip_pwc=True)
+                    yield document_version, {"skip_pwc": True}
 
     def _process_intermediate(
         self, django_query, documents: List[Cmisdoc]
@@ -181,7 +216,7 @@ class CMISDocumentIterable(BaseIterable, CMISClientMixin):
             # now the groups are sorted by their logical canonical creation date
             grouped = sorted(grouped, key=itemgetter(0))
             # merge the documents together again (flattening the tuples of [int, list])
-            documents = sum([group for _, group in grouped], [])
+            documents = [document for _, group in grouped for document in group]
 
         return documents
 
@@ -231,8 +266,10 @@ class CMISDocumentIterable(BaseIterable, CMISClientMixin):
             if name is None:
                 raise NotImplementedError(f"Filter on '{key}' is not implemented yet")
 
-            _rhs.append(value)
-            _lhs.append(f"{name} = '%s'")
+            # `__in` lookups (e.g. of the bulk read) have a list value
+            lhs_filter, rhs_filter = build_filter(name, value)
+            _rhs += rhs_filter
+            _lhs += lhs_filter
 
         return _lhs, _rhs
 
@@ -273,9 +310,13 @@ class CMISDocumentIterable(BaseIterable, CMISClientMixin):
 
         filtered_docs = []
         for cmis_doc in documents:
-            # Check that the vertrouwelijkaanduiding autorisation is as required
-            django_doc = cmis_doc_to_django_model(cmis_doc)
-            doc_va_order = get_doc_va_order(django_doc)
+            # Check that the vertrouwelijkaanduiding autorisation is as required. The
+            # property is read from the CMIS document (or its PWC) directly, since
+            # converting the document fetches its content
+            if cmis_doc.isVersionSeriesCheckedOut:
+                doc_va_order = get_doc_va_order(cmis_doc.get_latest_version())
+            else:
+                doc_va_order = get_doc_va_order(cmis_doc)
             if doc_va_order <= va_order:
                 filtered_docs.append(cmis_doc)
 
@@ -479,7 +520,10 @@ class CMISQuerySet(InformatieobjectQuerySet, CMISClientMixin):
         if self._result_cache is not None:
             return len(self._result_cache)
 
-        return len(self)
+        if not issubclass(self._iterable_class, CMISDocumentIterable):
+            return len(self)
+
+        return self._iterable_class(self).count()
 
     def union(self, *args, **kwargs):
         unified_queryset = super().union(*args, **kwargs)
@@ -544,6 +588,7 @@ class CMISQuerySet(InformatieobjectQuerySet, CMISClientMixin):
                 content=content,
                 check_if_already_exists=False,  # The serializer has already checked this.
             )
+        invalidate_cmis_cache()
 
         return cmis_doc_to_django_model(new_cmis_document)
 
@@ -825,6 +870,8 @@ class ObjectInformatieObjectCMISQuerySet(
             zaaktype_data=zaaktype_data,
             other_data=other_data,
         )
+        # the document may have been moved or copied to the folder of the zaak
+        invalidate_cmis_cache()
         django_oio = cmis_oio_to_django(cmis_oio)
         return django_oio
 
@@ -955,8 +1002,12 @@ def cmis_doc_to_django_model(
     canonical = EnkelvoudigInformatieObjectCanonical()
     canonical.lock = cmis_doc.lock or ""
 
-    # Ensuring the charfields are not null and dates are in the correct format
-    cmis_doc = format_fields(cmis_doc, EnkelvoudigInformatieObject._meta.get_fields())
+    # Ensuring the charfields are not null and dates are in the correct format. The
+    # formatted values are set on a copy, since the document can be shared through
+    # the CMIS query cache
+    cmis_doc = format_fields(
+        copy.copy(cmis_doc), EnkelvoudigInformatieObject._meta.get_fields()
+    )
 
     file_is_empty = not bool(cmis_doc.get_content_stream().getvalue())
     no_file = False
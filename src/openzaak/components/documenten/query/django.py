@@ -12,7 +12,11 @@ from vng_api_common.scopes import Scope
 
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
-from openzaak.utils.query import BlockChangeMixin, LooseFkAuthorizationsFilterMixin
+from openzaak.utils.query import (
+    BlockChangeMixin,
+    CompiledFilters,
+    LooseFkAuthorizationsFilterMixin,
+)
 
 from ..constants import ObjectInformatieObjectTypes
 from ..typing import IORelation
@@ -117,8 +121,8 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
 
         return queryset
 
-    def ids_by_auth(self, scope, authorizations, local=True) -> models.QuerySet:
-        filters = self.get_filters(scope, authorizations, local)
+    def ids_by_auth(self, compiled: CompiledFilters, local=True) -> models.QuerySet:
+        filters = self.build_filters(compiled, local)
         queryset = self.build_queryset_cmis(filters)
         return queryset.values_list("pk", flat=True)
 
@@ -130,12 +134,12 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
 
         # todo implement error if no loose-fk field
 
-        authorizations_local, authorizations_external = self.get_authorizations(
+        compiled_local, compiled_external = self.get_compiled_filters(
             scope, authorizations
         )
 
-        ids_local = self.ids_by_auth(scope, authorizations_local, local=True)
-        ids_external = self.ids_by_auth(scope, authorizations_external, local=False)
+        ids_local = self.ids_by_auth(compiled_local, local=True)
+        ids_external = self.ids_by_auth(compiled_external, local=False)
         queryset = self.filter(pk__in=ids_local.union(ids_external))
         return queryset
 
@@ -197,16 +201,41 @@ class DjangoQuerySet(InformatieobjectQuerySet):
 
 class BestandsDeelQuerySet(models.QuerySet):
     def wipe(self):
+        canonical_ids = set()
         for part in self:
-            part.inhoud.delete()
-            part.delete()
+            part.inhoud.delete(save=False)
+            if part.informatieobject_id is not None:
+                canonical_ids.add(part.informatieobject_id)
+
+        # the preallocated files the parts are written to
+        storage = self.model._meta.get_field("inhoud").storage
+        for canonical_id in canonical_ids:
+            storage.delete(self.model.get_upload_name(canonical_id))
+
+        self.delete()
+
+    def upload_status(self) -> Tuple[int, int]:
+        """
+        Return the number of uploaded parts and the total number of parts.
+
+        ⚡️ The parts can be uploaded in any order, the status of all parts is
+        aggregated in a single query.
+        """
+        status = self.aggregate(
+            # parts written to a preallocated file have no inhoud of their own
+            uploaded=models.Count(
+                "pk", filter=models.Q(_voltooid=True) | ~models.Q(inhoud="")
+            ),
+            total=models.Count("pk"),
+        )
+        return status["uploaded"], status["total"]
 
     @property
     def complete_upload(self) -> bool:
-        empty_parts = self.filter(inhoud="")
-        return not empty_parts.exists()
+        uploaded, total = self.upload_status()
+        return uploaded == total
 
     @property
     def empty_bestandsdelen(self) -> bool:
-        empty_parts = self.filter(inhoud="")
-        return empty_parts.count() == self.count()
+        uploaded, _ = self.upload_status()
+        return uploaded == 0
@@ -2,8 +2,11 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from datetime import date
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from openzaak.utils.constants import DocumentIdentificatieGenerators
+
+from ...models import identificatie_generator
 from ..factories import EnkelvoudigInformatieObjectFactory
 
 
@@ -25,3 +28,54 @@ class EIOTests(TestCase):
         )
 
         self.assertEqual(eio2.identificatie, "DOCUMENT-2019-0000000016")
+
+
+@override_settings(
+    DOCUMENT_IDENTIFICATIE_GENERATOR=DocumentIdentificatieGenerators.counter
+)
+class EIOCounterTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(identificatie_generator.clear)
+
+    def test_numbers_per_organisation(self):
+        EnkelvoudigInformatieObjectFactory.create(
+            creatiedatum=date(2019, 7, 1),
+            identificatie="DOCUMENT-2019-0000000015",
+            bronorganisatie="517439943",
+        )
+
+        eio1 = EnkelvoudigInformatieObjectFactory.create(
+            identificatie="",
+            creatiedatum=date(2019, 9, 15),
+            bronorganisatie="517439943",
+        )
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            identificatie="",
+            creatiedatum=date(2019, 9, 15),
+            bronorganisatie="111222333",
+        )
+
+        self.assertEqual(eio1.identificatie, "DOCUMENT-2019-0000000016")
+        self.assertEqual(eio2.identificatie, "DOCUMENT-2019-0000000001")
+
+    def test_skip_explicitly_assigned_identifications(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(
+            identificatie="", creatiedatum=date(2019, 9, 15)
+        )
+        for identificatie in ("DOCUMENT-2019-0000000002", "DOCUMENT-2019-0000000003"):
+            EnkelvoudigInformatieObjectFactory.create(
+                identificatie=identificatie,
+                creatiedatum=date(2019, 7, 1),
+                bronorganisatie=eio1.bronorganisatie,
+            )
+
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            identificatie="",
+            creatiedatum=date(2019, 9, 15),
+            bronorganisatie=eio1.bronorganisatie,
+        )
+
+        self.assertEqual(eio1.identificatie, "DOCUMENT-2019-0000000001")
+        self.assertEqual(eio2.identificatie, "DOCUMENT-2019-0000000004")
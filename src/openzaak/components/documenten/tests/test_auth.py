@@ -128,6 +128,39 @@ class InformatieObjectReadCorrectScopeTests(JWTAuthMixin, APITestCase):
         self.assertEqual(response1.status_code, status.HTTP_403_FORBIDDEN)
         self.assertEqual(response2.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_io_bulk_read(self):
+        """
+        Assert the bulk read only returns the INFORMATIEOBJECTen of your
+        authorization
+        """
+        eio1 = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+        eio3 = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+
+        response = self.client.post(
+            reverse("enkelvoudiginformatieobject--bulk-read"),
+            {
+                "urls": [
+                    f"http://testserver{reverse(eio1)}",
+                    f"http://testserver{reverse(eio2)}",
+                    str(eio3.uuid),
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(len(response_data), 1)
+        self.assertEqual(response_data[0]["url"], f"http://testserver{reverse(eio1)}")
+
     def test_read_superuser(self):
         """
         superuser read everything
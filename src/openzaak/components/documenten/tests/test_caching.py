@@ -3,15 +3,25 @@
 """
 Test that the caching mechanisms are in place.
 """
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase, override_settings
+
 from rest_framework import status
 from rest_framework.test import APITestCase, APITransactionTestCase
 from vng_api_common.tests import CacheMixin, JWTAuthMixin, reverse
 
 from openzaak.components.zaken.tests.factories import ZaakInformatieObjectFactory
-from openzaak.tests.utils import get_spec
-
-from ..caching import get_etag_cache_key, set_etag
-from ..models import ObjectInformatieObject
+from openzaak.tests.utils import APICMISTestCase, get_spec, require_cmis
+
+from ..caching import (
+    cmis_query_cache,
+    get_cached_cmis_result,
+    get_etag_cache_key,
+    invalidate_cmis_cache,
+    set_etag,
+)
+from ..models import EnkelvoudigInformatieObject, ObjectInformatieObject
 from ..tests.factories import EnkelvoudigInformatieObjectFactory, GebruiksrechtenFactory
 
 
@@ -186,3 +196,87 @@ class EnkelvoudigInformatieObjectCacheTransactionTests(
 
         response = self.client.get(reverse(eio), HTTP_IF_NONE_MATCH=f"{_etag}")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+@override_settings(CMIS_QUERY_CACHE_TIMEOUT=60)
+class CMISQueryCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        cmis_query_cache.clear()
+        self.addCleanup(cmis_query_cache.clear)
+
+    def test_results_are_cached(self):
+        fetch = Mock(return_value=["document"])
+
+        result1 = get_cached_cmis_result(("query", "Document"), fetch)
+        result2 = get_cached_cmis_result(("query", "Document"), fetch)
+
+        self.assertEqual(result1, ["document"])
+        self.assertEqual(result2, ["document"])
+        self.assertEqual(fetch.call_count, 1)
+
+    def test_results_are_copied(self):
+        get_cached_cmis_result(("query", "Document"), lambda: ["document"]).clear()
+
+        result = get_cached_cmis_result(("query", "Document"), Mock())
+
+        self.assertEqual(result, ["document"])
+
+    def test_invalidate(self):
+        fetch = Mock(return_value=[])
+        get_cached_cmis_result(("query", "Document"), fetch)
+
+        invalidate_cmis_cache()
+        get_cached_cmis_result(("query", "Document"), fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_results_expire(self):
+        fetch = Mock(return_value=[])
+
+        with patch("openzaak.components.documenten.caching.time.monotonic") as now:
+            now.return_value = 100
+            get_cached_cmis_result(("query", "Document"), fetch)
+            now.return_value = 161
+            get_cached_cmis_result(("query", "Document"), fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    @override_settings(CMIS_QUERY_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        fetch = Mock(return_value=[])
+
+        get_cached_cmis_result(("query", "Document"), fetch)
+        get_cached_cmis_result(("query", "Document"), fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+
+@require_cmis
+@override_settings(CMIS_ENABLED=True, CMIS_QUERY_CACHE_TIMEOUT=60)
+class CMISCachedDocumentsTests(APICMISTestCase):
+    def setUp(self):
+        super().setUp()
+
+        cmis_query_cache.clear()
+        self.addCleanup(cmis_query_cache.clear)
+
+    def _get_documents(self) -> list:
+        return [
+            (eio.uuid, eio.versie, eio.titel, eio.creatiedatum, eio.begin_registratie)
+            for eio in EnkelvoudigInformatieObject.objects.all()
+        ]
+
+    def test_cached_documents_are_not_modified(self):
+        EnkelvoudigInformatieObjectFactory.create_batch(2)
+
+        documents1 = self._get_documents()
+        documents2 = self._get_documents()
+
+        self.assertEqual(len(documents1), 2)
+        self.assertEqual(documents1, documents2)
+        # the converted values are not set on the cached documents
+        for _, cached_documents in cmis_query_cache._data.values():
+            for document in cached_documents:
+                self.assertNotIn("creatiedatum", vars(document))
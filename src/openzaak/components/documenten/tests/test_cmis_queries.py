@@ -1,10 +1,15 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
+from unittest.mock import patch
+
 from django.contrib.sites.models import Site
 from django.test import override_settings
 
+from drc_cmis.client_builder import get_cmis_client
+
 from openzaak.tests.utils import APICMISTestCase, require_cmis
 
+from ..caching import cmis_query_cache
 from ..models import EnkelvoudigInformatieObject
 from .factories import EnkelvoudigInformatieObjectFactory
 
@@ -82,3 +87,39 @@ class QueryTests(APICMISTestCase):
         self.assertEqual(
             [eio.identificatie for eio in second_filter], [eio2.identificatie],
         )
+
+    @override_settings(CMIS_QUERY_CACHE_TIMEOUT=60)
+    def test_query_results_are_cached(self):
+        self.addCleanup(cmis_query_cache.clear)
+        eio = EnkelvoudigInformatieObjectFactory.create(identificatie="001", titel="a")
+        client_class = type(get_cmis_client())
+
+        with patch.object(
+            client_class, "query", autospec=True, side_effect=client_class.query
+        ) as mock_query:
+            for _ in range(2):
+                eios = EnkelvoudigInformatieObject.objects.filter(identificatie="001")
+                self.assertEqual([eio.titel for eio in eios], ["a"])
+
+        self.assertEqual(mock_query.call_count, 1)
+
+        # changes through Open Zaak invalidate the cache
+        EnkelvoudigInformatieObject.objects.filter(uuid=eio.uuid).update(titel="b")
+
+        eios = EnkelvoudigInformatieObject.objects.filter(identificatie="001")
+        self.assertEqual([eio.titel for eio in eios], ["b"])
+
+    def test_slice(self):
+        for identificatie in ["001", "002", "003"]:
+            EnkelvoudigInformatieObjectFactory.create(identificatie=identificatie)
+        identificaties = [
+            eio.identificatie for eio in EnkelvoudigInformatieObject.objects.all()
+        ]
+
+        eios = EnkelvoudigInformatieObject.objects.all()
+
+        self.assertEqual(eios.count(), 3)
+        self.assertEqual([eio.identificatie for eio in eios[1:]], identificaties[1:])
+        self.assertEqual([eio.identificatie for eio in eios[:2]], identificaties[:2])
+        self.assertEqual(eios[2].identificatie, identificaties[2])
+        self.assertEqual(eios[1:2].count(), 1)
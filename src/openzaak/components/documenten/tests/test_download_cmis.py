@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+from unittest.mock import Mock
+
+from django.http import StreamingHttpResponse
+from django.test import SimpleTestCase, override_settings
+
+from rest_framework import status
+
+from openzaak.tests.utils import APICMISTestCase, JWTAuthMixin, require_cmis
+
+from ..api.utils import parse_range_header
+from ..utils import ResponseContent, slice_chunks
+from .factories import EnkelvoudigInformatieObjectFactory
+from .utils import get_operation_url
+
+
+class ParseRangeHeaderTests(SimpleTestCase):
+    def test_ranges(self):
+        cases = [
+            ("bytes=0-9", (0, 9)),
+            ("bytes=10-", (10, 99)),
+            ("bytes=-10", (90, 99)),
+            ("bytes=-200", (0, 99)),
+            ("bytes=90-200", (90, 99)),
+        ]
+        for header, expected in cases:
+            with self.subTest(header=header):
+                self.assertEqual(parse_range_header(header, 100), expected)
+
+    def test_ignored_ranges(self):
+        for header in ["bytes=-", "bytes=9-0", "bytes=0-9,20-29", "items=0-9", "0-9"]:
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range_header(header, 100))
+
+    def test_unsatisfiable_ranges(self):
+        for header, size in [("bytes=100-", 100), ("bytes=-0", 100), ("bytes=0-", 0)]:
+            with self.subTest(header=header, size=size):
+                with self.assertRaises(ValueError):
+                    parse_range_header(header, size)
+
+
+class SliceChunksTests(SimpleTestCase):
+    def test_slice_chunks(self):
+        chunks = [b"abc", b"def", b"ghi"]
+
+        self.assertEqual(b"".join(slice_chunks(chunks)), b"abcdefghi")
+        self.assertEqual(b"".join(slice_chunks(chunks, 2, 6)), b"cdefg")
+        self.assertEqual(b"".join(slice_chunks(chunks, 4)), b"efghi")
+        self.assertEqual(b"".join(slice_chunks(chunks, 3, 3)), b"d")
+
+
+class ResponseContentTests(SimpleTestCase):
+    def test_iterate(self):
+        content = ResponseContent(Mock(), iter([b"abc", b"def"]))
+
+        self.assertEqual(b"".join(content), b"abcdef")
+
+    def test_closing_unread_response_closes_content(self):
+        dms_response = Mock()
+        response = StreamingHttpResponse(ResponseContent(dms_response, iter([b"abc"])))
+
+        response.close()
+
+        dms_response.close.assert_called_once_with()
+
+
+@require_cmis
+@override_settings(CMIS_ENABLED=True)
+class DownloadRangeTests(JWTAuthMixin, APICMISTestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        eio = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"0123456789")
+        self.url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+
+    def test_download(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response.getvalue(), b"0123456789")
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
+    def test_download_range(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=2-5")
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response.getvalue(), b"2345")
+        self.assertEqual(response["Content-Length"], "4")
+        self.assertEqual(response["Content-Range"], "bytes 2-5/10")
+
+    def test_resume_download(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=6-", HTTP_IF_RANGE=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response.getvalue(), b"6789")
+
+    def test_resume_download_changed_content(self):
+        response = self.client.get(
+            self.url, HTTP_RANGE="bytes=6-", HTTP_IF_RANGE='"outdated"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), b"0123456789")
+
+    def test_unsatisfiable_range(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=10-")
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+        self.assertEqual(response["Content-Range"], "bytes */10")
@@ -418,6 +418,20 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APICMISTestCase):
         self.assertEqual(len(response_data), 1)
         self.assertEqual(response_data[0]["identificatie"], "foo")
 
+    def test_bulk_read(self):
+        eio1, eio2, _ = EnkelvoudigInformatieObjectFactory.create_batch(3)
+
+        response = self.client.post(
+            reverse("enkelvoudiginformatieobject--bulk-read"),
+            {"urls": [f"http://testserver{reverse(eio1)}", str(eio2.uuid)]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            {eio["url"] for eio in response.json()},
+            {f"http://testserver{reverse(eio1)}", f"http://testserver{reverse(eio2)}"},
+        )
+
     def test_destroy_no_relations_allowed(self):
         """
         Assert that destroying is possible when there are no relations.
@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+from privates.test import temp_private_root
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.zaken.tests.factories import ZaakInformatieObjectFactory
+from openzaak.tests.utils import JWTAuthMixin, QueryBudget, QueryBudgetMixin
+
+from .factories import (
+    BestandsDeelFactory,
+    EnkelvoudigInformatieObjectFactory,
+    GebruiksrechtenFactory,
+)
+
+
+def enkelvoudiginformatieobject_list(n: int) -> str:
+    EnkelvoudigInformatieObjectFactory.create_batch(n)
+    return reverse("enkelvoudiginformatieobject-list")
+
+
+def enkelvoudiginformatieobject_detail(n: int) -> str:
+    eio = EnkelvoudigInformatieObjectFactory.create()
+    BestandsDeelFactory.create_batch(n, informatieobject=eio.canonical)
+    return reverse(eio)
+
+
+def gebruiksrechten_list(n: int) -> str:
+    GebruiksrechtenFactory.create_batch(n)
+    return reverse("gebruiksrechten-list")
+
+
+def objectinformatieobject_list(n: int) -> str:
+    # the objectinformatieobjecten are created with the zaakinformatieobjecten
+    ZaakInformatieObjectFactory.create_batch(n)
+    return reverse("objectinformatieobject-list")
+
+
+@temp_private_root()
+class DocumentenQueryBudgetTests(JWTAuthMixin, QueryBudgetMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    query_budgets = [
+        QueryBudget(
+            "enkelvoudiginformatieobject-list", enkelvoudiginformatieobject_list
+        ),
+        QueryBudget(
+            "enkelvoudiginformatieobject-detail", enkelvoudiginformatieobject_detail
+        ),
+        QueryBudget("gebruiksrechten-list", gebruiksrechten_list),
+        QueryBudget("objectinformatieobject-list", objectinformatieobject_list),
+    ]
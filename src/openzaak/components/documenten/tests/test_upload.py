@@ -1,11 +1,18 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+import binascii
+import errno
+import tempfile
 import uuid
 from base64 import b64encode
+from pathlib import Path
+from unittest.mock import patch
 
 from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import override_settings
+from django.test import SimpleTestCase, override_settings
 
 from privates.test import temp_private_root
 from rest_framework import status
@@ -24,7 +31,13 @@ from ..api.scopes import (
     SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK,
     SCOPE_DOCUMENTEN_LOCK,
 )
-from ..models import EnkelvoudigInformatieObject
+from ..api.utils import (
+    decode_base64_file,
+    merge_files,
+    merge_files_in_storage,
+    write_file_at,
+)
+from ..models import BestandsDeel, EnkelvoudigInformatieObject
 from .factories import EnkelvoudigInformatieObjectFactory
 from .utils import get_operation_url, split_file
 
@@ -101,6 +114,32 @@ class SmallFileUpload(JWTAuthMixin, APITestCase):
         self.assertEqual(data["inhoud"], f"http://testserver{file_url}?versie=1")
         self.assertEqual(data["locked"], False)
 
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=0, DOCUMENTEN_UPLOAD_READ_CHUNK=6)
+    def test_create_eio_decoded_to_disk(self):
+        content = {
+            "identificatie": uuid.uuid4().hex,
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2018-06-27",
+            "titel": "detailed summary",
+            "auteur": "test_auteur",
+            "formaat": "txt",
+            "taal": "eng",
+            "bestandsnaam": "dummy.txt",
+            "inhoud": b64encode(b"some file content").decode("utf-8"),
+            "bestandsomvang": 17,
+            "informatieobjecttype": self.informatieobjecttype_url,
+            "vertrouwelijkheidaanduiding": "openbaar",
+        }
+
+        response = self.client.post(reverse(EnkelvoudigInformatieObject), content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        eio = EnkelvoudigInformatieObject.objects.get(
+            identificatie=content["identificatie"]
+        )
+        self.assertEqual(eio.inhoud.file.read(), b"some file content")
+
     def test_create_without_file(self):
         """
         Test the create process of the document metadata without a file
@@ -604,7 +643,8 @@ class LargeFileAPITests(JWTAuthMixin, APITestCase):
 
             part.refresh_from_db()
 
-            self.assertNotEqual(part.inhoud, "")
+            # the part is written into the preallocated file of the document
+            self.assertEqual(part.inhoud, "")
             self.assertEqual(part.voltooid, True)
 
     def _unlock(self):
@@ -673,6 +713,89 @@ class LargeFileAPITests(JWTAuthMixin, APITestCase):
         self._unlock()
         self._download_file()
 
+    def test_upload_parts_out_of_order(self):
+        self._create_metadata()
+        self.bestandsdelen = list(self.bestandsdelen)[::-1]
+        self.file_content.seek(0)
+        part_files = split_file(
+            self.file_content, settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE
+        )[::-1]
+
+        for part, part_file in zip(self.bestandsdelen, part_files):
+            response = self.client.put(
+                get_operation_url("bestandsdeel_update", uuid=part.uuid),
+                {"inhoud": part_file, "lock": self.canonical.lock},
+                format="multipart",
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        self.assertEqual(self.canonical.bestandsdelen.upload_status(), (2, 2))
+
+        self._unlock()
+        self._download_file()
+
+    def test_unlock_merges_in_storage(self):
+        self._create_metadata()
+        self._upload_part_files()
+        self._unlock()
+
+        self.assertTrue(self.eio.inhoud.name.startswith("uploads/"))
+        self.assertEqual(Path(self.eio.inhoud.path).read_bytes(), b"filecontentstring")
+        # no leftover merged file outside the upload directory
+        self.assertFalse((Path(settings.PRIVATE_MEDIA_ROOT) / "dummy.txt").exists())
+
+    def test_upload_parts_into_preallocated_file(self):
+        self._create_metadata()
+
+        upload_path = BestandsDeel.get_upload_path(self.canonical.pk)
+        self.assertIsNotNone(upload_path)
+        self.assertEqual(upload_path.stat().st_size, self.file_content.size)
+
+        # the second part lands at its offset, before the first part is uploaded
+        part_files = split_file(
+            self.file_content, settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE
+        )
+        response = self.client.put(
+            get_operation_url("bestandsdeel_update", uuid=self.bestandsdelen[1].uuid),
+            {"inhoud": part_files[1], "lock": self.canonical.lock},
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(upload_path.read_bytes()[10:], b"tstring")
+        self.assertEqual(self.canonical.bestandsdelen.upload_status(), (1, 2))
+
+        self._upload_part_files()
+        self._unlock()
+
+        # the preallocated file is moved into place
+        self.assertFalse(upload_path.exists())
+        self.assertEqual(Path(self.eio.inhoud.path).read_bytes(), b"filecontentstring")
+
+    def test_unlock_merges_parts_without_preallocated_file(self):
+        self._create_metadata()
+        # parts uploaded before the preallocated files were introduced
+        BestandsDeel.get_upload_path(self.canonical.pk).unlink()
+        part_files = split_file(
+            self.file_content, settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE
+        )
+        for part, part_file in zip(self.bestandsdelen, part_files):
+            response = self.client.put(
+                get_operation_url("bestandsdeel_update", uuid=part.uuid),
+                {"inhoud": part_file, "lock": self.canonical.lock},
+                format="multipart",
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+            part.refresh_from_db()
+            self.assertNotEqual(part.inhoud, "")
+
+        self._unlock()
+
+        self.assertEqual(Path(self.eio.inhoud.path).read_bytes(), b"filecontentstring")
+
     def test_upload_part_wrong_size(self):
         """
         Test the upload of the incorrect part file
@@ -740,8 +863,12 @@ class LargeFileAPITests(JWTAuthMixin, APITestCase):
 
         part.refresh_from_db()
 
-        self.assertNotEqual(part.inhoud, "")
+        self.assertEqual(part.inhoud, "")
         self.assertEqual(part.voltooid, True)
+        self.assertEqual(
+            BestandsDeel.get_upload_path(self.canonical.pk).read_bytes(),
+            b"filecontentstring",
+        )
 
     def test_unlock_without_uploading(self):
         """
@@ -1039,3 +1166,115 @@ class LargeFileAPITests(JWTAuthMixin, APITestCase):
         self.assertEqual(new_version.bestandsomvang, None)
         self.assertEqual(self.canonical.bestandsdelen.count(), 0)
         self.assertEqual(data["inhoud"], None)
+
+
+@override_settings(DOCUMENTEN_UPLOAD_READ_CHUNK=4)
+class MergeFilesTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.dir = Path(tmpdir.name)
+
+        self.part_files = []
+        for name, content in [("part1", b"filecontent"), ("part2", b"string")]:
+            path = self.dir / name
+            path.write_bytes(content)
+            self.part_files.append(File(open(path, "rb")))
+            self.addCleanup(self.part_files[-1].close)
+
+    def test_merge_files(self):
+        target = merge_files(self.part_files, self.dir / "uploads" / "2023", "file.txt")
+
+        self.assertEqual(target, self.dir / "uploads" / "2023" / "file.txt")
+        self.assertEqual(target.read_bytes(), b"filecontentstring")
+
+    def test_merge_files_kernel_copy_not_supported(self):
+        error = OSError(errno.EXDEV, "Invalid cross-device link")
+
+        with patch("os.copy_file_range", side_effect=error, create=True), patch(
+            "os.sendfile", side_effect=error, create=True
+        ):
+            target = merge_files(self.part_files, self.dir, "file.txt")
+
+        self.assertEqual(target.read_bytes(), b"filecontentstring")
+
+    def test_merge_files_existing_file(self):
+        (self.dir / "file.txt").write_bytes(b"existing")
+
+        with self.assertRaises(FileExistsError):
+            merge_files(self.part_files, self.dir, "file.txt")
+
+        self.assertEqual((self.dir / "file.txt").read_bytes(), b"existing")
+
+    def test_merge_files_failure_removes_file(self):
+        error = OSError(errno.ENOSPC, "No space left on device")
+
+        with patch(
+            "openzaak.components.documenten.api.utils.append_file",
+            side_effect=[None, error],
+        ):
+            with self.assertRaises(OSError):
+                merge_files(self.part_files, self.dir, "file.txt")
+
+        self.assertFalse((self.dir / "file.txt").exists())
+
+    def test_merge_files_in_storage_name_taken_concurrently(self):
+        storage = FileSystemStorage(location=self.dir)
+        # created by a concurrent merge after the name was found available
+        (self.dir / "file.txt").write_bytes(b"existing")
+
+        with patch.object(
+            storage, "get_available_name", side_effect=["file.txt", "file_2.txt"]
+        ):
+            name = merge_files_in_storage(self.part_files, storage, "file.txt")
+
+        self.assertEqual(name, "file_2.txt")
+        self.assertEqual((self.dir / "file.txt").read_bytes(), b"existing")
+        self.assertEqual((self.dir / "file_2.txt").read_bytes(), b"filecontentstring")
+
+    def test_write_file_at(self):
+        target = self.dir / "file.upload"
+        target.write_bytes(bytes(17))
+
+        write_file_at(self.part_files[1], target, 11)
+        write_file_at(self.part_files[0], target, 0)
+
+        self.assertEqual(target.read_bytes(), b"filecontentstring")
+
+    def test_write_file_at_kernel_copy_not_supported(self):
+        target = self.dir / "file.upload"
+        target.write_bytes(bytes(17))
+        error = OSError(errno.EXDEV, "Invalid cross-device link")
+
+        with patch("os.copy_file_range", side_effect=error, create=True):
+            write_file_at(self.part_files[1], target, 11)
+
+        self.assertEqual(target.read_bytes(), bytes(11) + b"string")
+
+
+@override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=0, DOCUMENTEN_UPLOAD_READ_CHUNK=6)
+class DecodeBase64FileTests(SimpleTestCase):
+    def test_decode_in_chunks(self):
+        data = b64encode(b"some file content").decode()
+
+        for encoded in [data, f"{data[:5]}\n{data[5:11]}\n{data[11:]}"]:
+            with self.subTest(encoded=encoded):
+                file = decode_base64_file(encoded, "file.bin")
+                self.addCleanup(file.close)
+
+                self.assertTrue(hasattr(file, "temporary_file_path"))
+                self.assertEqual(file.size, 17)
+                self.assertEqual(file.read(), b"some file content")
+
+    def test_incorrect_padding(self):
+        with self.assertRaisesMessage(binascii.Error, "Incorrect padding"):
+            decode_base64_file("c29tZSBmaWxlIGNvbnRlbnQ", "file.bin")
+
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=2 ** 10)
+    def test_decode_small_file_in_memory(self):
+        file = decode_base64_file("c29tZSBmaWxl", "file.bin")
+
+        self.assertFalse(hasattr(file, "temporary_file_path"))
+        self.assertEqual(file.read(), b"some file")
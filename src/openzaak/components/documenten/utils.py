@@ -3,14 +3,16 @@
 import io
 from decimal import Decimal
 from io import BytesIO
-from typing import TypeVar
+from typing import Iterable, Iterator, Optional, TypeVar
 
 from django.conf import settings
 from django.core.files.base import File
 from django.core.files.storage import Storage
-from django.utils.functional import LazyObject
+from django.utils.functional import LazyObject, cached_property
 
+import requests
 from drc_cmis.client_builder import get_cmis_client
+from drc_cmis.connections import get_session
 from drc_cmis.models import Vendor
 from privates.storages import PrivateMediaFileSystemStorage
 
@@ -19,6 +21,47 @@ from privates.storages import PrivateMediaFileSystemStorage
 Cmisdoc = TypeVar("Cmisdoc")
 
 
+def slice_chunks(
+    chunks: Iterable[bytes], start: int = 0, end: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Yield the bytes from ``start`` up to and including ``end`` of the chunked content.
+    """
+    position = 0
+    for chunk in chunks:
+        chunk_start, position = position, position + len(chunk)
+        if position <= start:
+            continue
+        if end is not None and chunk_start > end:
+            return
+        yield chunk[
+            max(start - chunk_start, 0) : None if end is None else end - chunk_start + 1
+        ]
+
+
+class ResponseContent:
+    """
+    Iterator over the chunks of a streamed response.
+
+    Django closes the content of a streaming response when the response is closed,
+    which closes the streamed response as well - also when the content was never
+    read, so the connection is released right away.
+    """
+
+    def __init__(self, response: requests.Response, chunks: Iterator[bytes]):
+        self.response = response
+        self.chunks = chunks
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        return next(self.chunks)
+
+    def close(self) -> None:
+        self.response.close()
+
+
 class CMISStorageFile(File):
     def __init__(self, uuid_version):
         """
@@ -37,9 +80,22 @@ class CMISStorageFile(File):
     @property
     def size(self):
         if not hasattr(self, "_size"):
-            self._size = self._storage.size(self.name)
+            self._size = self.cmis_doc.bestandsomvang
         return self._size
 
+    @cached_property
+    def cmis_doc(self) -> Cmisdoc:
+        return self._storage._get_cmis_doc(self.name)
+
+    def open_content(
+        self, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Return an iterator over the (requested range of the) content, without reading
+        it into memory.
+        """
+        return self._storage.open_content(self.cmis_doc, start=start, end=end)
+
     def read(self, num_bytes=None):
         if not self._is_read:
             self.file = self._storage._read(self.name)
@@ -96,6 +152,49 @@ class CMISStorage(Storage):
         content_bytes = cmis_doc.get_content_stream()
         return content_bytes
 
+    def open_content(
+        self, cmis_doc: Cmisdoc, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Return an iterator over the content of the document, from byte ``start`` up
+        to and including byte ``end``, in chunks of ``DOCUMENTEN_DOWNLOAD_CHUNK_SIZE``.
+
+        With the browser binding, only the requested range is requested from the DMS
+        and streamed. The webservice binding returns the content as a whole in the SOAP
+        response, so there the content is read completely and then sliced.
+        """
+        chunk_size = settings.DOCUMENTEN_DOWNLOAD_CHUNK_SIZE
+
+        if "cmisws" in self.cmis_client.base_url:
+            content = cmis_doc.get_content_stream()
+            return slice_chunks(
+                iter(lambda: content.read(chunk_size), b""), start=start, end=end
+            )
+
+        headers = {}
+        if start or end is not None:
+            headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+        # the request is made right away, so errors are raised before the response
+        # to the client is started
+        response = get_session().get(
+            self.cmis_client.root_folder_url,
+            params={"objectId": cmis_doc.objectId, "cmisaction": "content"},
+            auth=(self.cmis_client.user, self.cmis_client.password),
+            headers=headers,
+            stream=True,
+        )
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+
+        chunks = response.iter_content(chunk_size)
+        # the DMS ignored the range and sends the complete content
+        if response.status_code != 206:
+            chunks = slice_chunks(chunks, start=start, end=end)
+        return ResponseContent(response, chunks)
+
     def size(self, uuid_version: str) -> int:
         cmis_doc = self._get_cmis_doc(uuid_version)
         return cmis_doc.bestandsomvang
@@ -3,7 +3,6 @@
 from urllib.parse import urlparse
 
 from django.conf import settings
-from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from django_filters import filters
@@ -175,7 +174,6 @@ class RolFilter(FilterSet):
 
 class StatusFilter(FilterSet):
     indicatie_laatst_gezette_status = filters.BooleanFilter(
-        method="filter_is_last_status",
         help_text=_(
             "Het gegeven is afleidbaar uit de historie van de attribuutsoort Datum "
             "status gezet van van alle statussen bij de desbetreffende zaak."
@@ -186,19 +184,6 @@ class StatusFilter(FilterSet):
         model = Status
         fields = ("zaak", "statustype", "indicatie_laatst_gezette_status")
 
-    def filter_is_last_status(self, queryset, name, value):
-        if value is True:
-            return queryset.filter(
-                datum_status_gezet=models.F("max_datum_status_gezet")
-            )
-
-        if value is False:
-            return queryset.exclude(
-                datum_status_gezet=models.F("max_datum_status_gezet")
-            )
-
-        return queryset.none()
-
 
 class ResultaatFilter(FilterSet):
     class Meta:
@@ -32,6 +32,7 @@ from vng_api_common.serializers import (
 from vng_api_common.utils import get_help_text
 from vng_api_common.validators import IsImmutableValidator, UntilNowValidator
 
+from openzaak.components.catalogi.cache import PublishedTypeResolver
 from openzaak.components.documenten.api.fields import EnkelvoudigInformatieObjectField
 from openzaak.contrib.verzoeken.validators import verzoek_validator
 from openzaak.utils.api import (
@@ -174,6 +175,9 @@ class ZaakSerializer(
     NestedUpdateMixin,
     serializers.HyperlinkedModelSerializer,
 ):
+    # ⚡️ resolve the URLs of published (zaak)types from the catalogi cache
+    resolver_class = PublishedTypeResolver
+
     eigenschappen = NestedHyperlinkedRelatedField(
         many=True,
         read_only=True,
@@ -504,6 +508,8 @@ class ZaakZoekSerializer(serializers.Serializer):
 
 
 class StatusSerializer(serializers.HyperlinkedModelSerializer):
+    resolver_class = PublishedTypeResolver
+
     class Meta:
         model = Status
         fields = (
@@ -771,6 +777,7 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
 
 
 class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
+    resolver_class = PublishedTypeResolver
     parent_lookup_kwargs = {"zaak_uuid": "zaak__uuid"}
     zaak = serializers.HyperlinkedRelatedField(
         queryset=Zaak.objects.all(),
@@ -841,6 +848,7 @@ class ContactPersoonRolSerializer(GegevensGroepSerializer):
 
 
 class RolSerializer(PolymorphicSerializer):
+    resolver_class = PublishedTypeResolver
     discriminator = Discriminator(
         discriminator_field="betrokkene_type",
         mapping={
@@ -963,6 +971,8 @@ class RolSerializer(PolymorphicSerializer):
 
 
 class ResultaatSerializer(serializers.HyperlinkedModelSerializer):
+    resolver_class = PublishedTypeResolver
+
     class Meta:
         model = Resultaat
         fields = ("url", "uuid", "zaak", "resultaattype", "toelichting")
@@ -13,6 +13,7 @@ from django.utils.translation import ugettext_lazy as _
 
 import jq
 import jsonschema
+from django_loose_fk.virtual_models import ProxyMixin
 from rest_framework import serializers
 from vng_api_common.constants import Archiefstatus
 from vng_api_common.validators import (
@@ -25,6 +26,7 @@ from openzaak.components.documenten.models import (
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
 )
+from openzaak.loaders import prefetch_external_objects
 from openzaak.utils.auth import get_auth
 from openzaak.utils.serializers import get_from_serializer_data_or_instance
 
@@ -158,6 +160,13 @@ class CorrectZaaktypeValidator:
         if not url or not zaak:
             return
 
+        # ⚡️ compare the primary keys of local zaaktypen, rather than loading the
+        # zaaktype of the zaak
+        if not isinstance(url, ProxyMixin) and zaak._zaaktype_id is not None:
+            if url.zaaktype_id != zaak._zaaktype_id:
+                raise serializers.ValidationError(self.message, code=self.code)
+            return
+
         if url.zaaktype != zaak.zaaktype:
             raise serializers.ValidationError(self.message, code=self.code)
 
@@ -243,14 +252,12 @@ class ZaakArchiveIOsArchivedValidator:
     def validate_remote_eios_archived(
         self, attrs: dict, instance: Optional[Zaak], error: serializers.ValidationError
     ):
-        remote_zios = instance.zaakinformatieobject_set.filter(
-            _informatieobject_base_url__isnull=False
+        remote_zios = prefetch_external_objects(
+            instance.zaakinformatieobject_set.filter(
+                _informatieobject_base_url__isnull=False
+            ).select_related("_informatieobject_base_url"),
+            "informatieobject",
         )
-        # This is a very naive approach to load all the remote objects - it happens
-        # sequentially, while futures.concurrent _could_ be used. Let's see first
-        # how performance is in this setup. Because we're looping and exiting as
-        # soon as an error condition is found, we can reduce unnecessary network
-        # calls.
         for zio in remote_zios:
             if zio.informatieobject.status != Statussen.gearchiveerd:
                 raise error
@@ -299,8 +306,11 @@ class EndStatusIOsUnlockedValidator:
         if local_zios.exclude(_informatieobject__lock="").exists():
             raise serializers.ValidationError(self.message, code=self.code)
 
-        remote_zios = zaak.zaakinformatieobject_set.filter(
-            _informatieobject_base_url__isnull=False
+        remote_zios = prefetch_external_objects(
+            zaak.zaakinformatieobject_set.filter(
+                _informatieobject_base_url__isnull=False
+            ).select_related("_informatieobject_base_url"),
+            "informatieobject",
         )
         for zio in remote_zios:
             if zio.informatieobject.locked:
@@ -353,8 +363,11 @@ class EndStatusIOsIndicatieGebruiksrechtValidator:
             raise serializers.ValidationError(self.message, self.code)
 
     def validate_remote_eios_indicatie_set(self, zaak: Zaak):
-        remote_zios = zaak.zaakinformatieobject_set.filter(
-            _informatieobject_base_url__isnull=False
+        remote_zios = prefetch_external_objects(
+            zaak.zaakinformatieobject_set.filter(
+                _informatieobject_base_url__isnull=False
+            ).select_related("_informatieobject_base_url"),
+            "informatieobject",
         )
         for zio in remote_zios:
             if zio.informatieobject.indicatie_gebruiksrecht is None:
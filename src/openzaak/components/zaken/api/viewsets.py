@@ -9,11 +9,6 @@ from django.shortcuts import get_object_or_404
 from django.utils.translation import ugettext_lazy as _
 
 from django_loose_fk.virtual_models import ProxyMixin
-from notifications_api_common.viewsets import (
-    NotificationCreateMixin,
-    NotificationDestroyMixin,
-    NotificationViewSetMixin,
-)
 from rest_framework import mixins, serializers, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
@@ -33,13 +28,24 @@ from vng_api_common.utils import lookup_kwargs_to_filters
 from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
 from zgw_consumers.models import Service
 
+from openzaak.notifications.viewsets import (
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationViewSetMixin,
+)
 from openzaak.utils.api import (
     delete_remote_objectcontactmoment,
     delete_remote_objectverzoek,
     delete_remote_oio,
 )
+from openzaak.utils.bulk import BulkCreateMixin, BulkReadMixin
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
-from openzaak.utils.pagination import OptimizedPagination
+from openzaak.utils.pagination import (
+    CursorPaginationMixin,
+    OptimizedCursorPagination,
+    OptimizedPagination,
+    StreamingListMixin,
+)
 from openzaak.utils.permissions import AuthRequired
 
 from ..models import (
@@ -105,8 +111,10 @@ class ZaakViewSet(
     NotificationViewSetMixin,
     AuditTrailViewsetMixin,
     GeoMixin,
-    SearchMixin,
+    CursorPaginationMixin,
     CheckQueryParamsMixin,
+    StreamingListMixin,
+    SearchMixin,
     ListFilterByAuthorizationsMixin,
     viewsets.ModelViewSet,
 ):
@@ -218,7 +226,7 @@ class ZaakViewSet(
     """
 
     queryset = (
-        Zaak.objects.select_related("_zaaktype")
+        Zaak.objects.select_related("_zaaktype", "_zaaktype_base_url")
         .prefetch_related(
             "deelzaken",
             models.Prefetch(
@@ -243,7 +251,7 @@ class ZaakViewSet(
     filter_backends = (Backend,)
     filterset_class = ZaakFilter
     lookup_field = "uuid"
-    pagination_class = OptimizedPagination
+    pagination_class = OptimizedCursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     required_scopes = {
@@ -386,9 +394,12 @@ class ZaakViewSet(
 
 @conditional_retrieve()
 class StatusViewSet(
+    BulkReadMixin,
     NotificationCreateMixin,
     AuditTrailCreateMixin,
+    CursorPaginationMixin,
     CheckQueryParamsMixin,
+    StreamingListMixin,
     ListFilterByAuthorizationsMixin,
     mixins.CreateModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -423,20 +434,23 @@ class StatusViewSet(
     """
 
     queryset = (
-        Status.objects.select_related("_statustype", "zaak", "gezetdoor")
-        .annotate_with_max_datum_status_gezet()
+        Status.objects.select_related(
+            "_statustype", "_statustype_base_url", "zaak", "gezetdoor"
+        )
+        .prefetch_related("zaakinformatieobjecten")
         .order_by("-datum_status_gezet", "-pk")
     )
     serializer_class = StatusSerializer
     filterset_class = StatusFilter
     lookup_field = "uuid"
-    pagination_class = OptimizedPagination
+    pagination_class = OptimizedCursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
     required_scopes = {
         "list": SCOPE_ZAKEN_ALLES_LEZEN,
         "retrieve": SCOPE_ZAKEN_ALLES_LEZEN,
+        "_bulk_read": SCOPE_ZAKEN_ALLES_LEZEN,
         "create": SCOPE_ZAKEN_CREATE
         | SCOPE_STATUSSEN_TOEVOEGEN
         | SCOPEN_ZAKEN_HEROPENEN,
@@ -486,6 +500,7 @@ class StatusViewSet(
 
 
 class ZaakObjectViewSet(
+    BulkCreateMixin,
     CheckQueryParamsMixin,
     NotificationViewSetMixin,
     ListFilterByAuthorizationsMixin,
@@ -557,6 +572,9 @@ class ZaakObjectViewSet(
         "create": SCOPE_ZAKEN_CREATE
         | SCOPE_ZAKEN_BIJWERKEN
         | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
+        "_bulk_create": SCOPE_ZAKEN_CREATE
+        | SCOPE_ZAKEN_BIJWERKEN
+        | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "partial_update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "destroy": SCOPE_ZAKEN_BIJWERKEN
@@ -639,7 +657,9 @@ class ZaakInformatieObjectViewSet(
     """
 
     queryset = (
-        ZaakInformatieObject.objects.select_related("zaak", "_informatieobject")
+        ZaakInformatieObject.objects.select_related(
+            "zaak", "status", "_informatieobject", "_informatieobject_base_url"
+        )
         .prefetch_related("_informatieobject__enkelvoudiginformatieobject_set")
         .order_by("-pk")
     )
@@ -701,6 +721,7 @@ class ZaakInformatieObjectViewSet(
 
 @conditional_retrieve()
 class ZaakEigenschapViewSet(
+    BulkCreateMixin,
     NotificationViewSetMixin,
     AuditTrailCreateMixin,
     NestedViewSetMixin,
@@ -743,9 +764,9 @@ class ZaakEigenschapViewSet(
     Verwijder een ZAAKEIGENSCHAP.
     """
 
-    queryset = ZaakEigenschap.objects.select_related("zaak", "_eigenschap").order_by(
-        "-pk"
-    )
+    queryset = ZaakEigenschap.objects.select_related(
+        "zaak", "_eigenschap", "_eigenschap_base_url"
+    ).order_by("-pk")
     serializer_class = ZaakEigenschapSerializer
     permission_classes = (ZaakNestedAuthRequired,)
     lookup_field = "uuid"
@@ -753,6 +774,7 @@ class ZaakEigenschapViewSet(
         "list": SCOPE_ZAKEN_ALLES_LEZEN,
         "retrieve": SCOPE_ZAKEN_ALLES_LEZEN,
         "create": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
+        "_bulk_create": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "destroy": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "partial_update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
@@ -838,6 +860,7 @@ class KlantContactViewSet(
 
 @conditional_retrieve()
 class RolViewSet(
+    BulkCreateMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
@@ -875,13 +898,14 @@ class RolViewSet(
     """
 
     queryset = (
-        Rol.objects.select_related("_roltype", "zaak")
+        Rol.objects.select_related("_roltype", "_roltype_base_url", "zaak")
         .prefetch_related(
             "natuurlijkpersoon",
             "nietnatuurlijkpersoon",
             "vestiging",
             "organisatorischeeenheid",
             "medewerker",
+            "statussen",
         )
         .order_by("-pk")
     )
@@ -896,6 +920,7 @@ class RolViewSet(
         "list": SCOPE_ZAKEN_ALLES_LEZEN,
         "retrieve": SCOPE_ZAKEN_ALLES_LEZEN,
         "create": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
+        "_bulk_create": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "destroy": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
     }
     notifications_kanaal = KANAAL_ZAKEN
@@ -904,6 +929,7 @@ class RolViewSet(
 
 @conditional_retrieve()
 class ResultaatViewSet(
+    BulkReadMixin,
     NotificationViewSetMixin,
     AuditTrailViewsetMixin,
     CheckQueryParamsMixin,
@@ -952,9 +978,9 @@ class ResultaatViewSet(
 
     """
 
-    queryset = Resultaat.objects.select_related("_resultaattype", "zaak").order_by(
-        "-pk"
-    )
+    queryset = Resultaat.objects.select_related(
+        "_resultaattype", "_resultaattype_base_url", "zaak"
+    ).order_by("-pk")
     serializer_class = ResultaatSerializer
     filterset_class = ResultaatFilter
     lookup_field = "uuid"
@@ -965,6 +991,7 @@ class ResultaatViewSet(
     required_scopes = {
         "list": SCOPE_ZAKEN_ALLES_LEZEN,
         "retrieve": SCOPE_ZAKEN_ALLES_LEZEN,
+        "_bulk_read": SCOPE_ZAKEN_ALLES_LEZEN,
         "create": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "destroy": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
@@ -1037,7 +1064,9 @@ class ZaakBesluitViewSet(
     daarom is dit endpoint in de Zaken API geimplementeerd.
     """
 
-    queryset = ZaakBesluit.objects.order_by("-pk")
+    queryset = ZaakBesluit.objects.select_related(
+        "_besluit", "_besluit_base_url"
+    ).order_by("-pk")
     serializer_class = ZaakBesluitSerializer
     lookup_field = "uuid"
     parent_retrieve_kwargs = {"zaak_uuid": "uuid"}
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+# Generated by Django 3.2.18 on 2023-09-12 09:40
+
+from django.db import migrations, models
+
+FLAG_LATEST_STATUSSEN = """
+UPDATE zaken_status SET indicatie_laatst_gezette_status = true
+WHERE id IN (
+    SELECT DISTINCT ON (zaak_id) id
+    FROM zaken_status
+    ORDER BY zaak_id, datum_status_gezet DESC
+)
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zaken", "0027_auto_20230830_1358"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="status",
+            name="indicatie_laatst_gezette_status",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                help_text="Geeft aan of dit de meest recente status van de zaak is. Wordt bijgewerkt bij het aanmaken en verwijderen van statussen.",
+                verbose_name="indicatie laatst gezette status",
+            ),
+        ),
+        migrations.RunSQL(FLAG_LATEST_STATUSSEN, reverse_sql=migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name="status",
+            index=models.Index(
+                condition=models.Q(indicatie_laatst_gezette_status=True),
+                fields=["datum_status_gezet", "id"],
+                name="status_laatst_gezet_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+# Generated by Django 3.2.18 on 2023-09-19 14:02
+
+from django.db import migrations, models
+
+import vng_api_common.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zaken", "0028_status_indicatie_laatst_gezette_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ZaakIdentificatieCounter",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bronorganisatie", vng_api_common.fields.RSINField(max_length=9),),
+                ("year", models.PositiveSmallIntegerField(verbose_name="year")),
+                (
+                    "value",
+                    models.PositiveIntegerField(default=0, verbose_name="value"),
+                ),
+            ],
+            options={
+                "verbose_name": "zaak identification counter",
+                "verbose_name_plural": "zaak identification counters",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="zaakidentificatiecounter",
+            constraint=models.UniqueConstraint(
+                fields=("bronorganisatie", "year"), name="unique_bronorganisatie_year"
+            ),
+        ),
+    ]
@@ -2,19 +2,29 @@
 # Copyright (C) 2022 Open Zaak maintainers
 from datetime import date
 
-from django.db import models
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
 from django.utils.translation import gettext_lazy as _
 
 from vng_api_common.fields import RSINField
 from vng_api_common.utils import generate_unique_identification
 
-from openzaak.utils.db import pg_advisory_lock
+from openzaak.utils.constants import IdentificatieGenerators
+from openzaak.utils.db import increment_counter, pg_advisory_lock, raise_counter
 
 LOCK_ID_IDENTIFICATION_GENERATION = "generate-zaak-identification"
 
 
 class ZaakIdentificatieManager(models.Manager):
     def generate(self, organisation: str, date: date):
+        """
+        Generate an identification with the configured generator.
+        """
+        if settings.ZAAK_IDENTIFICATIE_GENERATOR == IdentificatieGenerators.counter:
+            return self.generate_with_counter(organisation, date)
+        return self.generate_with_lock(organisation, date)
+
+    def generate_with_lock(self, organisation: str, date: date):
         """
         Generate an identification based on existing data.
 
@@ -40,6 +50,43 @@ class ZaakIdentificatieManager(models.Manager):
                 identificatie=identification, bronorganisatie=organisation
             )
 
+    def generate_with_counter(self, organisation: str, date: date):
+        """
+        Generate an identification from a counter per organisation and year.
+
+        Only the counter row of the organisation and year is locked until the
+        transaction exits, so identifications for different organisations are
+        generated in parallel. The numbers are unique per organisation rather than
+        globally. Numbers that were assigned explicitly are skipped.
+        """
+        prefix = f"{self.model.IDENTIFICATIE_PREFIX}-{date.year}"
+        key = {"bronorganisatie": organisation, "year": date.year}
+
+        def get_last_number() -> int:
+            max_id = self.filter(
+                bronorganisatie=organisation,
+                identificatie__startswith=prefix,
+                identificatie__regex=prefix + r"-\d{10}",
+            ).aggregate(models.Max("identificatie"))["identificatie__max"]
+            return int(max_id.split("-")[-1]) if max_id is not None else 0
+
+        with transaction.atomic():
+            number = increment_counter(ZaakIdentificatieCounter, key, get_last_number)
+            while True:
+                try:
+                    with transaction.atomic():
+                        return self.create(
+                            identificatie=f"{prefix}-{number:010d}",
+                            bronorganisatie=organisation,
+                        )
+                except IntegrityError:
+                    # the number was assigned explicitly, continue after the
+                    # highest number in use
+                    raise_counter(ZaakIdentificatieCounter, key, get_last_number())
+                    number = increment_counter(
+                        ZaakIdentificatieCounter, key, get_last_number
+                    )
+
 
 class ZaakIdentificatie(models.Model):
     """
@@ -89,3 +136,25 @@ class ZaakIdentificatie(models.Model):
         return _("{identification} ({organisation})").format(
             identification=self.identificatie, organisation=self.bronorganisatie,
         )
+
+
+class ZaakIdentificatieCounter(models.Model):
+    """
+    Last generated identification number per organisation and year.
+    """
+
+    bronorganisatie = RSINField()
+    year = models.PositiveSmallIntegerField(_("year"))
+    value = models.PositiveIntegerField(_("value"), default=0)
+
+    class Meta:
+        verbose_name = _("zaak identification counter")
+        verbose_name_plural = _("zaak identification counters")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("bronorganisatie", "year"), name="unique_bronorganisatie_year",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.bronorganisatie} {self.year}: {self.value}"
@@ -585,6 +585,15 @@ class Status(ETagMixin, models.Model):
     datum_status_gezet = models.DateTimeField(
         db_index=True, help_text="De datum waarop de ZAAK de status heeft verkregen."
     )
+    indicatie_laatst_gezette_status = models.BooleanField(
+        _("indicatie laatst gezette status"),
+        default=False,
+        editable=False,
+        help_text=_(
+            "Geeft aan of dit de meest recente status van de zaak is. Wordt bijgewerkt "
+            "bij het aanmaken en verwijderen van statussen."
+        ),
+    )
     statustoelichting = models.TextField(
         max_length=1000,
         blank=True,
@@ -611,20 +620,30 @@ class Status(ETagMixin, models.Model):
         verbose_name_plural = "statussen"
         unique_together = ("zaak", "datum_status_gezet")
         ordering = ("-datum_status_gezet",)  # most recent first
+        indexes = [
+            models.Index(
+                fields=["datum_status_gezet", "id"],
+                condition=models.Q(indicatie_laatst_gezette_status=True),
+                name="status_laatst_gezet_idx",
+            )
+        ]
 
     def __str__(self):
         return "Status op {}".format(self.datum_status_gezet)
 
-    def unique_representation(self):
-        return f"({self.zaak.unique_representation()}) - {self.datum_status_gezet}"
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
 
-    @property
-    def indicatie_laatst_gezette_status(self) -> bool:
-        """⚡️ use annotated field when possible """
-        if hasattr(self, "max_datum_status_gezet"):
-            return self.max_datum_status_gezet == self.datum_status_gezet
+        latest_pk = Status.objects.update_indicatie_laatst_gezette_status(self.zaak_id)
+        self.indicatie_laatst_gezette_status = latest_pk == self.pk
 
-        return self.zaak.current_status_uuid == self.uuid
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        Status.objects.update_indicatie_laatst_gezette_status(self.zaak_id)
+        return result
+
+    def unique_representation(self):
+        return f"({self.zaak.unique_representation()}) - {self.datum_status_gezet}"
 
 
 class Resultaat(ETagMixin, models.Model):
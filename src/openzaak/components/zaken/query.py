@@ -1,9 +1,9 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 
 from django_loose_fk.virtual_models import ProxyMixin
 
@@ -50,18 +50,30 @@ class ZaakRelatedQuerySet(ZaakAuthorizationsFilterMixin, models.QuerySet):
 
 
 class StatusQuerySet(ZaakRelatedQuerySet):
-    def annotate_with_max_datum_status_gezet(self):
+    def update_indicatie_laatst_gezette_status(self, zaak_id: int) -> Optional[int]:
         """
-        add `max_datum_status_gezet` of all statuses grouped by zaak
+        Flag the most recent status of the zaak as the last set status.
+
+        Returns the primary key of this status, if the zaak has any statuses.
         """
-        grouped_statussen = (
-            self.filter(zaak=models.OuterRef("zaak"))
-            .order_by()
-            .values("zaak")
-            .annotate(max_datum_status_gezet=models.Max("datum_status_gezet"))
-            .values("max_datum_status_gezet")
-        )
-        return self.annotate(max_datum_status_gezet=models.Subquery(grouped_statussen))
+        zaak_model = self.model._meta.get_field("zaak").related_model
+        with transaction.atomic():
+            # serialize concurrent changes to the statuses of the same zaak
+            list(zaak_model.objects.select_for_update().filter(pk=zaak_id).values("pk"))
+
+            statussen = self.model.objects.filter(zaak_id=zaak_id)
+            latest_pk = (
+                statussen.order_by("-datum_status_gezet")
+                .values_list("pk", flat=True)
+                .first()
+            )
+            statussen.filter(indicatie_laatst_gezette_status=True).exclude(
+                pk=latest_pk
+            ).update(indicatie_laatst_gezette_status=False)
+            statussen.filter(
+                pk=latest_pk, indicatie_laatst_gezette_status=False
+            ).update(indicatie_laatst_gezette_status=True)
+        return latest_pk
 
 
 class ZaakInformatieObjectQuerySet(BlockChangeMixin, ZaakRelatedQuerySet):
@@ -9,12 +9,17 @@ from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.audittrails.models import AuditTrail
-from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.constants import (
+    RolOmschrijving,
+    RolTypes,
+    VertrouwelijkheidsAanduiding,
+)
 from vng_api_common.tests import reverse
 from vng_api_common.utils import get_uuid_from_path
 
 from openzaak.components.catalogi.tests.factories import (
     ResultaatTypeFactory,
+    RolTypeFactory,
     ZaakTypeFactory,
     ZaakTypeInformatieObjectTypeFactory,
 )
@@ -279,6 +284,54 @@ class AuditTrailTests(JWTAuthMixin, APITestCase):
         self.assertEqual(audittrail.hoofd_object, f"http://testserver{zaak_url}")
         self.assertEqual(audittrail.resource_url, f"http://testserver{rol_url}")
 
+    def test_bulk_create_audittrail_matches_create(self):
+        zaak = ZaakFactory.create()
+        roltype = RolTypeFactory.create(
+            zaaktype=zaak.zaaktype, omschrijving_generiek=RolOmschrijving.adviseur
+        )
+        data = {
+            "zaak": f"http://testserver{reverse(zaak)}",
+            "betrokkene": "https://example.com/api/betrokkene/1",
+            "betrokkeneType": RolTypes.natuurlijk_persoon,
+            "roltype": f"http://testserver{reverse(roltype)}",
+            "roltoelichting": "audit",
+        }
+        headers = {"HTTP_X_AUDIT_TOELICHTING": "bulk", "HTTP_X_NLX_LOGRECORD_ID": "1"}
+
+        response = self.client.post(reverse("rol-list"), data, **headers)
+        bulk_response = self.client.post(reverse("rol--bulk-create"), [data], **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(bulk_response.status_code, status.HTTP_201_CREATED)
+        create_audittrail = AuditTrail.objects.get(resource_url=response.data["url"])
+        bulk_create_audittrail = AuditTrail.objects.get(
+            resource_url=bulk_response.data[0]["url"]
+        )
+        # the bulk create builds the audit trails itself, check that it matches the
+        # audit trail of a regular create
+        for field in AuditTrail._meta.concrete_fields:
+            if field.name in ("id", "uuid", "aanmaakdatum", "resource_url", "nieuw"):
+                continue
+            with self.subTest(field=field.name):
+                self.assertEqual(
+                    getattr(bulk_create_audittrail, field.name),
+                    getattr(create_audittrail, field.name),
+                )
+
+        self.assertEqual(bulk_create_audittrail.nieuw, bulk_response.data[0])
+        self.assertEqual(
+            {
+                key: value
+                for key, value in bulk_create_audittrail.nieuw.items()
+                if key not in ("url", "uuid")
+            },
+            {
+                key: value
+                for key, value in create_audittrail.nieuw.items()
+                if key not in ("url", "uuid")
+            },
+        )
+
 
 class ZaakAuditTrailJWTExpiryTests(JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
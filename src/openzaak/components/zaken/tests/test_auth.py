@@ -242,6 +242,42 @@ class ZaakListPerformanceTests(JWTAuthMixin, APITestCase):
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
                 self.assertEqual(response.data["count"], 1)
 
+    @override_settings(ALLOWED_HOSTS=["example.com", "testserver"])
+    def test_zaak_list_compiled_authorizations_are_cached(self):
+        zaaktype1, zaaktype2 = ZaakTypeFactory.create_batch(2, concept=False)
+        ZaakFactory.create(zaaktype=zaaktype1)
+        ZaakFactory.create(zaaktype=zaaktype2)
+        Autorisatie.objects.create(
+            applicatie=self.applicatie,
+            component=self.component,
+            scopes=self.scopes,
+            zaaktype=f"http://testserver{reverse(zaaktype1)}",
+            max_vertrouwelijkheidaanduiding=self.max_vertrouwelijkheidaanduiding,
+        )
+        # warm up the cache
+        self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        with patch("openzaak.utils.query.get_resources_for_paths") as mock_resolve:
+            response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        mock_resolve.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+
+        with self.subTest("invalidated after authorization change"):
+            Autorisatie.objects.create(
+                applicatie=self.applicatie,
+                component=self.component,
+                scopes=self.scopes,
+                zaaktype=f"http://testserver{reverse(zaaktype2)}",
+                max_vertrouwelijkheidaanduiding=self.max_vertrouwelijkheidaanduiding,
+            )
+
+            response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data["count"], 2)
+
 
 class StatusReadTests(JWTAuthMixin, APITestCase):
     scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
@@ -279,6 +315,41 @@ class StatusReadTests(JWTAuthMixin, APITestCase):
             response_data[0]["url"], f"http://testserver{reverse(status1)}"
         )
 
+    def test_bulk_read_statussen_limited_to_authorized_zaken(self):
+        url = reverse("status--bulk-read")
+        # must show up
+        status1 = StatusFactory.create(
+            zaak__zaaktype=self.zaaktype,
+            zaak__vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        # must not show up
+        status2 = StatusFactory.create(
+            zaak__zaaktype=self.zaaktype,
+            zaak__vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.vertrouwelijk,
+        )
+        # must not show up
+        status3 = StatusFactory.create(
+            zaak__vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        response = self.client.post(
+            url,
+            {
+                "urls": [
+                    f"http://testserver{reverse(status1)}",
+                    f"http://testserver{reverse(status2)}",
+                    str(status3.uuid),
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(len(response_data), 1)
+        self.assertEqual(
+            response_data[0]["url"], f"http://testserver{reverse(status1)}"
+        )
+
 
 class ResultaatTests(JWTAuthMixin, APITestCase):
     scopes = [SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_BIJWERKEN]
@@ -7,7 +7,7 @@ from datetime import date
 from unittest.mock import patch
 
 from django.db import close_old_connections, transaction
-from django.test import override_settings, tag
+from django.test import TestCase, override_settings, tag
 
 from freezegun import freeze_time
 from rest_framework import status
@@ -22,6 +22,7 @@ from vng_api_common.tests import get_validation_errors, reverse
 from vng_api_common.utils import generate_unique_identification
 from zds_client.oas import schema_fetcher
 
+from openzaak.components.catalogi.cache import get_zaaktype_graph
 from openzaak.components.catalogi.tests.factories import (
     RolTypeFactory,
     StatusTypeFactory,
@@ -29,6 +30,7 @@ from openzaak.components.catalogi.tests.factories import (
 )
 from openzaak.notifications.tests.mixins import NotificationsConfigMixin
 from openzaak.tests.utils import ClearCachesMixin, JWTAuthMixin
+from openzaak.utils.constants import IdentificatieGenerators
 
 from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_CREATE
 from ..api.viewsets import ZaakViewSet
@@ -37,6 +39,7 @@ from .factories import ZaakFactory
 from .utils import ZAAK_WRITE_KWARGS, get_operation_url, isodatetime
 
 VERANTWOORDELIJKE_ORGANISATIE = "517439943"
+OTHER_ORGANISATIE = "111222333"
 OBJECT_MET_ADRES = f"https://example.com/orc/api/v1/objecten/{uuid.uuid4().hex}"
 # Stadsdeel is een WijkObject in het RSGB
 STADSDEEL = f"https://example.com/rsgb/api/v1/wijkobjecten/{uuid.uuid4().hex}"
@@ -475,6 +478,98 @@ class CreateZaakTransactionTests(JWTAuthMixin, APITransactionTestCase):
         self.assertEqual(zaken.filter(identificatie=next_identification).count(), 1)
 
 
+@override_settings(ZAAK_IDENTIFICATIE_GENERATOR=IdentificatieGenerators.counter)
+class ZaakIdentificatieCounterTests(TestCase):
+    def test_numbers_per_organisation_and_year(self):
+        generate = ZaakIdentificatie.objects.generate
+
+        identifications = [
+            generate(VERANTWOORDELIJKE_ORGANISATIE, date(2022, 12, 12)),
+            generate(VERANTWOORDELIJKE_ORGANISATIE, date(2022, 12, 12)),
+            generate(OTHER_ORGANISATIE, date(2022, 12, 12)),
+            generate(VERANTWOORDELIJKE_ORGANISATIE, date(2023, 1, 1)),
+        ]
+
+        self.assertEqual(
+            [identification.identificatie for identification in identifications],
+            [
+                "ZAAK-2022-0000000001",
+                "ZAAK-2022-0000000002",
+                "ZAAK-2022-0000000001",
+                "ZAAK-2023-0000000001",
+            ],
+        )
+
+    def test_continue_after_existing_identifications(self):
+        ZaakIdentificatie.objects.create(
+            identificatie="ZAAK-2022-0000000005",
+            bronorganisatie=VERANTWOORDELIJKE_ORGANISATIE,
+        )
+
+        identification = ZaakIdentificatie.objects.generate(
+            VERANTWOORDELIJKE_ORGANISATIE, date(2022, 12, 12)
+        )
+
+        self.assertEqual(identification.identificatie, "ZAAK-2022-0000000006")
+
+    def test_skip_explicitly_assigned_identifications(self):
+        ZaakIdentificatie.objects.generate(
+            VERANTWOORDELIJKE_ORGANISATIE, date(2022, 12, 12)
+        )
+        ZaakIdentificatie.objects.create(
+            identificatie="ZAAK-2022-0000000002",
+            bronorganisatie=VERANTWOORDELIJKE_ORGANISATIE,
+        )
+        ZaakIdentificatie.objects.create(
+            identificatie="ZAAK-2022-0000000004",
+            bronorganisatie=VERANTWOORDELIJKE_ORGANISATIE,
+        )
+
+        identification = ZaakIdentificatie.objects.generate(
+            VERANTWOORDELIJKE_ORGANISATIE, date(2022, 12, 12)
+        )
+
+        self.assertEqual(identification.identificatie, "ZAAK-2022-0000000005")
+
+
+@override_settings(ZAAK_IDENTIFICATIE_GENERATOR=IdentificatieGenerators.counter)
+class ZaakIdentificatieCounterTransactionTests(APITransactionTestCase):
+    def test_concurrent_generation(self):
+        def generate(organisation):
+            try:
+                with transaction.atomic():
+                    ZaakIdentificatie.objects.generate(organisation, date(2022, 12, 12))
+                    time.sleep(0.1)
+            finally:
+                close_old_connections()
+
+        threads = [
+            threading.Thread(target=generate, args=(organisation,))
+            for organisation in (
+                VERANTWOORDELIJKE_ORGANISATIE,
+                VERANTWOORDELIJKE_ORGANISATIE,
+                OTHER_ORGANISATIE,
+            )
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            sorted(
+                ZaakIdentificatie.objects.values_list(
+                    "bronorganisatie", "identificatie"
+                )
+            ),
+            [
+                (OTHER_ORGANISATIE, "ZAAK-2022-0000000001"),
+                (VERANTWOORDELIJKE_ORGANISATIE, "ZAAK-2022-0000000001"),
+                (VERANTWOORDELIJKE_ORGANISATIE, "ZAAK-2022-0000000002"),
+            ],
+        )
+
+
 @tag("performance")
 class PerformanceTests(
     NotificationsConfigMixin, JWTAuthMixin, ClearCachesMixin, APITestCase
@@ -519,32 +614,69 @@ class PerformanceTests(
             15: release savepoint (commit zaakidentificatie transaction)
 
             16: savepoint for zaak creation
-         17-18: Lookup zaaktype for validation and cache it in serializer context
-         19-22: Check feature flag config (PublishValidator) (savepoint, select, insert
+         17-21: Lookup the published zaaktype with its statustypen, roltypen,
+                resultaattypen and eigenschappen, and cache them (catalogi.cache). The
+                field validation (loose_fk.drf.FKOrURLField.run_validation) uses the
+                cached zaaktype.
+         22-25: Check feature flag config (PublishValidator) (savepoint, select, insert
                 and savepoint release)
-            23: Lookup zaaktype (again), done by loose_fk.drf.FKOrURLField.run_validation
-            24: update zaakidentificatie record (from serializer context and earlier
+            26: update zaakidentificatie record (from serializer context and earlier
                 generation)
-            25: insert zaken_zaak record
-         26-31: query related objects for etag update that may be affected (should be
+            27: insert zaken_zaak record
+         28-33: query related objects for etag update that may be affected (should be
                 skipped, it's create of root resource!) vng_api_common.caching.signals
-            32: select zaak relevantezaakrelatie (nested inline create, can't avoid this)
-            33: select zaak rollen
-            34: select zaak zaakinformatieobjecten
-            35: select zaak zaakobjecten
-            36: select zaak kenmerken (nested inline create, can't avoid this)
-            37: insert audit trail
-         38-39: notifications, select created zaak (?), notifs config
-            40: release savepoint (from NotificationsCreateMixin)
-            41: savepoint create transaction.on_commit ETag handler (start new transaction)
-            42: update ETag column of zaak
-            43: release savepoint (commit transaction)
+            34: select zaak relevantezaakrelatie (nested inline create, can't avoid this)
+            35: select zaak rollen
+            36: select zaak zaakinformatieobjecten
+            37: select zaak zaakobjecten
+            38: select zaak kenmerken (nested inline create, can't avoid this)
+            39: insert audit trail
+         40-41: notifications, select created zaak (?), notifs config
+            42: release savepoint (from NotificationsCreateMixin)
+            43: savepoint create transaction.on_commit ETag handler (start new transaction)
+            44: update ETag column of zaak
+            45: release savepoint (commit transaction)
+
+        With the zaaktype already cached, queries 17-21 are skipped, see
+        ``test_create_zaak_local_zaaktype_cached``.
         """
         # create a random zaak to get some other initial setup queries out of the way
         # (most notable figuring out the PG/postgres version)
         ZaakFactory.create()
 
-        EXPECTED_NUM_QUERIES = 43
+        EXPECTED_NUM_QUERIES = 45
+
+        zaaktype_url = reverse(self.zaaktype)
+        url = get_operation_url("zaak_create")
+        data = {
+            "zaaktype": f"http://testserver{zaaktype_url}",
+            "bronorganisatie": VERANTWOORDELIJKE_ORGANISATIE,
+            "verantwoordelijkeOrganisatie": VERANTWOORDELIJKE_ORGANISATIE,
+            "registratiedatum": "2018-06-11",
+            "startdatum": "2018-06-11",
+        }
+
+        with self.assertNumQueries(EXPECTED_NUM_QUERIES):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(url, data, **ZAAK_WRITE_KWARGS)
+
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            mock_notif.assert_called_once()
+
+    @override_settings(NOTIFICATIONS_DISABLED=False)
+    @patch("notifications_api_common.viewsets.send_notification.delay")
+    def test_create_zaak_local_zaaktype_cached(self, mock_notif):
+        """
+        Assert that creating a zaak with a cached zaaktype skips the zaaktype lookup.
+
+        The queries are the same as in ``test_create_zaak_local_zaaktype``, without
+        the lookup of the published zaaktype with its types (queries 17-21).
+        """
+        ZaakFactory.create()
+        # cache the zaaktype, like a create of an earlier zaak does
+        get_zaaktype_graph(str(self.zaaktype.uuid))
+
+        EXPECTED_NUM_QUERIES = 40
 
         zaaktype_url = reverse(self.zaaktype)
         url = get_operation_url("zaak_create")
@@ -18,6 +18,8 @@ from vng_api_common.authorizations.models import Applicatie
 from vng_api_common.constants import (
     Archiefnominatie,
     BrondatumArchiefprocedureAfleidingswijze as Afleidingswijze,
+    RolOmschrijving,
+    RolTypes,
     VertrouwelijkheidsAanduiding,
 )
 from vng_api_common.models import JWTSecret
@@ -167,6 +169,85 @@ class SendNotifTestCase(NotificationsConfigMixin, JWTAuthMixin, APITestCase):
             },
         )
 
+    def test_send_notif_bulk_create_zaakobject(self, mock_notif):
+        """
+        Check if notifications will be send for every bulk created zaakobject
+        """
+        zaak = ZaakFactory.create()
+        zaak_url = get_operation_url("zaak_read", uuid=zaak.uuid)
+        data = {
+            "zaak": f"http://testserver{zaak_url}",
+            "objectType": "buurt",
+            "objectIdentificatie": {
+                "buurtCode": "aa",
+                "buurtNaam": "bb",
+                "gemGemeenteCode": "cc",
+                "wykWijkCode": "dd",
+            },
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("zaakobject--bulk-create"), [data, data]
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(mock_notif.call_count, 2)
+        for zaakobject, (args, kwargs) in zip(
+            response.json(), mock_notif.call_args_list
+        ):
+            with self.subTest(zaakobject=zaakobject["url"]):
+                self.assertEqual(
+                    args[0],
+                    {
+                        "kanaal": "zaken",
+                        "hoofdObject": f"http://testserver{zaak_url}",
+                        "resource": "zaakobject",
+                        "resourceUrl": zaakobject["url"],
+                        "actie": "create",
+                        "aanmaakdatum": "2012-01-14T00:00:00Z",
+                        "kenmerken": {
+                            "bronorganisatie": zaak.bronorganisatie,
+                            "zaaktype": f"http://testserver{reverse(zaak.zaaktype)}",
+                            "vertrouwelijkheidaanduiding": zaak.vertrouwelijkheidaanduiding,
+                        },
+                    },
+                )
+
+    def test_send_notif_bulk_create_matches_create(self, mock_notif):
+        """
+        Check if the notifications of bulk created objects match those of a create
+        """
+        zaak = ZaakFactory.create()
+        roltype = RolTypeFactory.create(
+            zaaktype=zaak.zaaktype, omschrijving_generiek=RolOmschrijving.adviseur
+        )
+        data = {
+            "zaak": f"http://testserver{reverse(zaak)}",
+            "betrokkene": "https://example.com/api/betrokkene/1",
+            "betrokkeneType": RolTypes.natuurlijk_persoon,
+            "roltype": f"http://testserver{reverse(roltype)}",
+            "roltoelichting": "notificatie",
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("rol-list"), data)
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_response = self.client.post(reverse("rol--bulk-create"), [data])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(
+            bulk_response.status_code, status.HTTP_201_CREATED, bulk_response.data
+        )
+        self.assertEqual(mock_notif.call_count, 2)
+        create_message = mock_notif.call_args_list[0][0][0]
+        bulk_create_message = mock_notif.call_args_list[1][0][0]
+        self.assertEqual(create_message["resourceUrl"], response.json()["url"])
+        self.assertEqual(
+            bulk_create_message,
+            {**create_message, "resourceUrl": bulk_response.json()[0]["url"]},
+        )
+
     def test_send_notif_update_zaak_eigenschap(self, mock_notif):
         """
         Check if notifications will be send when zaak-eigenschap is updated
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import RolOmschrijving, RolTypes
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import RolTypeFactory
+from openzaak.tests.utils import JWTAuthMixin, QueryBudget, QueryBudgetMixin
+
+from .factories import (
+    RolFactory,
+    StatusFactory,
+    ZaakFactory,
+    ZaakInformatieObjectFactory,
+)
+from .utils import ZAAK_READ_KWARGS
+
+
+def zaak_list(n: int) -> str:
+    ZaakFactory.create_batch(n)
+    return reverse("zaak-list")
+
+
+def zaak_detail(n: int) -> str:
+    zaak = ZaakFactory.create()
+    RolFactory.create_batch(n, zaak=zaak)
+    StatusFactory.create_batch(n, zaak=zaak)
+    ZaakInformatieObjectFactory.create_batch(n, zaak=zaak)
+    return reverse(zaak)
+
+
+def status_list(n: int) -> str:
+    for status_ in StatusFactory.create_batch(n):
+        ZaakInformatieObjectFactory.create(zaak=status_.zaak, status=status_)
+    return reverse("status-list")
+
+
+def rol_list(n: int) -> str:
+    for rol in RolFactory.create_batch(n):
+        StatusFactory.create(zaak=rol.zaak, gezetdoor=rol)
+    return reverse("rol-list")
+
+
+def zaakinformatieobject_list(n: int) -> str:
+    for status_ in StatusFactory.create_batch(n):
+        ZaakInformatieObjectFactory.create(zaak=status_.zaak, status=status_)
+    return reverse("zaakinformatieobject-list")
+
+
+def rol_create(n: int) -> tuple:
+    zaak = ZaakFactory.create()
+    roltype = RolTypeFactory.create(
+        zaaktype=zaak.zaaktype, omschrijving_generiek=RolOmschrijving.adviseur
+    )
+    RolFactory.create_batch(
+        n, zaak=zaak, roltype=roltype, omschrijving_generiek=RolOmschrijving.adviseur
+    )
+    data = {
+        "zaak": f"http://testserver{reverse(zaak)}",
+        "betrokkene": "https://example.com/api/betrokkene/1",
+        "betrokkeneType": RolTypes.natuurlijk_persoon,
+        "roltype": f"http://testserver{reverse(roltype)}",
+        "roltoelichting": "budget",
+    }
+    return reverse("rol-list"), data
+
+
+class ZakenQueryBudgetTests(JWTAuthMixin, QueryBudgetMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    query_budgets = [
+        QueryBudget("zaak-list", zaak_list, headers=ZAAK_READ_KWARGS),
+        QueryBudget("zaak-detail", zaak_detail, headers=ZAAK_READ_KWARGS),
+        QueryBudget("status-list", status_list),
+        QueryBudget("rol-list", rol_list),
+        QueryBudget("zaakinformatieobject-list", zaakinformatieobject_list),
+        QueryBudget(
+            "rol-list", rol_create, method="post", status_code=status.HTTP_201_CREATED,
+        ),
+    ]
@@ -6,7 +6,8 @@ import requests_mock
 from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.test import APITestCase
-from vng_api_common.constants import RolTypes
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import RolOmschrijving, RolTypes
 from vng_api_common.tests import TypeCheckMixin, get_validation_errors, reverse
 from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
@@ -703,3 +704,76 @@ class RolCreateExternalURLsTests(JWTAuthMixin, APITestCase):
 
         error = get_validation_errors(response, "roltype")
         self.assertEqual(error["code"], "unknown-service")
+
+
+class RolBulkCreateTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse("rol--bulk-create")
+
+    def _get_data(self, zaak, roltype):
+        return {
+            "zaak": f"http://testserver{reverse(zaak)}",
+            "betrokkene": BETROKKENE,
+            "betrokkene_type": RolTypes.natuurlijk_persoon,
+            "roltype": f"http://testserver{reverse(roltype)}",
+            "roltoelichting": "awerw",
+        }
+
+    def test_bulk_create(self):
+        zaak = ZaakFactory.create()
+        roltype1, roltype2 = RolTypeFactory.create_batch(2, zaaktype=zaak.zaaktype)
+
+        response = self.client.post(
+            self.url, [self._get_data(zaak, roltype1), self._get_data(zaak, roltype2)],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(len(response.json()), 2)
+        self.assertEqual(
+            set(Rol.objects.values_list("roltype", flat=True)),
+            {roltype1.pk, roltype2.pk},
+        )
+        self.assertEqual(
+            AuditTrail.objects.filter(
+                resource="rol", hoofd_object=f"http://testserver{reverse(zaak)}"
+            ).count(),
+            2,
+        )
+
+    def test_bulk_create_invalid_object(self):
+        zaak = ZaakFactory.create()
+        roltype = RolTypeFactory.create(zaaktype=zaak.zaaktype)
+        invalid = self._get_data(zaak, roltype)
+        del invalid["betrokkene"]
+
+        response = self.client.post(self.url, [self._get_data(zaak, roltype), invalid])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "1.nonFieldErrors")
+        self.assertEqual(error["code"], "invalid-betrokkene")
+        self.assertFalse(Rol.objects.exists())
+
+    def test_bulk_create_validates_against_preceding_objects(self):
+        zaak = ZaakFactory.create()
+        roltype = RolTypeFactory.create(
+            zaaktype=zaak.zaaktype, omschrijving_generiek=RolOmschrijving.initiator
+        )
+
+        response = self.client.post(
+            self.url, [self._get_data(zaak, roltype), self._get_data(zaak, roltype)]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "1.roltype")
+        self.assertEqual(error["code"], "max-occurences")
+        self.assertFalse(Rol.objects.exists())
+
+    def test_bulk_create_no_array(self):
+        zaak = ZaakFactory.create()
+        roltype = RolTypeFactory.create(zaaktype=zaak.zaaktype)
+
+        response = self.client.post(self.url, self._get_data(zaak, roltype))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "invalid")
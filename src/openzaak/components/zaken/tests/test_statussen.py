@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from django.test import override_settings, tag
 from django.utils import timezone
@@ -344,6 +344,24 @@ class IsLastStatusTests(JWTAuthMixin, APITestCase):
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
                 self.assertTrue(response.json()["indicatieLaatstGezetteStatus"])
 
+    def test_status_set_earlier_is_not_last_status(self):
+        earlier_status = StatusFactory.create(
+            zaak=self.status11.zaak,
+            datum_status_gezet=self.status11.datum_status_gezet - timedelta(days=1),
+        )
+
+        self.assertFalse(earlier_status.indicatie_laatst_gezette_status)
+        self.status12.refresh_from_db()
+        self.assertTrue(self.status12.indicatie_laatst_gezette_status)
+
+    def test_delete_last_status(self):
+        self.status12.delete()
+
+        self.status11.refresh_from_db()
+        self.assertTrue(self.status11.indicatie_laatst_gezette_status)
+        self.status21.refresh_from_db()
+        self.assertFalse(self.status21.indicatie_laatst_gezette_status)
+
     def test_filter_last_status(self):
         url = reverse_lazy("status-list")
 
@@ -13,6 +13,7 @@ import requests_mock
 from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.tests import TypeCheckMixin, get_validation_errors, reverse
 from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
@@ -396,6 +397,71 @@ class ZaakEigenschapCreateExternalURLsTests(JWTAuthMixin, APITestCase):
         self.assertEqual(error["code"], "unknown-service")
 
 
+class ZaakEigenschapBulkCreateTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def _get_data(self, zaak, eigenschap, waarde="ja"):
+        return {
+            "zaak": f"http://testserver{reverse(zaak)}",
+            "eigenschap": f"http://testserver{reverse(eigenschap)}",
+            "waarde": waarde,
+        }
+
+    def test_bulk_create(self):
+        zaak = ZaakFactory.create()
+        eigenschap1, eigenschap2 = EigenschapFactory.create_batch(
+            2, zaaktype=zaak.zaaktype
+        )
+        url = reverse("zaakeigenschap--bulk-create", kwargs={"zaak_uuid": zaak.uuid})
+
+        response = self.client.post(
+            url,
+            [
+                self._get_data(zaak, eigenschap1, "ja"),
+                self._get_data(zaak, eigenschap2, "nee"),
+            ],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(
+            [(item["naam"], item["waarde"]) for item in response.json()],
+            [(eigenschap1.eigenschapnaam, "ja"), (eigenschap2.eigenschapnaam, "nee")],
+        )
+        self.assertEqual(ZaakEigenschap.objects.filter(zaak=zaak).count(), 2)
+        for item in response.json():
+            with self.subTest(zaakeigenschap=item["url"]):
+                self.assertTrue(
+                    item["url"].startswith(
+                        f"http://testserver{reverse(zaak)}/zaakeigenschappen/"
+                    )
+                )
+        self.assertEqual(
+            AuditTrail.objects.filter(
+                resource="zaakeigenschap",
+                hoofd_object=f"http://testserver{reverse(zaak)}",
+            ).count(),
+            2,
+        )
+
+    def test_bulk_create_invalid_object(self):
+        zaak = ZaakFactory.create()
+        eigenschap = EigenschapFactory.create(zaaktype=zaak.zaaktype)
+        other_eigenschap = EigenschapFactory.create()
+        url = reverse("zaakeigenschap--bulk-create", kwargs={"zaak_uuid": zaak.uuid})
+
+        response = self.client.post(
+            url,
+            [self._get_data(zaak, eigenschap), self._get_data(zaak, other_eigenschap),],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "1.nonFieldErrors")
+        self.assertEqual(error["code"], "zaaktype-mismatch")
+        self.assertEqual(len(response.data["invalid_params"]), 1)
+        self.assertFalse(ZaakEigenschap.objects.exists())
+        self.assertFalse(AuditTrail.objects.exists())
+
+
 class ZaakEigenschapJWTExpiryTests(JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
 
@@ -5,8 +5,9 @@ from django.test import override_settings, tag
 import requests_mock
 from rest_framework import status
 from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.constants import ZaakobjectTypes
-from vng_api_common.tests import get_validation_errors
+from vng_api_common.tests import get_validation_errors, reverse
 from zgw_consumers.constants import APITypes, AuthTypes
 from zgw_consumers.models import Service
 
@@ -15,6 +16,7 @@ from openzaak.tests.utils import JWTAuthMixin
 
 from ..models import (
     Adres,
+    Buurt,
     Huishouden,
     KadastraleOnroerendeZaak,
     Medewerker,
@@ -1390,3 +1392,68 @@ class ZaakObjectBagPandTests(JWTAuthMixin, APITestCase):
             "http://outway.nlx:8443/kadaster/bag/panden/0344100000011708?geldigOp=2020-03-04",
         )
         self.assertNotIn("X-Api-Key", m.last_request.headers)
+
+
+class ZaakObjectBulkCreateTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse("zaakobject--bulk-create")
+
+    def _get_data(self, zaak, **kwargs):
+        return {
+            "zaak": f"http://testserver{reverse(zaak)}",
+            "objectType": ZaakobjectTypes.buurt,
+            "objectIdentificatie": {
+                "buurtCode": "aa",
+                "buurtNaam": "bb",
+                "gemGemeenteCode": "cc",
+                "wykWijkCode": "dd",
+            },
+            **kwargs,
+        }
+
+    @override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
+    def test_bulk_create(self):
+        zaak = ZaakFactory.create()
+        without_identificatie = {
+            "zaak": f"http://testserver{reverse(zaak)}",
+            "object": OBJECT,
+            "objectType": ZaakobjectTypes.besluit,
+        }
+
+        response = self.client.post(
+            self.url, [self._get_data(zaak), without_identificatie]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        data = response.json()
+        self.assertEqual(
+            [zaakobject["objectType"] for zaakobject in data],
+            [ZaakobjectTypes.buurt, ZaakobjectTypes.besluit],
+        )
+        self.assertEqual(ZaakObject.objects.filter(zaak=zaak).count(), 2)
+        buurt = Buurt.objects.get()
+        self.assertEqual(buurt.zaakobject.object_type, ZaakobjectTypes.buurt)
+        self.assertEqual(data[0]["objectIdentificatie"]["buurtCode"], "aa")
+        self.assertEqual(
+            AuditTrail.objects.filter(
+                resource="zaakobject", hoofd_object=f"http://testserver{reverse(zaak)}"
+            ).count(),
+            2,
+        )
+
+    def test_bulk_create_invalid_object(self):
+        zaak = ZaakFactory.create()
+        invalid = self._get_data(zaak)
+        del invalid["objectIdentificatie"]
+
+        response = self.client.post(
+            self.url, [self._get_data(zaak), invalid, self._get_data(zaak)]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "1.nonFieldErrors")
+        self.assertEqual(error["code"], "invalid-zaakobject")
+        self.assertEqual(len(response.data["invalid_params"]), 1)
+        self.assertFalse(ZaakObject.objects.exists())
+        self.assertFalse(Buurt.objects.exists())
+        self.assertFalse(AuditTrail.objects.exists())
@@ -2,6 +2,7 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from copy import copy
 from datetime import date, datetime
+from unittest.mock import patch
 
 from django.contrib.gis.geos import Point
 from django.test import override_settings, tag
@@ -31,6 +32,7 @@ from openzaak.components.catalogi.tests.factories import (
     ZaakTypeFactory,
 )
 from openzaak.tests.utils import JWTAuthMixin, mock_ztc_oas_get
+from openzaak.utils.pagination import OptimizedCursorPagination
 
 from ..api.scopes import (
     SCOPE_ZAKEN_ALLES_LEZEN,
@@ -505,6 +507,73 @@ class ZakenTests(JWTAuthMixin, APITestCase):
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
 
+    @patch.object(OptimizedCursorPagination, "page_size", 2)
+    def test_pagination_cursor_param(self):
+        zaak1, zaak2, zaak3 = ZaakFactory.create_batch(3, zaaktype=self.zaaktype)
+        url = reverse(Zaak)
+
+        response = self.client.get(url, {"cursor": ""}, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertNotIn("count", response_data)
+        self.assertEqual(
+            [zaak["url"] for zaak in response_data["results"]],
+            [f"http://testserver{reverse(zaak)}" for zaak in (zaak3, zaak2)],
+        )
+        self.assertIsNotNone(response_data["next"])
+
+        response = self.client.get(response_data["next"], **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(
+            [zaak["url"] for zaak in response_data["results"]],
+            [f"http://testserver{reverse(zaak1)}"],
+        )
+        self.assertIsNone(response_data["next"])
+
+    @patch.object(OptimizedCursorPagination, "page_size", 2)
+    def test_pagination_cursor_param_with_ordering(self):
+        zaak1 = ZaakFactory.create(zaaktype=self.zaaktype, startdatum=date(2020, 1, 2))
+        zaak2 = ZaakFactory.create(zaaktype=self.zaaktype, startdatum=date(2020, 1, 1))
+        zaak3 = ZaakFactory.create(zaaktype=self.zaaktype, startdatum=date(2020, 1, 1))
+        url = reverse(Zaak)
+
+        response = self.client.get(
+            url, {"cursor": "", "ordering": "startdatum"}, **ZAAK_READ_KWARGS
+        )
+        next_response = self.client.get(response.json()["next"], **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(next_response.status_code, status.HTTP_200_OK)
+        urls = [
+            zaak["url"]
+            for zaak in response.json()["results"] + next_response.json()["results"]
+        ]
+        self.assertEqual(
+            urls,
+            [f"http://testserver{reverse(zaak)}" for zaak in (zaak2, zaak3, zaak1)],
+        )
+
+    def test_pagination_cursor_param_nullable_ordering(self):
+        url = reverse(Zaak)
+
+        response = self.client.get(
+            url, {"cursor": "", "ordering": "einddatum"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "unsupported-cursor-ordering")
+
+    def test_pagination_invalid_cursor(self):
+        url = reverse(Zaak)
+
+        response = self.client.get(url, {"cursor": "invalid"}, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_complex_geometry(self):
         url = reverse("zaak-list")
 
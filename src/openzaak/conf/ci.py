@@ -14,6 +14,8 @@ os.environ.setdefault("IS_HTTPS", "no")
 os.environ.setdefault("SECRET_KEY", "dummy")
 os.environ.setdefault("NOTIFICATIONS_DISABLED", "yes")
 os.environ.setdefault("ENVIRONMENT", "CI")
+# tests mock the same external resources with different responses
+os.environ.setdefault("LOOSE_FK_REQUESTS_CACHE_TIMEOUT", "0")
 
 from .includes.base import *  # noqa isort:skip
 
@@ -26,6 +28,10 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "import_requests",
     },
+    "loose_fk_requests": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "loose_fk_requests",
+    },
 }
 
 LOGGING = LOGGING_SETTINGS  # Minimally required logging is nice
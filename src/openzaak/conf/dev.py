@@ -71,6 +71,10 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "import_requests",
     },
+    "loose_fk_requests": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "loose_fk_requests",
+    },
 }
 
 REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] += (
@@ -103,6 +103,13 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "import_requests",
     },
+    "loose_fk_requests": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "loose_fk_requests",
+        "OPTIONS": {
+            "MAX_ENTRIES": config("LOOSE_FK_REQUESTS_CACHE_MAX_ENTRIES", default=1000)
+        },
+    },
 }
 
 #
@@ -460,6 +467,32 @@ DOCUMENTEN_UPLOAD_READ_CHUNK = config(
     "DOCUMENTEN_UPLOAD_READ_CHUNK", 6 * 2 ** 20
 )  # 6 MB default
 DOCUMENTEN_UPLOAD_DEFAULT_EXTENSION = "bin"
+# number of bytes read from the DMS at a time when downloading files with CMIS enabled
+DOCUMENTEN_DOWNLOAD_CHUNK_SIZE = config("DOCUMENTEN_DOWNLOAD_CHUNK_SIZE", 64 * 2 ** 10)
+
+# pagination counts - above this (estimated) number of results the query planner
+# estimate is used as count instead of an exact count, 0 means always count exactly
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = config(
+    "PAGINATION_COUNT_ESTIMATE_THRESHOLD", default=0
+)
+# number of seconds to cache the count of a filtered list, 0 disables caching
+PAGINATION_COUNT_CACHE_TIMEOUT = config("PAGINATION_COUNT_CACHE_TIMEOUT", default=0)
+
+# number of records on a page of list and search responses
+REST_FRAMEWORK["PAGE_SIZE"] = config("API_PAGE_SIZE", default=100)
+
+# list and search responses with a page size larger than this are serialized and
+# written in chunks of this many records, 0 disables streaming
+STREAMING_RESPONSE_CHUNK_SIZE = config("STREAMING_RESPONSE_CHUNK_SIZE", default=100)
+
+# number of seconds to cache the applications and authorizations of a client ID,
+# changes are picked up immediately regardless. 0 disables caching
+AUTHORIZATIONS_CACHE_TIMEOUT = config("AUTHORIZATIONS_CACHE_TIMEOUT", default=300)
+
+# number of seconds to cache published zaaktypen and their statustypen, roltypen,
+# resultaattypen and eigenschappen, changes are picked up immediately regardless.
+# 0 disables caching
+CATALOGI_CACHE_TIMEOUT = config("CATALOGI_CACHE_TIMEOUT", default=300)
 
 # urls for OAS3 specifications
 SPEC_URL = {
@@ -604,11 +637,24 @@ ZGW_CONSUMERS_CLIENT_CLASS = "openzaak.client.OpenZaakClient"
 # NOTIFICATIONS-API-COMMON
 #
 NOTIFICATIONS_DISABLED = config("NOTIFICATIONS_DISABLED", default=False)
+NOTIFICATIONS_OUTBOX_ENABLED = config("NOTIFICATIONS_OUTBOX_ENABLED", default=False)
+NOTIFICATIONS_OUTBOX_BATCH_SIZE = config("NOTIFICATIONS_OUTBOX_BATCH_SIZE", default=100)
+NOTIFICATIONS_OUTBOX_CONCURRENCY = config("NOTIFICATIONS_OUTBOX_CONCURRENCY", default=4)
+NOTIFICATIONS_OUTBOX_SWEEP_INTERVAL = config(
+    "NOTIFICATIONS_OUTBOX_SWEEP_INTERVAL", default=60
+)
 
 #
 # DJANGO-LOOSE-FK -- handle internal and external API resources
 #
 DEFAULT_LOOSE_FK_LOADER = "openzaak.loaders.AuthorizedRequestsLoader"
+# Name of the cache used to store responses of external objects
+LOOSE_FK_REQUESTS_CACHE_NAME = config(
+    "LOOSE_FK_REQUESTS_CACHE_NAME", "loose_fk_requests"
+)
+LOOSE_FK_REQUESTS_CACHE_TIMEOUT = config("LOOSE_FK_REQUESTS_CACHE_TIMEOUT", default=60)
+LOOSE_FK_REQUESTS_POOL_SIZE = config("LOOSE_FK_REQUESTS_POOL_SIZE", default=10)
+LOOSE_FK_PREFETCH_CONCURRENCY = config("LOOSE_FK_PREFETCH_CONCURRENCY", default=10)
 
 #
 # RAVEN/SENTRY - error monitoring
@@ -634,6 +680,13 @@ if SENTRY_DSN:
 #
 CELERY_BROKER_URL = config("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
 CELERY_RESULT_BACKEND = config("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
+CELERY_BEAT_SCHEDULE = {
+    # deliver the outbox notifications of which the delivery could not be scheduled
+    "sweep-notifications-outbox": {
+        "task": "openzaak.notifications.tasks.sweep_notifications",
+        "schedule": NOTIFICATIONS_OUTBOX_SWEEP_INTERVAL,
+    },
+}
 
 
 #
@@ -687,6 +740,23 @@ CMIS_MAPPER_FILE = config(
     "CMIS_MAPPER_FILE", default=os.path.join(BASE_DIR, "config", "cmis_mapper.json")
 )
 CMIS_URL_MAPPING_ENABLED = config("CMIS_URL_MAPPING_ENABLED", default=False)
+# Number of seconds the results of CMIS document queries and the version histories of
+# documents are cached. Changes made through Open Zaak are picked up immediately,
+# changes made directly in the DMS after at most this long. 0 disables caching
+CMIS_QUERY_CACHE_TIMEOUT = config("CMIS_QUERY_CACHE_TIMEOUT", default=60)
+
+# How generated identifications are numbered, see
+# openzaak.utils.constants.IdentificatieGenerators for zaken and
+# openzaak.utils.constants.DocumentIdentificatieGenerators for documents and besluiten
+ZAAK_IDENTIFICATIE_GENERATOR = config("ZAAK_IDENTIFICATIE_GENERATOR", default="lock")
+DOCUMENT_IDENTIFICATIE_GENERATOR = config(
+    "DOCUMENT_IDENTIFICATIE_GENERATOR", default="highest-number"
+)
+BESLUIT_IDENTIFICATIE_GENERATOR = config(
+    "BESLUIT_IDENTIFICATIE_GENERATOR", default="highest-number"
+)
+# Number of document and besluit identifications a process reserves at once
+IDENTIFICATIE_BLOCK_SIZE = config("IDENTIFICATIE_BLOCK_SIZE", default=1)
 
 # Name of the cache used to store responses for requests made when importing catalogi
 IMPORT_REQUESTS_CACHE_NAME = config("IMPORT_REQUESTS_CACHE_NAME", "import_requests")
@@ -1,9 +1,14 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 import json
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from inspect import getmembers
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional
 
+from django.conf import settings
 from django.db import models
 from django.db.models.base import ModelBase
 
@@ -11,8 +16,74 @@ import requests
 from django_loose_fk.loaders import BaseLoader, FetchError, FetchJsonError
 from django_loose_fk.virtual_models import virtual_model_factory
 from djangorestframework_camel_case.util import underscoreize
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
 from vng_api_common.descriptors import GegevensGroepType
 
+from openzaak.utils.cache import DjangoRequestsCache, LocalLRUCache, RequestsCacheStats
+from openzaak.utils.fields import PREFETCHED_OBJECTS_ATTR
+
+# expired responses are kept this long, so they can be revalidated with their ETag
+KEEP_EXPIRED_RESPONSES = 24 * 60 * 60
+# ZGW APIs accept tokens for JWT_EXPIRY (default one hour) after they are issued
+AUTH_HEADER_TIMEOUT = 60
+
+loose_fk_cache_stats = RequestsCacheStats()
+_auth_headers = LocalLRUCache(maxsize=1000)
+
+
+@lru_cache(maxsize=None)
+def get_session(cache_timeout: int) -> requests.Session:
+    """
+    Return the session used to fetch external objects, shared by the process.
+
+    The session keeps a pool of connections per host, so connections (and their TLS
+    handshakes) are re-used between calls. With a ``cache_timeout``, responses are
+    cached for that many seconds and revalidated with their ``ETag`` afterwards.
+    """
+    if cache_timeout:
+        session = CachedSession(
+            backend=DjangoRequestsCache(
+                cache_name=settings.LOOSE_FK_REQUESTS_CACHE_NAME,
+                keep_expired=KEEP_EXPIRED_RESPONSES,
+            ),
+            expire_after=cache_timeout,
+        )
+    else:
+        session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=settings.LOOSE_FK_REQUESTS_POOL_SIZE,
+        pool_maxsize=settings.LOOSE_FK_REQUESTS_POOL_SIZE,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_auth_header(url: str, cache: bool = False) -> Optional[dict]:
+    """
+    Return the Authorization header of the service the ``url`` belongs to.
+
+    With ``cache``, the header is re-used for all objects in the same collection
+    for :data:`AUTH_HEADER_TIMEOUT` seconds.
+    """
+    from zgw_consumers.models import Service
+
+    if not cache:
+        return Service.get_auth_header(url)
+
+    collection_url = url.rsplit("/", 1)[0]
+    cached = _auth_headers.get(collection_url)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+
+    auth_header = Service.get_auth_header(url)
+    _auth_headers.set(
+        collection_url, (auth_header, time.monotonic() + AUTH_HEADER_TIMEOUT)
+    )
+    return auth_header
+
 
 class AuthorizedRequestsLoader(BaseLoader):
     """
@@ -20,19 +91,23 @@ class AuthorizedRequestsLoader(BaseLoader):
     """
 
     @staticmethod
-    def fetch_object(url: str, do_underscoreize=True) -> dict:
-        from zgw_consumers.models import Service
-
+    def fetch_object(
+        url: str, do_underscoreize=True, headers: Optional[dict] = None
+    ) -> dict:
         # TODO should we replace it with Service.get_client() and use it instead of requests?
         # but in this case we couldn't catch separate FetchJsonError
-        client_auth_header = Service.get_auth_header(url)
-        headers = client_auth_header or {}
+        cache_timeout = settings.LOOSE_FK_REQUESTS_CACHE_TIMEOUT
+        if headers is None:
+            headers = get_auth_header(url, cache=bool(cache_timeout)) or {}
 
         try:
-            response = requests.get(url, headers=headers)
+            response = get_session(cache_timeout).get(url, headers=headers)
         except requests.exceptions.RequestException as exc:
             raise FetchError(exc.args[0]) from exc
 
+        if cache_timeout:
+            loose_fk_cache_stats.record(response)
+
         try:
             response.raise_for_status()
         except requests.HTTPError as exc:
@@ -55,9 +130,77 @@ class AuthorizedRequestsLoader(BaseLoader):
             return self.load_local_object(url, model)
 
         data = self.fetch_object(url)
+        return self.get_model_instance(model, data)
+
+    def get_model_instance(self, model: ModelBase, data: dict) -> models.Model:
         return get_model_instance_with_gegevensgroeps(model, data, loader=self)
 
 
+def prefetch_external_objects(
+    instances: Iterable[models.Model], field_name: str
+) -> List[models.Model]:
+    """
+    Fetch the remote objects of the loose-FK ``field_name`` of all ``instances``.
+
+    The distinct URLs are fetched concurrently, with at most
+    ``LOOSE_FK_PREFETCH_CONCURRENCY`` requests at the same time, instead of one after
+    the other when the field is accessed. The objects are stored on the instances, so
+    accessing the field afterwards does not do any network IO. Objects that could not
+    be fetched are skipped - accessing the field raises the error as before.
+
+    Returns the instances as a list.
+    """
+    instances = list(instances)
+    if not instances:
+        return instances
+
+    field = instances[0]._meta.get_field(field_name)
+    loader = field.loader
+    instances_per_url = defaultdict(list)
+    for instance in instances:
+        if getattr(instance, field._fk_field.attname) is not None:
+            continue
+        url = getattr(instance, field.url_field)
+        if url and not loader.is_local_url(url):
+            instances_per_url[url].append(instance)
+
+    if not instances_per_url:
+        return instances
+
+    # the credentials are looked up up front, database connections can't be shared
+    # with the threads
+    cache_timeout = settings.LOOSE_FK_REQUESTS_CACHE_TIMEOUT
+    auth_headers = {}
+    for url in instances_per_url:
+        collection_url = url.rsplit("/", 1)[0]
+        if collection_url not in auth_headers:
+            auth_headers[collection_url] = (
+                get_auth_header(url, cache=bool(cache_timeout)) or {}
+            )
+
+    def fetch(url: str) -> Optional[dict]:
+        try:
+            return loader.fetch_object(url, headers=auth_headers[url.rsplit("/", 1)[0]])
+        except (FetchError, FetchJsonError):
+            return None
+
+    urls = list(instances_per_url)
+    with ThreadPoolExecutor(
+        max_workers=settings.LOOSE_FK_PREFETCH_CONCURRENCY
+    ) as executor:
+        results = list(executor.map(fetch, urls))
+
+    model = field._fk_field.related_model
+    for url, data in zip(urls, results):
+        if data is None:
+            continue
+        obj = loader.get_model_instance(model, data)
+        for instance in instances_per_url[url]:
+            instance.__dict__.setdefault(PREFETCHED_OBJECTS_ATTR, {})[field.name] = obj
+
+    return instances
+
+
 def get_model_instance_with_gegevensgroeps(
     model: ModelBase, data: Dict[str, Any], loader
 ) -> models.Model:
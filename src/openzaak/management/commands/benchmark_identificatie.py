@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+import json
+import statistics
+import threading
+import time
+from datetime import date
+
+from django.core.management import BaseCommand
+from django.db import close_old_connections, transaction
+from django.test.utils import override_settings
+
+from openzaak.components.zaken.models import ZaakIdentificatie, ZaakIdentificatieCounter
+from openzaak.utils.constants import IdentificatieGenerators
+
+# not valid RSINs, so they can't clash with real organisations
+ORGANISATIONS = [f"99999999{i}" for i in range(10)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the throughput of the generators of zaak identifications with "
+        "concurrent threads. Only run this against a test database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--generator",
+            choices=IdentificatieGenerators.values,
+            action="append",
+            help="Generator to benchmark, can be repeated. Defaults to all of them.",
+        )
+        parser.add_argument(
+            "--threads", type=int, default=8, help="Number of concurrent threads."
+        )
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=100,
+            help="Number of identifications generated per thread.",
+        )
+        parser.add_argument(
+            "--organisations",
+            type=int,
+            default=4,
+            choices=range(1, len(ORGANISATIONS) + 1),
+            help="Number of organisations the threads are spread over.",
+        )
+
+    def handle(self, **options):
+        results = [
+            self.benchmark(
+                generator,
+                options["threads"],
+                options["count"],
+                ORGANISATIONS[: options["organisations"]],
+            )
+            for generator in options["generator"] or IdentificatieGenerators.values
+        ]
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def benchmark(
+        self, generator: str, threads: int, count: int, organisations: list
+    ) -> dict:
+        today = date.today()
+        durations = []
+        errors = []
+
+        def generate(organisation: str):
+            try:
+                for _ in range(count):
+                    start = time.perf_counter()
+                    with transaction.atomic():
+                        ZaakIdentificatie.objects.generate(organisation, today)
+                    durations.append(time.perf_counter() - start)
+            except Exception as exc:
+                errors.append(repr(exc))
+            finally:
+                close_old_connections()
+
+        workers = [
+            threading.Thread(
+                target=generate, args=(organisations[i % len(organisations)],)
+            )
+            for i in range(threads)
+        ]
+        with override_settings(ZAAK_IDENTIFICATIE_GENERATOR=generator):
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            duration = time.perf_counter() - start
+
+        ZaakIdentificatie.objects.filter(bronorganisatie__in=organisations).delete()
+        ZaakIdentificatieCounter.objects.filter(
+            bronorganisatie__in=organisations
+        ).delete()
+
+        durations.sort()
+        return {
+            "generator": generator,
+            "threads": threads,
+            "organisations": len(organisations),
+            "generated": len(durations),
+            "errors": errors,
+            "duration": round(duration, 3),
+            "per_second": round(len(durations) / duration, 1),
+            "latency_ms": {
+                "p50": round(statistics.median(durations) * 1000, 2),
+                "p95": round(durations[int(len(durations) * 0.95)] * 1000, 2),
+                "max": round(durations[-1] * 1000, 2),
+            }
+            if durations
+            else None,
+        }
@@ -0,0 +1,824 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+import json
+import random
+import re
+import secrets
+import statistics
+import threading
+import time
+import uuid
+from base64 import b64encode
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from datetime import date
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
+from django.core.management import BaseCommand, CommandError, call_command
+from django.db import close_old_connections, connection
+from django.db.models import Max, Min
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.constants import (
+    ComponentTypes,
+    RolOmschrijving,
+    RolTypes,
+    VertrouwelijkheidsAanduiding,
+)
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests import reverse
+
+from openzaak.components.autorisaties.cache import invalidate_authorizations_cache
+from openzaak.components.autorisaties.forms import (
+    COMPONENT_TO_PREFIXES_MAP,
+    get_scope_choices,
+)
+from openzaak.components.autorisaties.middleware import (
+    AuthorizationIndex,
+    AutorisatieData,
+)
+from openzaak.components.besluiten.models import Besluit
+from openzaak.components.catalogi.models import (
+    BesluitType,
+    InformatieObjectType,
+    ZaakType,
+)
+from openzaak.components.catalogi.tests.factories import RolTypeFactory
+from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.zaken.api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from openzaak.components.zaken.models import Rol, Zaak, ZaakInformatieObject
+from openzaak.loaders import loose_fk_cache_stats
+from openzaak.tests.utils import generate_jwt_auth
+
+HOST = "http://testserver"
+CLIENT_ID = "benchmark"
+# the RSIN used throughout the test suite
+RSIN = "517439943"
+CRS_HEADERS = {"HTTP_ACCEPT_CRS": "EPSG:4326", "HTTP_CONTENT_CRS": "EPSG:4326"}
+# covers the locations of the zaken created by ``generate_data``
+SEARCH_POLYGON = [[1, 50], [25, 50], [25, 75], [1, 75], [1, 50]]
+UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+SCENARIOS: Dict[str, Callable[["ScenarioRunner", SimpleNamespace], None]] = {}
+
+
+def scenario(name: str):
+    def decorator(func):
+        SCENARIOS[name] = func
+        return func
+
+    return decorator
+
+
+def get_url(obj) -> str:
+    return f"{HOST}{reverse(obj)}"
+
+
+def percentiles(durations: List[float]) -> Optional[dict]:
+    if not durations:
+        return None
+
+    durations = sorted(durations)
+
+    def pick(percentile: float) -> float:
+        index = min(int(len(durations) * percentile), len(durations) - 1)
+        return round(durations[index] * 1000, 2)
+
+    return {
+        "p50": round(statistics.median(durations) * 1000, 2),
+        "p90": pick(0.9),
+        "p95": pick(0.95),
+        "p99": pick(0.99),
+        "max": round(durations[-1] * 1000, 2),
+    }
+
+
+@dataclass
+class Measurement:
+    scenario: str
+    request: str
+    duration: float
+    queries: int
+    status_code: int
+
+
+class ScenarioRunner:
+    """
+    A virtual user, executing the scenarios through the Django test client.
+    """
+
+    def __init__(self, authorization: str):
+        self.client = Client(raise_request_exception=False)
+        self.headers = {"HTTP_AUTHORIZATION": authorization, **CRS_HEADERS}
+        self.record = True
+        self.scenario = None
+        self.measurements: List[Measurement] = []
+        self.scenario_durations: Dict[str, List[float]] = defaultdict(list)
+        self.errors: List[dict] = []
+
+    def run(self, name: str, sample: SimpleNamespace) -> None:
+        self.scenario = name
+        start = time.perf_counter()
+        SCENARIOS[name](self, sample)
+        if self.record:
+            self.scenario_durations[name].append(time.perf_counter() - start)
+
+    def request(
+        self, method: str, url: str, data: Optional[dict] = None, record: bool = True
+    ) -> Optional[dict]:
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            if method == "GET":
+                response = self.client.get(url, data, **self.headers)
+            else:
+                response = self.client.post(
+                    url, data, content_type="application/json", **self.headers
+                )
+            # streamed responses are only produced while they're consumed
+            content = (
+                b"".join(response.streaming_content)
+                if response.streaming
+                else response.content
+            )
+            duration = time.perf_counter() - start
+
+        path = UUID_PATTERN.sub(
+            "{uuid}", url[len(HOST) :] if url.startswith(HOST) else url
+        )
+        label = f"{method} {path}"
+        if method == "GET" and data:
+            label = f"{label}?{urlencode({key: '...' for key in sorted(data)})}"
+
+        if response.status_code >= 400:
+            self.errors.append(
+                {
+                    "scenario": self.scenario,
+                    "request": label,
+                    "status_code": response.status_code,
+                    "response": content[:500].decode(errors="replace"),
+                }
+            )
+        if self.record and record:
+            self.measurements.append(
+                Measurement(
+                    scenario=self.scenario,
+                    request=label,
+                    duration=duration,
+                    queries=len(context.captured_queries),
+                    status_code=response.status_code,
+                )
+            )
+
+        try:
+            return json.loads(content)
+        except ValueError:
+            return None
+
+    def get(self, url: str, params: Optional[dict] = None) -> Optional[dict]:
+        return self.request("GET", url, params)
+
+    def post(self, url: str, data: dict, record: bool = True) -> Optional[dict]:
+        return self.request("POST", url, data, record=record)
+
+    def create_zaak(self, sample: SimpleNamespace, record: bool = True) -> str:
+        zaak = self.post(
+            get_url("zaak-list"),
+            {
+                "zaaktype": sample.zaaktype,
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+                "bronorganisatie": RSIN,
+                "verantwoordelijkeOrganisatie": RSIN,
+                "startdatum": date.today().isoformat(),
+            },
+            record=record,
+        )
+        return zaak["url"]
+
+    def add_status(self, sample: SimpleNamespace, zaak: str) -> None:
+        self.post(
+            get_url("status-list"),
+            {
+                "zaak": zaak,
+                # the first status, so the zaak isn't closed
+                "statustype": sample.statustypen[0],
+                "datumStatusGezet": timezone.now().isoformat(),
+            },
+        )
+
+    def add_rol(self, sample: SimpleNamespace, zaak: str) -> None:
+        self.post(
+            get_url("rol-list"),
+            {
+                "zaak": zaak,
+                "betrokkene": f"https://personen.example.com/api/v1/{uuid.uuid4()}",
+                "betrokkeneType": RolTypes.natuurlijk_persoon,
+                "roltype": sample.roltype,
+                "roltoelichting": "benchmark",
+            },
+        )
+
+
+@scenario("zaken_overview")
+def zaken_overview(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    runner.get(get_url("zaak-list"))
+    runner.get(get_url("status-list"))
+    runner.get(get_url("zaaktype-list"))
+    runner.get(get_url("statustype-list"))
+
+
+@scenario("zaken_overview_zaaktype")
+def zaken_overview_zaaktype(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    runner.get(get_url("zaak-list"), {"zaaktype": sample.zaaktype})
+    for statustype in sample.statustypen[:3]:
+        runner.get(get_url("status-list"), {"statustype": statustype})
+    runner.get(sample.zaaktype)
+    runner.get(get_url("statustype-list"), {"zaaktype": sample.zaaktype})
+
+
+@scenario("search_location")
+def search_location(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    runner.post(
+        get_url("zaak--zoek"),
+        {
+            "zaakgeometrie": {
+                "within": {"type": "Polygon", "coordinates": [SEARCH_POLYGON]}
+            }
+        },
+    )
+
+
+@scenario("search_person")
+def search_person(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    runner.get(get_url("rol-list"), {"betrokkene": sample.betrokkene})
+
+
+@scenario("zaak_details")
+def zaak_details(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    runner.get(sample.zaak)
+    runner.get(get_url("status-list"), {"zaak": sample.zaak})
+    if sample.resultaat:
+        runner.get(sample.resultaat)
+    runner.get(get_url("rol-list"), {"zaak": sample.zaak})
+    runner.get(get_url("zaakobject-list"), {"zaak": sample.zaak})
+    runner.get(sample.zaaktype)
+    runner.get(get_url("statustype-list"), {"zaaktype": sample.zaaktype})
+    runner.get(get_url("besluittype-list"), {"zaaktypen": sample.zaaktype})
+    runner.get(sample.resultaattype)
+    runner.get(get_url("objectinformatieobject-list"), {"object": sample.zaak})
+    for document in sample.documenten:
+        runner.get(document)
+    runner.get(get_url("besluit-list"), {"zaak": sample.zaak})
+
+
+@scenario("history")
+def history(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    runner.get(f"{sample.zaak}/audittrail")
+    for document in sample.documenten:
+        runner.get(f"{document}/audittrail")
+    if sample.besluit:
+        runner.get(f"{sample.besluit}/audittrail")
+
+
+@scenario("create_zaak")
+def create_zaak(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    zaak = runner.create_zaak(sample)
+    runner.add_status(sample, zaak)
+    runner.add_rol(sample, zaak)
+
+
+@scenario("add_status")
+def add_status(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    runner.add_status(sample, sample.zaak)
+
+
+@scenario("add_betrokkene")
+def add_betrokkene(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    runner.add_rol(sample, sample.zaak)
+
+
+@scenario("add_document")
+def add_document(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    document = runner.post(
+        get_url("enkelvoudiginformatieobject-list"),
+        {
+            "bronorganisatie": RSIN,
+            "creatiedatum": date.today().isoformat(),
+            "titel": "benchmark",
+            "auteur": "benchmark",
+            "taal": "nld",
+            "bestandsnaam": "benchmark.txt",
+            "inhoud": b64encode(b"benchmark").decode(),
+            "informatieobjecttype": sample.informatieobjecttype,
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+        },
+    )
+    runner.post(
+        get_url("zaakinformatieobject-list"),
+        {"zaak": sample.zaak, "informatieobject": document["url"]},
+    )
+
+
+@scenario("add_besluit")
+def add_besluit(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    runner.post(
+        get_url("besluit-list"),
+        {
+            "verantwoordelijkeOrganisatie": RSIN,
+            "besluittype": sample.besluittype,
+            "zaak": sample.zaak,
+            "datum": date.today().isoformat(),
+            "ingangsdatum": date.today().isoformat(),
+        },
+    )
+
+
+@scenario("add_resultaat")
+def add_resultaat(runner: ScenarioRunner, sample: SimpleNamespace) -> None:
+    # a zaak has one resultaat, so it's added to a new zaak
+    zaak = runner.create_zaak(sample, record=False)
+    runner.post(
+        get_url("resultaat-list"),
+        {"zaak": zaak, "resultaattype": sample.resultaattype, "toelichting": ""},
+    )
+
+
+def has_scopes_with_scope_set(
+    autorisaties: List[AutorisatieData], component: str, scopes, **fields
+) -> bool:
+    """
+    The permission check before the authorizations were indexed, as reference.
+    """
+    order_provided = VertrouwelijkheidsAanduiding.get_choice(
+        fields.pop("vertrouwelijkheidaanduiding")
+    ).order
+    scopes_provided = set()
+    for autorisatie in autorisaties:
+        if autorisatie.component != component:
+            continue
+        if any(getattr(autorisatie, name) != value for name, value in fields.items()):
+            continue
+        if (
+            not autorisatie.max_vertrouwelijkheidaanduiding
+            or VertrouwelijkheidsAanduiding.get_choice(
+                autorisatie.max_vertrouwelijkheidaanduiding
+            ).order
+            < order_provided
+        ):
+            continue
+        scopes_provided.update(autorisatie.scopes)
+
+    return scopes.is_contained_in(list(scopes_provided))
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay the functional performance scenarios against the API and report "
+        "the latency and number of queries per request as JSON. The scenarios "
+        "create zaken, documenten and besluiten, only run this against a test "
+        "database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenario",
+            choices=list(SCENARIOS),
+            action="append",
+            help="Scenario to run, can be repeated. Defaults to all of them.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10,
+            help="Number of times each virtual user runs every scenario.",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=1,
+            help="Number of unrecorded iterations before the measurements.",
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=1,
+            help="Number of concurrent virtual users (threads).",
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=20,
+            help="Number of existing zaken the scenarios are run for.",
+        )
+        parser.add_argument(
+            "--authorizations",
+            choices=["all", "types"],
+            default="all",
+            help=(
+                "Authorize the client for everything, or with an authorization "
+                "per zaaktype, informatieobjecttype and besluittype."
+            ),
+        )
+        parser.add_argument(
+            "--has-auth-checks",
+            type=int,
+            default=100000,
+            help="Number of permission checks for the has_auth benchmark.",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed for the selection of zaken."
+        )
+        parser.add_argument(
+            "--generate-data",
+            action="store_true",
+            help="Seed the database with generate_data before running the scenarios.",
+        )
+        parser.add_argument(
+            "--zaken",
+            type=int,
+            default=1000,
+            help="Number of zaken to generate with --generate-data.",
+        )
+        parser.add_argument(
+            "--zaaktypen",
+            type=int,
+            default=10,
+            help="Number of zaaktypen to generate with --generate-data.",
+        )
+        parser.add_argument(
+            "--output", help="File to write the report to, defaults to stdout."
+        )
+        parser.add_argument(
+            "--noinput",
+            "--no-input",
+            action="store_false",
+            dest="interactive",
+            help="Do not prompt for confirmation before running the scenarios.",
+        )
+
+    def handle(self, **options):
+        if options["interactive"]:
+            confirm = input(
+                "The benchmark creates data and a benchmark client in the configured database "
+                "and should only be used for test purposes, not in production.\n"
+                "Are you sure you want to do this? Type 'yes' to continue, or 'no' to cancel: "
+            )
+            if confirm != "yes":
+                raise CommandError("Benchmark cancelled.")
+
+        if options["generate_data"]:
+            call_command(
+                "generate_data",
+                interactive=False,
+                zaken=options["zaken"],
+                zaaktypen=options["zaaktypen"],
+                partition=min(options["zaken"], 10000),
+                stdout=self.stderr,
+            )
+
+        rng = random.Random(options["seed"])
+        samples = self.get_samples(options["samples"], rng)
+        scenarios = options["scenario"] or list(SCENARIOS)
+
+        secret = secrets.token_urlsafe()
+        applicatie = self.create_client(secret, options["authorizations"])
+        try:
+            with override_settings(
+                ALLOWED_HOSTS=["testserver"], NOTIFICATIONS_DISABLED=True
+            ):
+                loose_fk_cache_stats.reset()
+                start = time.perf_counter()
+                runners = self.run_users(
+                    options["users"],
+                    generate_jwt_auth(CLIENT_ID, secret),
+                    scenarios,
+                    samples,
+                    options["iterations"],
+                    options["warmup"],
+                    options["seed"],
+                )
+                duration = time.perf_counter() - start
+        finally:
+            applicatie.delete()
+            JWTSecret.objects.filter(identifier=CLIENT_ID).delete()
+
+        report = {
+            "users": options["users"],
+            "iterations": options["iterations"],
+            "authorizations": options["authorizations"],
+            "duration": round(duration, 3),
+            **self.get_results(runners),
+            "loose_fk_cache": loose_fk_cache_stats.as_dict(),
+            "has_auth": self.benchmark_has_auth(options["has_auth_checks"]),
+        }
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as outfile:
+                outfile.write(output)
+        else:
+            self.stdout.write(output)
+
+    def get_samples(self, count: int, rng: random.Random) -> List[SimpleNamespace]:
+        """
+        Collect the URLs of a random selection of zaken and their related objects.
+        """
+        bounds = Zaak.objects.aggregate(first=Min("pk"), last=Max("pk"))
+        if bounds["first"] is None:
+            raise CommandError(
+                "There are no zaken, seed the database with --generate-data first."
+            )
+
+        ids = range(bounds["first"], bounds["last"] + 1)
+        zaken = Zaak.objects.filter(
+            pk__in=rng.sample(ids, min(count, len(ids))), _zaaktype__isnull=False
+        ).select_related("_zaaktype", "resultaat")
+        besluiten = list(Besluit.objects.order_by("pk")[:count])
+
+        samples = []
+        roltypen = {}
+        for zaak in zaken:
+            zaaktype = zaak._zaaktype
+            statustypen = list(zaaktype.statustypen.order_by("statustypevolgnummer"))
+            resultaattype = zaaktype.resultaattypen.first()
+            besluittype = zaaktype.besluittypen.first()
+            informatieobjecttype = zaaktype.informatieobjecttypen.first()
+            if not (statustypen and resultaattype and besluittype):
+                continue
+            if informatieobjecttype is None:
+                continue
+
+            if zaaktype.pk not in roltypen:
+                roltypen[zaaktype.pk] = self.get_roltype(zaaktype)
+
+            canonical_ids = ZaakInformatieObject.objects.filter(zaak=zaak).values_list(
+                "_informatieobject_id", flat=True
+            )[:3]
+            # the latest version of each document
+            documenten = (
+                EnkelvoudigInformatieObject.objects.filter(
+                    canonical_id__in=list(canonical_ids)
+                )
+                .order_by("canonical_id", "-versie")
+                .distinct("canonical_id")
+            )
+            betrokkene = (
+                Rol.objects.filter(zaak=zaak)
+                .exclude(betrokkene="")
+                .values_list("betrokkene", flat=True)
+                .first()
+            )
+            resultaat = getattr(zaak, "resultaat", None)
+            besluit = rng.choice(besluiten) if besluiten else None
+
+            samples.append(
+                SimpleNamespace(
+                    zaak=get_url(zaak),
+                    zaaktype=get_url(zaaktype),
+                    statustypen=[get_url(statustype) for statustype in statustypen],
+                    resultaattype=get_url(resultaattype),
+                    besluittype=get_url(besluittype),
+                    informatieobjecttype=get_url(informatieobjecttype),
+                    roltype=roltypen[zaaktype.pk],
+                    resultaat=get_url(resultaat) if resultaat else None,
+                    documenten=[get_url(document) for document in documenten],
+                    besluit=get_url(besluit) if besluit else None,
+                    betrokkene=betrokkene or "https://personen.example.com/api/v1/1",
+                )
+            )
+
+        if not samples:
+            raise CommandError(
+                "No zaken found with a zaaktype with statustypen, resultaattypen, "
+                "besluittypen and informatieobjecttypen."
+            )
+        return samples
+
+    def get_roltype(self, zaaktype: ZaakType) -> str:
+        # roles with these descriptions can only occur once for a zaak
+        roltype = (
+            zaaktype.roltype_set.exclude(
+                omschrijving_generiek__in=[
+                    RolOmschrijving.initiator,
+                    RolOmschrijving.zaakcoordinator,
+                ]
+            )
+            .order_by("pk")
+            .first()
+        )
+        if roltype is None:
+            roltype = RolTypeFactory.create(
+                zaaktype=zaaktype,
+                omschrijving="benchmark",
+                omschrijving_generiek=RolOmschrijving.belanghebbende,
+            )
+        return get_url(roltype)
+
+    def create_client(self, secret: str, authorizations: str) -> Applicatie:
+        JWTSecret.objects.update_or_create(
+            identifier=CLIENT_ID, defaults={"secret": secret}
+        )
+        Applicatie.objects.filter(client_ids__contains=[CLIENT_ID]).delete()
+        applicatie = Applicatie.objects.create(
+            client_ids=[CLIENT_ID],
+            label="benchmark",
+            heeft_alle_autorisaties=authorizations == "all",
+        )
+        if authorizations == "types":
+            Autorisatie.objects.bulk_create(
+                Autorisatie(
+                    applicatie=applicatie,
+                    **{**asdict(autorisatie), "scopes": list(autorisatie.scopes)},
+                )
+                for autorisatie in self.get_autorisaties()
+            )
+        # bulk_create doesn't send signals
+        invalidate_authorizations_cache()
+        return applicatie
+
+    def get_autorisaties(self) -> List[AutorisatieData]:
+        """
+        Authorize all scopes, with an authorization per published type.
+        """
+        labels = [label for label, _ in get_scope_choices()]
+
+        def get_autorisatie(component: str, **fields) -> AutorisatieData:
+            prefixes = COMPONENT_TO_PREFIXES_MAP[component]
+            return AutorisatieData(
+                component=component,
+                scopes=tuple(label for label in labels if label.startswith(prefixes)),
+                **{
+                    "zaaktype": "",
+                    "informatieobjecttype": "",
+                    "besluittype": "",
+                    "max_vertrouwelijkheidaanduiding": "",
+                    **fields,
+                },
+            )
+
+        max_va = VertrouwelijkheidsAanduiding.zeer_geheim
+        return [
+            get_autorisatie(ComponentTypes.ztc),
+            *(
+                get_autorisatie(
+                    ComponentTypes.zrc,
+                    zaaktype=get_url(zaaktype),
+                    max_vertrouwelijkheidaanduiding=max_va,
+                )
+                for zaaktype in ZaakType.objects.filter(concept=False)
+            ),
+            *(
+                get_autorisatie(
+                    ComponentTypes.drc,
+                    informatieobjecttype=get_url(informatieobjecttype),
+                    max_vertrouwelijkheidaanduiding=max_va,
+                )
+                for informatieobjecttype in InformatieObjectType.objects.filter(
+                    concept=False
+                )
+            ),
+            *(
+                get_autorisatie(ComponentTypes.brc, besluittype=get_url(besluittype))
+                for besluittype in BesluitType.objects.filter(concept=False)
+            ),
+        ]
+
+    def run_users(
+        self,
+        users: int,
+        authorization: str,
+        scenarios: List[str],
+        samples: List[SimpleNamespace],
+        iterations: int,
+        warmup: int,
+        seed: int,
+    ) -> List[ScenarioRunner]:
+        runners = [ScenarioRunner(authorization) for _ in range(users)]
+
+        def run(runner: ScenarioRunner, rng: random.Random):
+            try:
+                for iteration in range(warmup + iterations):
+                    runner.record = iteration >= warmup
+                    for name in scenarios:
+                        runner.run(name, rng.choice(samples))
+            finally:
+                if users > 1:
+                    close_old_connections()
+
+        # a single user runs in the current thread, so it can see uncommitted data
+        if users == 1:
+            run(runners[0], random.Random(seed))
+            return runners
+
+        workers = [
+            threading.Thread(target=run, args=(runner, random.Random(seed + i)))
+            for i, runner in enumerate(runners)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return runners
+
+    def get_results(self, runners: List[ScenarioRunner]) -> dict:
+        measurements = [m for runner in runners for m in runner.measurements]
+
+        scenario_durations = defaultdict(list)
+        for runner in runners:
+            for name, durations in runner.scenario_durations.items():
+                scenario_durations[name].extend(durations)
+
+        scenarios = {}
+        for name, durations in scenario_durations.items():
+            requests = [m for m in measurements if m.scenario == name]
+            scenarios[name] = {
+                "runs": len(durations),
+                "requests": round(len(requests) / len(durations), 1),
+                "queries": round(sum(m.queries for m in requests) / len(durations), 1),
+                "latency_ms": percentiles(durations),
+            }
+
+        by_request = defaultdict(list)
+        for measurement in measurements:
+            by_request[measurement.request].append(measurement)
+
+        requests = {}
+        for label, items in sorted(by_request.items()):
+            status_codes = defaultdict(int)
+            for item in items:
+                status_codes[str(item.status_code)] += 1
+            queries = [item.queries for item in items]
+            requests[label] = {
+                "count": len(items),
+                "status_codes": dict(status_codes),
+                "queries": {
+                    "mean": round(statistics.mean(queries), 1),
+                    "max": max(queries),
+                },
+                "latency_ms": percentiles([item.duration for item in items]),
+            }
+
+        errors = [error for runner in runners for error in runner.errors]
+        return {
+            "scenarios": scenarios,
+            "requests": requests,
+            "error_count": len(errors),
+            # the first errors are enough to see what's wrong
+            "errors": errors[:20],
+        }
+
+    def benchmark_has_auth(self, checks: int) -> Optional[dict]:
+        """
+        Compare the indexed permission check with collecting the granted scopes in a
+        set, for an authorization per published type.
+        """
+        autorisaties = self.get_autorisaties()
+        zaaktypen = [a.zaaktype for a in autorisaties if a.zaaktype]
+        if not zaaktypen or not checks:
+            return None
+
+        fields = [
+            {
+                "zaaktype": zaaktypen[i % len(zaaktypen)],
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            }
+            for i in range(checks)
+        ]
+
+        start = time.perf_counter()
+        index = AuthorizationIndex(autorisaties)
+        build_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = [
+            index.has_scopes(ComponentTypes.zrc, SCOPE_ZAKEN_ALLES_LEZEN, **f)
+            for f in fields
+        ]
+        indexed_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = [
+            has_scopes_with_scope_set(
+                autorisaties, ComponentTypes.zrc, SCOPE_ZAKEN_ALLES_LEZEN, **f
+            )
+            for f in fields
+        ]
+        reference_duration = time.perf_counter() - start
+
+        return {
+            "checks": checks,
+            "authorizations": len(autorisaties),
+            "same_results": indexed == reference,
+            "index_build_ms": round(build_duration * 1000, 3),
+            "indexed_us": round(indexed_duration / checks * 1e6, 3),
+            "scope_set_us": round(reference_duration / checks * 1e6, 3),
+            "speedup": round(reference_duration / indexed_duration, 1)
+            if indexed_duration
+            else None,
+        }
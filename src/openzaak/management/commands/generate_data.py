@@ -198,18 +198,26 @@ class Command(BaseCommand):
             default=100,
             help="Number of zaaktypen, besluittypen and informatieobjecttypen to generate.",
         )
+        parser.add_argument(
+            "--noinput",
+            "--no-input",
+            action="store_false",
+            dest="interactive",
+            help="Do not prompt for confirmation before generating the data.",
+        )
 
     def handle(self, *args, **options):
         self.partition = options["partition"]
         self.zaken_amount = options["zaken_amount"]
         self.zaaktypen_amount = options["zaaktypen_amount"]
 
-        confirm = input(
-            "Data generation should only be used for test purposes and should not be run in production.\n"
-            "Are you sure you want to do this? Type 'yes' to continue, or 'no' to cancel: "
-        )
-        if confirm != "yes":
-            raise CommandError("Data generation cancelled.")
+        if options["interactive"]:
+            confirm = input(
+                "Data generation should only be used for test purposes and should not be run in production.\n"
+                "Are you sure you want to do this? Type 'yes' to continue, or 'no' to cancel: "
+            )
+            if confirm != "yes":
+                raise CommandError("Data generation cancelled.")
 
         self.generate_catalogi()
         self.generate_zaken()
@@ -339,6 +347,7 @@ class Command(BaseCommand):
                     zaak=zaak,
                     statustype=zaaktype_statustypen[zaak._zaaktype_id][i],
                     datum_status_gezet=timezone.now(),
+                    indicatie_laatst_gezette_status=i == 2,
                 )
                 for i in range(3)
             ]
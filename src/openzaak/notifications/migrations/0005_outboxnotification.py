@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+# Generated by Django 3.2.18 on 2023-06-12 10:21
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications_log", "0004_alter_failednotification_status_code"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "hoofd_object",
+                    models.URLField(
+                        db_index=True,
+                        help_text="URL of the main object of the notification. Notifications about the same main object are delivered in order.",
+                        max_length=1000,
+                        verbose_name="hoofd object",
+                    ),
+                ),
+                (
+                    "message",
+                    models.JSONField(
+                        help_text="Content of the notification.",
+                        verbose_name="notification message",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of failed delivery attempts.",
+                        verbose_name="attempts",
+                    ),
+                ),
+                (
+                    "next_attempt",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        help_text="The notification is not delivered before this moment.",
+                        verbose_name="next attempt",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "outbox notification",
+                "verbose_name_plural": "outbox notifications",
+                "ordering": ("pk",),
+            },
+        ),
+    ]
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 from django_db_logger.models import StatusLog
@@ -39,3 +40,43 @@ class FailedNotification(StatusLog):
     @property
     def retried(self) -> bool:
         return self.retried_at is not None
+
+
+class OutboxNotification(models.Model):
+    """
+    Notification waiting to be delivered to the Notifications API.
+
+    Notifications are stored in the same transaction as the change they describe,
+    and delivered afterwards by the ``deliver_notifications`` task. Delivered
+    notifications are removed from the outbox.
+    """
+
+    hoofd_object = models.URLField(
+        _("hoofd object"),
+        max_length=1000,
+        db_index=True,
+        help_text=_(
+            "URL of the main object of the notification. Notifications about the "
+            "same main object are delivered in order."
+        ),
+    )
+    message = models.JSONField(
+        _("notification message"), help_text=_("Content of the notification.")
+    )
+    attempts = models.PositiveIntegerField(
+        _("attempts"), default=0, help_text=_("Number of failed delivery attempts."),
+    )
+    next_attempt = models.DateTimeField(
+        _("next attempt"),
+        default=timezone.now,
+        db_index=True,
+        help_text=_("The notification is not delivered before this moment."),
+    )
+
+    class Meta:
+        verbose_name = _("outbox notification")
+        verbose_name_plural = _("outbox notifications")
+        ordering = ("pk",)
+
+    def __str__(self):
+        return f"{self.message.get('actie')} {self.message.get('resourceUrl')}"
@@ -0,0 +1,244 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+"""
+Transactional outbox for notifications.
+
+Notifications are written to the :class:`OutboxNotification` table in the same
+transaction as the change they describe, so they are never lost when the task
+queue is unavailable or the process dies right after committing. The
+``deliver_notifications`` task sends them to the Notifications API in batches,
+and the ``sweep_notifications`` task periodically picks up the notifications of
+which the delivery could not be scheduled.
+"""
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+import requests
+from celery import shared_task
+from celery.utils.time import get_exponential_backoff_interval
+from kombu.exceptions import OperationalError
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.tasks import send_notification
+from zds_client import Client, ClientError
+
+from .models import OutboxNotification
+
+logger = logging.getLogger(__name__)
+
+# failures are logged with the logger of the notifications library, which is
+# configured to store them as FailedNotification
+notifs_logger = logging.getLogger("notifications_api_common.tasks")
+
+# notifications claimed by a task are not claimed by other tasks for this long. If
+# the task doesn't finish in time, e.g. because the worker died, they are delivered
+# again.
+DELIVERY_LEASE = timedelta(minutes=5)
+
+
+def schedule_notifications(messages: List[dict]) -> None:
+    """
+    Schedule the delivery of the messages once the current transaction is committed.
+    """
+    if not settings.NOTIFICATIONS_OUTBOX_ENABLED:
+
+        def _send():
+            for message in messages:
+                send_notification.delay(message)
+
+        transaction.on_commit(_send)
+        return
+
+    OutboxNotification.objects.bulk_create(
+        [
+            OutboxNotification(hoofd_object=message["hoofdObject"], message=message)
+            for message in messages
+        ]
+    )
+    transaction.on_commit(_schedule_delivery)
+
+
+def _schedule_delivery() -> None:
+    # the changes are committed at this point, an unavailable task queue must not
+    # result in an error response - the periodic sweep delivers the notifications
+    try:
+        deliver_notifications.delay()
+    except OperationalError:
+        logger.warning(
+            "Could not schedule the delivery of outbox notifications, they will be "
+            "delivered by the periodic sweep",
+            exc_info=True,
+        )
+
+
+def _claim_batch(now) -> List[List[OutboxNotification]]:
+    """
+    Claim a batch of due notifications, grouped per main object.
+
+    The claimed notifications are leased by postponing their next attempt, so the
+    row locks are only held while claiming and not while delivering.
+    """
+    with transaction.atomic():
+        batch = list(
+            OutboxNotification.objects.select_for_update(skip_locked=True)
+            .filter(next_attempt__lte=now)
+            .order_by("pk")[: settings.NOTIFICATIONS_OUTBOX_BATCH_SIZE]
+        )
+        if not batch:
+            return []
+
+        per_main_object: Dict[str, List[OutboxNotification]] = defaultdict(list)
+        for notification in batch:
+            per_main_object[notification.hoofd_object].append(notification)
+
+        # notifications outside of this batch that precede the batched
+        # notifications of the same main object must be delivered first. This
+        # includes the notifications leased by other tasks.
+        preceding = (
+            OutboxNotification.objects.filter(
+                hoofd_object__in=per_main_object, pk__lt=batch[-1].pk
+            )
+            .exclude(pk__in=[notification.pk for notification in batch])
+            .values_list("hoofd_object", "pk")
+        )
+        for hoofd_object, pk in preceding:
+            per_main_object[hoofd_object] = [
+                notification
+                for notification in per_main_object[hoofd_object]
+                if notification.pk < pk
+            ]
+
+        claimed = [
+            notifications for notifications in per_main_object.values() if notifications
+        ]
+        OutboxNotification.objects.filter(
+            pk__in=[
+                notification.pk
+                for notifications in claimed
+                for notification in notifications
+            ]
+        ).update(next_attempt=now + DELIVERY_LEASE)
+
+    return claimed
+
+
+def _deliver_in_order(
+    client: Client, notifications: List[OutboxNotification]
+) -> Tuple[List[OutboxNotification], Optional[OutboxNotification], Optional[Exception]]:
+    """
+    Deliver the notifications of one main object, stopping at the first failure.
+    """
+    delivered = []
+    for notification in notifications:
+        try:
+            client.create("notificaties", notification.message)
+        except (ClientError, requests.RequestException) as exc:
+            return delivered, notification, exc
+        delivered.append(notification)
+    return delivered, None, None
+
+
+@shared_task
+def deliver_notifications() -> None:
+    """
+    Deliver a batch of due notifications from the outbox.
+
+    Notifications about different main objects are delivered concurrently,
+    notifications about the same main object are delivered one after the other, in
+    the order they were created. A notification is held back as long as an older
+    notification about the same main object is waiting for a retry or being
+    delivered by another worker. Failed deliveries are retried with the backoff
+    settings of the Notifications API configuration.
+    """
+    config = NotificationsConfig.get_solo()
+    client = NotificationsConfig.get_client()
+    if client is None:
+        logger.warning(
+            "Could not build a client for Notifications API, not sending messages"
+        )
+        return
+
+    now = timezone.now()
+    claimed = _claim_batch(now)
+    if not claimed:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=settings.NOTIFICATIONS_OUTBOX_CONCURRENCY
+    ) as executor:
+        results = list(
+            executor.map(
+                lambda notifications: _deliver_in_order(client, notifications), claimed,
+            )
+        )
+
+    delivered, retry, exhausted, unattempted = [], [], [], []
+    for notifications, (_delivered, failed, exc) in zip(claimed, results):
+        delivered += _delivered
+        if failed is None:
+            continue
+
+        # the notifications after a failure are held back by the failed one
+        unattempted += notifications[len(_delivered) + 1 :]
+
+        failed.attempts += 1
+        final_try = failed.attempts > config.notification_delivery_max_retries
+        notifs_logger.warning(
+            "Could not deliver message to %s",
+            client.base_url,
+            exc_info=exc,
+            extra={
+                "notification_msg": failed.message,
+                "current_try": failed.attempts,
+                "final_try": final_try,
+            },
+        )
+        if final_try:
+            exhausted.append(failed)
+            continue
+
+        failed.next_attempt = now + timedelta(
+            seconds=get_exponential_backoff_interval(
+                factor=config.notification_delivery_retry_backoff,
+                retries=failed.attempts - 1,
+                maximum=config.notification_delivery_retry_backoff_max,
+                full_jitter=False,
+            )
+        )
+        retry.append(failed)
+
+    with transaction.atomic():
+        OutboxNotification.objects.filter(
+            pk__in=[notification.pk for notification in delivered + exhausted]
+        ).delete()
+        OutboxNotification.objects.bulk_update(retry, ["attempts", "next_attempt"])
+        # release the lease
+        OutboxNotification.objects.filter(
+            pk__in=[notification.pk for notification in unattempted]
+        ).update(next_attempt=now)
+
+    if retry:
+        deliver_notifications.apply_async(
+            eta=min(notification.next_attempt for notification in retry)
+        )
+    if delivered and OutboxNotification.objects.filter(next_attempt__lte=now).exists():
+        deliver_notifications.delay()
+
+
+@shared_task
+def sweep_notifications() -> None:
+    """
+    Deliver the due notifications of the outbox, run periodically by Celery beat.
+
+    This picks up the notifications of which the delivery could not be scheduled,
+    e.g. because the task queue was unavailable, and the notifications of tasks
+    that did not finish.
+    """
+    if OutboxNotification.objects.filter(next_attempt__lte=timezone.now()).exists():
+        deliver_notifications()
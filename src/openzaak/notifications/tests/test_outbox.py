@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings, tag
+from django.utils import timezone
+
+import requests_mock
+from freezegun import freeze_time
+from kombu.exceptions import OperationalError
+from notifications_api_common.models import NotificationsConfig
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.components.zaken.tests.utils import ZAAK_WRITE_KWARGS
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..models import FailedNotification, OutboxNotification
+from ..tasks import DELIVERY_LEASE, deliver_notifications, sweep_notifications
+from . import _get_base_url, mock_nrc_oas_get
+from .mixins import NotificationsConfigMixin
+
+ZAAK1 = "http://testserver/zaken/api/v1/zaken/1"
+ZAAK2 = "http://testserver/zaken/api/v1/zaken/2"
+
+
+def get_message(hoofd_object: str, resource_url: str) -> dict:
+    return {
+        "kanaal": "zaken",
+        "hoofdObject": hoofd_object,
+        "resource": "status",
+        "resourceUrl": resource_url,
+        "actie": "create",
+        "aanmaakdatum": "2023-01-01T00:00:00Z",
+        "kenmerken": {},
+    }
+
+
+@tag("notifications")
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX_ENABLED=True)
+@patch("openzaak.notifications.tasks.deliver_notifications.delay")
+class OutboxScheduleTests(NotificationsConfigMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_notification_is_stored_in_transaction(self, mock_deliver):
+        zaak = ZaakFactory.create()
+        zaak_url = reverse(zaak)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                zaak_url, {"toelichting": "changed"}, **ZAAK_WRITE_KWARGS,
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        notification = OutboxNotification.objects.get()
+        self.assertEqual(notification.hoofd_object, f"http://testserver{zaak_url}")
+        self.assertEqual(notification.message["actie"], "partial_update")
+        mock_deliver.assert_called_once_with()
+
+    def test_unavailable_task_queue(self, mock_deliver):
+        mock_deliver.side_effect = OperationalError("connection refused")
+        zaak = ZaakFactory.create()
+
+        with self.assertLogs("openzaak.notifications.tasks", "WARNING"):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.patch(
+                    reverse(zaak), {"toelichting": "changed"}, **ZAAK_WRITE_KWARGS,
+                )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertTrue(OutboxNotification.objects.exists())
+
+
+@tag("notifications")
+@freeze_time("2023-01-01")
+@requests_mock.Mocker()
+@patch("openzaak.notifications.tasks.deliver_notifications.apply_async")
+@patch("openzaak.notifications.tasks.deliver_notifications.delay")
+class OutboxDeliveryTests(NotificationsConfigMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        config = NotificationsConfig.get_solo()
+        config.notification_delivery_max_retries = 1
+        config.save()
+
+    def _mock_send(self, m, failing=()):
+        delivered = []
+
+        def callback(request, context):
+            message = request.json()
+            if message["resourceUrl"] in failing:
+                context.status_code = 500
+                return {"detail": "error"}
+            delivered.append(message["resourceUrl"])
+            context.status_code = 201
+            return message
+
+        mock_nrc_oas_get(m)
+        m.post(f"{_get_base_url()}notificaties", json=callback)
+        return delivered
+
+    def test_deliver_batch(self, m, mock_delay, mock_apply_async):
+        delivered = self._mock_send(m)
+        for resource_url in ("a", "b", "c"):
+            OutboxNotification.objects.create(
+                hoofd_object=ZAAK1, message=get_message(ZAAK1, resource_url)
+            )
+
+        deliver_notifications()
+
+        self.assertEqual(delivered, ["a", "b", "c"])
+        self.assertFalse(OutboxNotification.objects.exists())
+        mock_apply_async.assert_not_called()
+
+    def test_failure_holds_back_notifications_of_same_main_object(
+        self, m, mock_delay, mock_apply_async
+    ):
+        delivered = self._mock_send(m, failing=("a",))
+        OutboxNotification.objects.create(
+            hoofd_object=ZAAK1, message=get_message(ZAAK1, "a")
+        )
+        OutboxNotification.objects.create(
+            hoofd_object=ZAAK2, message=get_message(ZAAK2, "b")
+        )
+        OutboxNotification.objects.create(
+            hoofd_object=ZAAK1, message=get_message(ZAAK1, "c")
+        )
+
+        deliver_notifications()
+
+        self.assertEqual(delivered, ["b"])
+        failed = OutboxNotification.objects.get(message__resourceUrl="a")
+        self.assertEqual(failed.attempts, 1)
+        self.assertGreater(failed.next_attempt, timezone.now())
+        mock_apply_async.assert_called_once_with(eta=failed.next_attempt)
+
+        with self.subTest("retry is not due yet"):
+            deliver_notifications()
+
+            self.assertEqual(delivered, ["b"])
+
+        with self.subTest("retry is due"), freeze_time("2023-01-02"):
+            delivered = self._mock_send(m)
+
+            deliver_notifications()
+
+            self.assertEqual(delivered, ["a", "c"])
+            self.assertFalse(OutboxNotification.objects.exists())
+
+    def test_final_failure_is_logged(self, m, mock_delay, mock_apply_async):
+        self._mock_send(m, failing=("a",))
+        OutboxNotification.objects.create(
+            hoofd_object=ZAAK1, message=get_message(ZAAK1, "a"), attempts=1
+        )
+
+        deliver_notifications()
+
+        self.assertFalse(OutboxNotification.objects.exists())
+        failed = FailedNotification.objects.get()
+        self.assertEqual(failed.message, get_message(ZAAK1, "a"))
+
+    def test_sweep_delivers_unscheduled_notifications(
+        self, m, mock_delay, mock_apply_async
+    ):
+        delivered = self._mock_send(m)
+        OutboxNotification.objects.create(
+            hoofd_object=ZAAK1, message=get_message(ZAAK1, "a")
+        )
+
+        sweep_notifications()
+
+        self.assertEqual(delivered, ["a"])
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    def test_claimed_notifications_are_delivered_after_lease(
+        self, m, mock_delay, mock_apply_async
+    ):
+        delivered = self._mock_send(m)
+        OutboxNotification.objects.create(
+            hoofd_object=ZAAK1, message=get_message(ZAAK1, "a")
+        )
+        OutboxNotification.objects.create(
+            hoofd_object=ZAAK1, message=get_message(ZAAK1, "b")
+        )
+
+        # the task does not finish
+        with patch(
+            "openzaak.notifications.tasks._deliver_in_order", side_effect=RuntimeError
+        ):
+            with self.assertRaises(RuntimeError):
+                deliver_notifications()
+
+        leased = OutboxNotification.objects.all()
+        self.assertEqual(len(leased), 2)
+        for notification in leased:
+            self.assertEqual(notification.next_attempt, timezone.now() + DELIVERY_LEASE)
+
+        with self.subTest("lease is not expired"):
+            sweep_notifications()
+
+            self.assertEqual(delivered, [])
+
+        with self.subTest("lease is expired"), freeze_time(
+            timezone.now() + DELIVERY_LEASE + timedelta(seconds=1)
+        ):
+            sweep_notifications()
+
+            self.assertEqual(delivered, ["a", "b"])
+            self.assertFalse(OutboxNotification.objects.exists())
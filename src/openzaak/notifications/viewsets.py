@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+"""
+Notification mixins scheduling the messages through :mod:`openzaak.notifications.tasks`.
+"""
+import logging
+from typing import Dict, List, Union
+
+from django.db import models
+
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.settings import get_setting
+from notifications_api_common.viewsets import (
+    NotificationCreateMixin as _NotificationCreateMixin,
+    NotificationDestroyMixin as _NotificationDestroyMixin,
+    NotificationMixin as _NotificationMixin,
+    NotificationUpdateMixin as _NotificationUpdateMixin,
+)
+
+from .tasks import schedule_notifications
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationMixin(_NotificationMixin):
+    def notify(
+        self, status_code: int, data: Union[List, Dict], instance: models.Model = None
+    ) -> None:
+        if get_setting("NOTIFICATIONS_DISABLED"):
+            return
+
+        if not 200 <= status_code < 300:
+            logger.info(
+                "Not notifying, status code '%s' does not represent success.",
+                status_code,
+            )
+            return
+
+        message = self.construct_message(data, instance=instance)
+
+        # hard-fail inside the transaction if the configuration is incomplete
+        client = NotificationsConfig.get_client()
+        if client is None:
+            raise RuntimeError("Could not build a client for Notifications API")
+
+        schedule_notifications([message])
+
+
+class NotificationCreateMixin(NotificationMixin, _NotificationCreateMixin):
+    pass
+
+
+class NotificationUpdateMixin(NotificationMixin, _NotificationUpdateMixin):
+    pass
+
+
+class NotificationDestroyMixin(NotificationMixin, _NotificationDestroyMixin):
+    pass
+
+
+class NotificationViewSetMixin(
+    NotificationCreateMixin, NotificationUpdateMixin, NotificationDestroyMixin
+):
+    pass
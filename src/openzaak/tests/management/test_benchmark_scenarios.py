@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+
+from rest_framework.test import APITestCase
+from vng_api_common.authorizations.models import Applicatie
+
+from openzaak.management.commands.benchmark_scenarios import SCENARIOS
+
+
+class BenchmarkScenariosTests(APITestCase):
+    def run_benchmark(self, **options) -> dict:
+        output = StringIO()
+        call_command(
+            "benchmark_scenarios",
+            iterations=1,
+            warmup=0,
+            samples=2,
+            has_auth_checks=10,
+            interactive=False,
+            stdout=output,
+            stderr=StringIO(),
+            **options,
+        )
+        return json.loads(output.getvalue())
+
+    def test_benchmark_scenarios(self):
+        report = self.run_benchmark(
+            generate_data=True, zaken=2, zaaktypen=1, authorizations="types"
+        )
+
+        self.assertEqual(report["error_count"], 0, report["errors"])
+        self.assertEqual(set(report["scenarios"]), set(SCENARIOS))
+        self.assertEqual(report["scenarios"]["create_zaak"]["requests"], 3)
+
+        zaken = report["requests"]["GET /zaken/api/v1/zaken"]
+        self.assertEqual(zaken["count"], 1)
+        self.assertEqual(zaken["status_codes"], {"200": 1})
+        self.assertGreater(zaken["queries"]["max"], 0)
+        self.assertEqual(set(zaken["latency_ms"]), {"p50", "p90", "p95", "p99", "max"})
+
+        self.assertTrue(report["has_auth"]["same_results"])
+        # the benchmark client is removed afterwards
+        self.assertFalse(Applicatie.objects.exists())
+
+    def test_no_data(self):
+        with self.assertRaises(CommandError):
+            self.run_benchmark()
+
+    @patch("builtins.input", return_value="no")
+    def test_cancel(self, m_input):
+        output = StringIO()
+
+        with self.assertRaisesMessage(CommandError, "Benchmark cancelled."):
+            call_command("benchmark_scenarios", generate_data=True, stdout=output)
+
+        m_input.assert_called_once()
+        self.assertEqual(output.getvalue(), "")
+        self.assertFalse(Applicatie.objects.exists())
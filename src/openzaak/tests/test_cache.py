@@ -1,8 +1,18 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
-from django.test import TestCase
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
 
-from openzaak.utils.cache import DjangoCacheStorage
+from vng_api_common.caching.etags import EtagUpdate, MethodCallback
+
+from openzaak.components.catalogi.tests.factories import StatusTypeFactory
+from openzaak.utils.cache import (
+    DjangoCacheStorage,
+    LocalLRUCache,
+    defer_etag_updates,
+    get_cache_generation,
+    invalidate_cache_generation,
+)
 
 
 class DjangoCacheStorageTestCase(TestCase):
@@ -52,3 +62,81 @@ class DjangoCacheStorageTestCase(TestCase):
 
         self.assertFalse("foo" in self.storage)
         self.assertFalse("bar" in self.storage)
+
+
+class LocalLRUCacheTestCase(SimpleTestCase):
+    def test_get_set(self):
+        cache = LocalLRUCache(maxsize=2)
+
+        cache.set("foo", "bar")
+
+        self.assertEqual(cache.get("foo"), "bar")
+        self.assertIsNone(cache.get("bar"))
+        self.assertEqual(cache.get("bar", "default"), "default")
+
+    def test_evicts_least_recently_used(self):
+        cache = LocalLRUCache(maxsize=2)
+        cache.set("foo", 1)
+        cache.set("bar", 2)
+        cache.get("foo")
+
+        cache.set("baz", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("foo"), 1)
+        self.assertIsNone(cache.get("bar"))
+        self.assertEqual(cache.get("baz"), 3)
+
+
+class CacheGenerationTestCase(SimpleTestCase):
+    def test_generation_is_stable_until_invalidated(self):
+        generation = get_cache_generation("test")
+
+        self.assertEqual(get_cache_generation("test"), generation)
+
+        invalidate_cache_generation("test")
+
+        self.assertNotEqual(get_cache_generation("test"), generation)
+
+
+class DeferEtagUpdatesTestCase(TestCase):
+    def _get_etag_updates(self) -> list:
+        return [
+            func
+            for _, func in connection.run_on_commit
+            if isinstance(func, MethodCallback)
+        ]
+
+    def test_etags_are_cleared_instead_of_scheduled(self):
+        statustype = StatusTypeFactory.create()
+        statustype.calculate_etag_value()
+        zaaktype = statustype.zaaktype
+        zaaktype.calculate_etag_value()
+        etag_updates = self._get_etag_updates()
+
+        with defer_etag_updates():
+            statustype.statustype_omschrijving = "changed"
+            statustype.save()
+
+        self.assertEqual(self._get_etag_updates(), etag_updates)
+        statustype.refresh_from_db()
+        zaaktype.refresh_from_db()
+        self.assertEqual(statustype._etag, "")
+        self.assertEqual(zaaktype._etag, "")
+
+    def test_etag_updates_are_only_deferred_within_the_block(self):
+        mark_affected = EtagUpdate.mark_affected
+
+        with defer_etag_updates():
+            self.assertNotEqual(EtagUpdate.mark_affected, mark_affected)
+
+        self.assertEqual(EtagUpdate.mark_affected, mark_affected)
+
+        statustype = StatusTypeFactory.create()
+        statustype.statustype_omschrijving = "changed"
+        statustype.save()
+
+        self.assertIn(
+            MethodCallback(EtagUpdate(instance=statustype).calculate_new_value),
+            self._get_etag_updates(),
+        )
@@ -1,16 +1,29 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2021 Dimpact
-from django.test import override_settings
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.test import APITestCase
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.scopes import OPERATOR_AND, OPERATOR_OR, Scope
 from vng_api_common.tests import reverse
 
-from openzaak.components.autorisaties.middleware import JWTAuth
+from openzaak.components.autorisaties.middleware import (
+    AuthorizationIndex,
+    AutorisatieData,
+    JWTAuth,
+)
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
 from openzaak.components.zaken.tests.factories import ZaakFactory
-from openzaak.components.zaken.tests.utils import ZAAK_WRITE_KWARGS
+from openzaak.components.zaken.tests.utils import ZAAK_READ_KWARGS, ZAAK_WRITE_KWARGS
 from openzaak.tests.utils import JWTAuthMixin, generate_jwt_auth
 
 
@@ -123,3 +136,185 @@ class JWTRegressionTests(JWTAuthMixin, APITestCase):
         response = self.client.patch(endpoint, data={}, **ZAAK_WRITE_KWARGS)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+@override_settings(AUTHORIZATIONS_CACHE_TIMEOUT=60)
+class JWTAuthCacheTests(JWTAuthMixin, APITestCase):
+    scopes = [str(SCOPE_ZAKEN_ALLES_LEZEN)]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create(concept=False)
+        super().setUpTestData()
+
+    def _get_auth_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [
+            query["sql"]
+            for query in context.captured_queries
+            if '"authorizations_applicatie"' in query["sql"]
+            or '"authorizations_autorisatie"' in query["sql"]
+        ]
+
+    def test_applicaties_are_cached_across_requests(self):
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        zaak_url = reverse(zaak)
+
+        self.assertNotEqual(self._get_auth_queries(zaak_url), [])
+        self.assertEqual(self._get_auth_queries(zaak_url), [])
+
+    def test_changed_autorisatie_is_picked_up(self):
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        zaak_url = reverse(zaak)
+        self.client.get(zaak_url, **ZAAK_READ_KWARGS)
+
+        self.autorisatie.scopes = []
+        self.autorisatie.save()
+
+        response = self.client.get(zaak_url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch("openzaak.components.autorisaties.cache.time")
+    def test_changes_without_signals_are_picked_up_after_timeout(self, mock_time):
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        zaak_url = reverse(zaak)
+        mock_time.time.return_value = 1000.0
+        self.client.get(zaak_url, **ZAAK_READ_KWARGS)
+
+        # an update of the queryset doesn't send the signals invalidating the cache
+        Autorisatie.objects.filter(pk=self.autorisatie.pk).update(scopes=[])
+
+        mock_time.time.return_value = 1059.0
+        response = self.client.get(zaak_url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        mock_time.time.return_value = 1061.0
+        response = self.client.get(zaak_url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+def combine(operator: str, *scopes: Scope) -> Scope:
+    # ``Scope.__or__`` would add the combined scope to the registry
+    combined = Scope(
+        f" {operator} ".join(scope.label for scope in scopes), private=True
+    )
+    combined.children = list(scopes)
+    combined.operator = operator
+    return combined
+
+
+class AuthorizationIndexTests(SimpleTestCase):
+    zaaktype = "https://example.com/zaaktypen/1"
+    other_zaaktype = "https://example.com/zaaktypen/2"
+
+    def setUp(self):
+        super().setUp()
+
+        self.read = Scope("test.lezen", private=True)
+        self.write = Scope("test.bijwerken", private=True)
+        self.delete = Scope("test.verwijderen", private=True)
+        self.index = AuthorizationIndex(
+            [
+                AutorisatieData(
+                    component=ComponentTypes.zrc,
+                    scopes=("test.lezen", "test.bijwerken"),
+                    zaaktype=self.zaaktype,
+                    informatieobjecttype="",
+                    besluittype="",
+                    max_vertrouwelijkheidaanduiding=(
+                        VertrouwelijkheidsAanduiding.zaakvertrouwelijk
+                    ),
+                ),
+                AutorisatieData(
+                    component=ComponentTypes.zrc,
+                    scopes=("test.verwijderen",),
+                    zaaktype=self.other_zaaktype,
+                    informatieobjecttype="",
+                    besluittype="",
+                    max_vertrouwelijkheidaanduiding=(
+                        VertrouwelijkheidsAanduiding.openbaar
+                    ),
+                ),
+            ]
+        )
+
+    def test_scopes(self):
+        self.assertTrue(self.index.has_scopes(ComponentTypes.zrc, self.read))
+        self.assertTrue(
+            self.index.has_scopes(
+                ComponentTypes.zrc, combine(OPERATOR_OR, self.read, self.delete)
+            )
+        )
+        self.assertFalse(self.index.has_scopes(ComponentTypes.drc, self.read))
+        self.assertFalse(
+            self.index.has_scopes(
+                ComponentTypes.zrc, Scope("test.onbekend", private=True)
+            )
+        )
+
+    def test_combined_scopes(self):
+        read_and_write = combine(OPERATOR_AND, self.read, self.write)
+        read_and_delete = combine(OPERATOR_AND, self.read, self.delete)
+
+        self.assertTrue(self.index.has_scopes(ComponentTypes.zrc, read_and_write))
+        self.assertTrue(self.index.has_scopes(ComponentTypes.zrc, read_and_delete))
+        self.assertFalse(
+            self.index.has_scopes(
+                ComponentTypes.zrc, read_and_delete, zaaktype=self.zaaktype
+            )
+        )
+
+    def test_zaaktype(self):
+        self.assertTrue(
+            self.index.has_scopes(ComponentTypes.zrc, self.read, zaaktype=self.zaaktype)
+        )
+        self.assertFalse(
+            self.index.has_scopes(
+                ComponentTypes.zrc, self.read, zaaktype=self.other_zaaktype
+            )
+        )
+
+    def test_vertrouwelijkheidaanduiding(self):
+        for va, expected in [
+            (VertrouwelijkheidsAanduiding.openbaar, True),
+            (VertrouwelijkheidsAanduiding.zaakvertrouwelijk, True),
+            (VertrouwelijkheidsAanduiding.geheim, False),
+        ]:
+            with self.subTest(vertrouwelijkheidaanduiding=va):
+                self.assertEqual(
+                    self.index.has_scopes(
+                        ComponentTypes.zrc,
+                        self.read,
+                        zaaktype=self.zaaktype,
+                        vertrouwelijkheidaanduiding=va,
+                    ),
+                    expected,
+                )
+
+    def test_invalid_values(self):
+        self.assertFalse(
+            self.index.has_scopes(
+                ComponentTypes.zrc, self.read, zaaktype=[self.zaaktype]
+            )
+        )
+        self.assertFalse(
+            self.index.has_scopes(
+                ComponentTypes.zrc, self.read, zaaktype={"url": self.zaaktype}
+            )
+        )
+        self.assertEqual(len(self.index._granted_masks), 0)
+
+    def test_granted_masks_are_bounded(self):
+        with patch.object(self.index._granted_masks, "maxsize", 2):
+            for i in range(5):
+                self.index.has_scopes(
+                    ComponentTypes.zrc, self.read, zaaktype=f"{self.zaaktype}/{i}"
+                )
+
+        self.assertEqual(len(self.index._granted_masks), 2)
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+import requests_mock
+from django_loose_fk.loaders import FetchError
+from freezegun import freeze_time
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
+
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.components.zaken.tests.utils import get_zaaktype_response
+from openzaak.loaders import (
+    AuthorizedRequestsLoader,
+    _auth_headers,
+    loose_fk_cache_stats,
+    prefetch_external_objects,
+)
+
+CATALOGUS = "https://externe.catalogus.nl/api/v1/catalogussen/1c8e36be-338c-4c07-ac5e-1adf55bec04a"
+ZAAKTYPE = (
+    "https://externe.catalogus.nl/api/v1/zaaktypen/b71f72ef-198d-44d8-af64-ae1932df830a"
+)
+ZAAKTYPE2 = (
+    "https://externe.catalogus.nl/api/v1/zaaktypen/d530aa07-3e4e-42ff-9be8-3247b3a6e7e3"
+)
+
+
+@override_settings(LOOSE_FK_REQUESTS_CACHE_TIMEOUT=60)
+class AuthorizedRequestsLoaderCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        for cleanup in (
+            caches["loose_fk_requests"].clear,
+            _auth_headers.clear,
+            loose_fk_cache_stats.reset,
+        ):
+            cleanup()
+            self.addCleanup(cleanup)
+
+    def test_response_is_cached(self):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json={"url": ZAAKTYPE, "omschrijving": "foo"})
+
+            data1 = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+            data2 = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(data1, data2)
+        self.assertEqual(data1["omschrijving"], "foo")
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(loose_fk_cache_stats.as_dict(), {"hits": 1, "misses": 1})
+
+    def test_expired_response_is_revalidated(self):
+        with requests_mock.Mocker() as m:
+            m.get(
+                ZAAKTYPE,
+                [
+                    {
+                        "json": {"url": ZAAKTYPE, "omschrijving": "foo"},
+                        "headers": {"ETag": '"abc"'},
+                    },
+                    {"status_code": 304, "headers": {"ETag": '"abc"'}},
+                ],
+            )
+
+            with freeze_time("2023-01-01T12:00:00"):
+                AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+            with freeze_time("2023-01-01T12:05:00"):
+                data = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(data["omschrijving"], "foo")
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+
+    @override_settings(LOOSE_FK_REQUESTS_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+
+            AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+            AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
+
+
+@override_settings(LOOSE_FK_REQUESTS_CACHE_TIMEOUT=0)
+class PrefetchExternalObjectsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        Service.objects.create(
+            api_root="https://externe.catalogus.nl/api/v1/", api_type=APITypes.ztc
+        )
+        ZaakFactory.create(zaaktype=ZAAKTYPE)
+        ZaakFactory.create(zaaktype=ZAAKTYPE)
+        ZaakFactory.create(zaaktype=ZAAKTYPE2)
+
+    def test_distinct_objects_are_fetched_once(self):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json=get_zaaktype_response(CATALOGUS, ZAAKTYPE))
+            m.get(
+                ZAAKTYPE2,
+                json=get_zaaktype_response(CATALOGUS, ZAAKTYPE2, omschrijving="other"),
+            )
+
+            zaken = prefetch_external_objects(Zaak.objects.order_by("pk"), "zaaktype")
+            omschrijvingen = [zaak.zaaktype.omschrijving for zaak in zaken]
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(omschrijvingen, ["Main zaaktype", "Main zaaktype", "other"])
+
+    def test_failed_fetch_is_raised_on_access(self):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json=get_zaaktype_response(CATALOGUS, ZAAKTYPE))
+            m.get(ZAAKTYPE2, status_code=404)
+
+            zaken = prefetch_external_objects(Zaak.objects.order_by("pk"), "zaaktype")
+
+            self.assertEqual(zaken[0].zaaktype.omschrijving, "Main zaaktype")
+            with self.assertRaises(FetchError):
+                zaken[2].zaaktype
+
+    def test_setting_the_field_discards_the_prefetched_object(self):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json=get_zaaktype_response(CATALOGUS, ZAAKTYPE))
+            m.get(
+                ZAAKTYPE2,
+                json=get_zaaktype_response(CATALOGUS, ZAAKTYPE2, omschrijving="other"),
+            )
+            zaak = prefetch_external_objects(
+                Zaak.objects.filter(_zaaktype_relative_url__endswith="830a")[:1],
+                "zaaktype",
+            )[0]
+
+            zaak.zaaktype = ZAAKTYPE2
+
+            self.assertEqual(zaak.zaaktype.omschrijving, "other")
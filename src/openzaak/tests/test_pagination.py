@@ -0,0 +1,195 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+import json
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import get_validation_errors, reverse
+
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.components.zaken.tests.utils import (
+    ZAAK_READ_KWARGS,
+    ZAAK_WRITE_KWARGS,
+    get_operation_url,
+)
+from openzaak.tests.utils import JWTAuthMixin
+from openzaak.utils.pagination import (
+    OptimizedCursorPagination,
+    OptimizedPagination,
+    get_estimated_count,
+)
+
+
+class PaginationCountTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_planner_estimate(self):
+        ZaakFactory.create_batch(2)
+
+        estimate = get_estimated_count(Zaak.objects.all())
+
+        self.assertIsInstance(estimate, int)
+
+    @override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=100)
+    @patch("openzaak.utils.pagination.get_estimated_count", return_value=1000)
+    def test_large_result_set_returns_estimate(self, m):
+        ZaakFactory.create_batch(2)
+
+        response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(response_data["count"], 1000)
+        self.assertEqual(len(response_data["results"]), 2)
+        # the estimate must not result in links to empty pages
+        self.assertIsNone(response_data["next"])
+
+    @override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=1)
+    @patch.object(OptimizedPagination, "page_size", 2)
+    @patch("openzaak.utils.pagination.get_estimated_count", return_value=1)
+    def test_pages_beyond_estimate_are_reachable(self, m):
+        ZaakFactory.create_batch(3)
+
+        response = self.client.get(
+            reverse("zaak-list"), {"page": 2}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 1)
+
+        response = self.client.get(
+            reverse("zaak-list"), {"page": 3}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=100)
+    @patch("openzaak.utils.pagination.get_estimated_count", return_value=10)
+    def test_small_result_set_returns_exact_count(self, m):
+        ZaakFactory.create_batch(2)
+
+        response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 2)
+
+    @override_settings(PAGINATION_COUNT_CACHE_TIMEOUT=60)
+    def test_count_is_cached(self):
+        ZaakFactory.create_batch(2)
+        self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+        ZaakFactory.create()
+
+        response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(response_data["count"], 2)
+        self.assertEqual(len(response_data["results"]), 3)
+
+        with self.subTest("different filters"):
+            response = self.client.get(
+                reverse("zaak-list"),
+                {"bronorganisatie": "517439943"},
+                **ZAAK_READ_KWARGS,
+            )
+
+            self.assertEqual(response.json()["count"], 0)
+
+
+@patch.object(OptimizedCursorPagination, "page_size", 3)
+class StreamingResponseTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @override_settings(STREAMING_RESPONSE_CHUNK_SIZE=2)
+    def test_list_is_streamed(self):
+        ZaakFactory.create_batch(4)
+        url = reverse("zaak-list")
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        streamed_data = json.loads(b"".join(response.streaming_content))
+
+        with override_settings(STREAMING_RESPONSE_CHUNK_SIZE=0):
+            response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertFalse(response.streaming)
+        self.assertEqual(streamed_data, response.json())
+        self.assertEqual(streamed_data["count"], 4)
+        self.assertEqual(len(streamed_data["results"]), 3)
+        self.assertIsNotNone(streamed_data["next"])
+
+    @override_settings(STREAMING_RESPONSE_CHUNK_SIZE=2)
+    def test_empty_list_is_streamed(self):
+        response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json.loads(b"".join(response.streaming_content)),
+            {"count": 0, "next": None, "previous": None, "results": []},
+        )
+
+    @override_settings(STREAMING_RESPONSE_CHUNK_SIZE=1)
+    def test_search_is_streamed(self):
+        zaak1, zaak2, zaak3 = ZaakFactory.create_batch(3)
+
+        response = self.client.post(
+            get_operation_url("zaak__zoek"),
+            {"uuid__in": [zaak1.uuid, zaak2.uuid]},
+            **ZAAK_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(
+            {zaak["url"] for zaak in data["results"]},
+            {
+                f"http://testserver{reverse(zaak1)}",
+                f"http://testserver{reverse(zaak2)}",
+            },
+        )
+
+    @override_settings(STREAMING_RESPONSE_CHUNK_SIZE=2)
+    def test_page_size_below_chunk_size_is_not_streamed(self):
+        with patch.object(OptimizedCursorPagination, "page_size", 2):
+            response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.streaming)
+
+    @override_settings(STREAMING_RESPONSE_CHUNK_SIZE=2)
+    def test_streamed_list_checks_query_params(self):
+        response = self.client.get(
+            reverse("zaak-list"), {"unknown": "value"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "unknown-parameters")
+
+    @override_settings(STREAMING_RESPONSE_CHUNK_SIZE=2)
+    def test_cursor_page_is_not_streamed(self):
+        ZaakFactory.create_batch(4)
+
+        response = self.client.get(
+            reverse("zaak-list"), {"cursor": ""}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.json()["results"]), 3)
+        self.assertIn("cursor=", response.json()["next"])
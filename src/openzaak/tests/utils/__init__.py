@@ -24,6 +24,7 @@ from .mocks import (
     patch_resource_validator,
 )
 from .oas import get_spec
+from .query_budget import QueryBudget, QueryBudgetMixin
 
 __all__ = [
     # mocks
@@ -55,4 +56,7 @@ __all__ = [
     "FkOrServiceUrlFactoryMixin",
     # migrations
     "TestMigrations",
+    # query budgets
+    "QueryBudget",
+    "QueryBudgetMixin",
 ]
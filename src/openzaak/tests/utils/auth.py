@@ -8,6 +8,8 @@ from vng_api_common.models import JWTSecret
 from vng_api_common.tests import reverse
 from zds_client import ClientAuth
 
+from openzaak.components.autorisaties.cache import invalidate_authorizations_cache
+
 
 def generate_jwt_auth(
     client_id: str,
@@ -92,6 +94,10 @@ class JWTAuthMixin:
     def setUp(self):
         super().setUp()
 
+        # changes made in previous tests are rolled back in the database, but not
+        # in the cache
+        invalidate_authorizations_cache()
+
         token = generate_jwt_auth(
             client_id=self.client_id,
             secret=self.secret,
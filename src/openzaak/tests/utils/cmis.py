@@ -18,6 +18,8 @@ from rest_framework.test import APITestCase, APITransactionTestCase
 from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
 
+from openzaak.components.documenten.caching import invalidate_cmis_cache
+
 from .helpers import can_connect
 from .mocks import MockSchemasMixin, get_eio_response
 
@@ -113,6 +115,7 @@ class CMISMixin(MockSchemasMixin):
         # Removes the created documents from alfresco
         client = get_cmis_client()
         client.delete_cmis_folders_in_base()
+        invalidate_cmis_cache()
 
 
 class APICMISTestCase(CMISMixin, APITestCase):
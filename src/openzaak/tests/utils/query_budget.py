@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+"""
+Query budgets for the API operations.
+
+A budget declares how many extra queries an operation may do for every extra
+(related) object involved in the request, so N+1 queries introduced in viewsets
+or serializers make the test suite fail.
+"""
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple, Union
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+Setup = Callable[[int], Union[str, Tuple[str, dict]]]
+
+
+@dataclass
+class QueryBudget:
+    """
+    The query budget of an API operation.
+
+    ``setup`` creates the data for a request involving ``n`` (related) objects
+    and returns the URL to request, or the URL and the request body.
+    """
+
+    name: str
+    setup: Setup
+    method: str = "get"
+    per_object: int = 0
+    status_code: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class QueryBudgetResult:
+    name: str
+    method: str
+    num_objects: int
+    queries_single: int
+    queries: int
+    budget: int
+
+    @property
+    def extra_queries(self) -> int:
+        return self.queries - self.queries_single
+
+    @property
+    def within_budget(self) -> bool:
+        return self.extra_queries <= self.budget
+
+    def as_dict(self) -> dict:
+        return {
+            "num_objects": self.num_objects,
+            "queries_single": self.queries_single,
+            "queries": self.queries,
+            "extra_queries": self.extra_queries,
+            "budget": self.budget,
+            "within_budget": self.within_budget,
+        }
+
+
+def write_report(path: str, results: List[QueryBudgetResult]) -> None:
+    """
+    Add the results to the JSON report at ``path``, keeping other results.
+    """
+    try:
+        with open(path) as infile:
+            report = json.load(infile)
+    except FileNotFoundError:
+        report = {}
+
+    for result in results:
+        report[f"{result.method.upper()} {result.name}"] = result.as_dict()
+
+    with open(path, "w") as outfile:
+        json.dump(report, outfile, indent=2, sort_keys=True)
+
+
+class QueryBudgetMixin:
+    """
+    Check the ``query_budgets`` of the test case.
+
+    Every operation is measured with a single and with ``num_objects`` (related)
+    objects, and the difference in queries may not exceed
+    ``per_object * (num_objects - 1)``. Set the ``QUERY_BUDGET_REPORT``
+    environment variable to a file path to get a JSON report of the actual versus
+    the budgeted queries.
+    """
+
+    query_budgets: List[QueryBudget] = []
+    num_objects = 5
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.query_budget_results = []
+
+    @classmethod
+    def tearDownClass(cls):
+        report = os.getenv("QUERY_BUDGET_REPORT")
+        if report and cls.query_budget_results:
+            write_report(report, cls.query_budget_results)
+        super().tearDownClass()
+
+    def count_queries(self, budget: QueryBudget, num_objects: int) -> int:
+        # roll back the data of every measurement, so they don't affect each other
+        with transaction.atomic():
+            request = budget.setup(num_objects)
+            url, data = request if isinstance(request, tuple) else (request, None)
+            do_request = getattr(self.client, budget.method)
+
+            with CaptureQueriesContext(connection) as context:
+                with self.captureOnCommitCallbacks(execute=True):
+                    response = do_request(url, data, **budget.headers)
+
+            transaction.set_rollback(True)
+
+        self.assertEqual(
+            response.status_code, budget.status_code, getattr(response, "data", None)
+        )
+        return len(context)
+
+    def check_query_budget(self, budget: QueryBudget) -> QueryBudgetResult:
+        # warm up the caches that are shared between requests
+        self.count_queries(budget, 1)
+
+        result = QueryBudgetResult(
+            name=budget.name,
+            method=budget.method,
+            num_objects=self.num_objects,
+            queries_single=self.count_queries(budget, 1),
+            queries=self.count_queries(budget, self.num_objects),
+            budget=budget.per_object * (self.num_objects - 1),
+        )
+        self.query_budget_results.append(result)
+        return result
+
+    def test_query_budgets(self):
+        for budget in self.query_budgets:
+            with self.subTest(name=budget.name, method=budget.method):
+                result = self.check_query_budget(budget)
+
+                self.assertTrue(
+                    result.within_budget,
+                    f"{budget.method.upper()} {budget.name} did {result.queries} "
+                    f"queries with {result.num_objects} objects and "
+                    f"{result.queries_single} with a single object, "
+                    f"{result.extra_queries} extra queries exceed the budget of "
+                    f"{result.budget}",
+                )
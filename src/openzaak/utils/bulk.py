@@ -0,0 +1,304 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+from typing import Dict, List, Tuple
+from urllib.parse import urlparse
+from uuid import UUID
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from djangorestframework_camel_case.util import camelize
+from drf_yasg.utils import swagger_auto_schema
+from notifications_api_common.api.serializers import NotificatieSerializer
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.settings import get_setting
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.audittrails.viewsets import AuditTrailMixin
+from vng_api_common.compat import get_header
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.permissions import bypass_permissions, get_required_scopes
+from vng_api_common.utils import (
+    NotAViewSet,
+    get_resource_for_path,
+    get_viewset_for_path,
+)
+
+from openzaak.notifications.tasks import schedule_notifications
+from openzaak.notifications.viewsets import NotificationMixin
+
+BULK_READ_MAX_SIZE = 100
+BULK_CREATE_MAX_SIZE = 1000
+
+
+def build_create_records(
+    view, data: List[dict], instances: list
+) -> Tuple[List[AuditTrail], List[dict]]:
+    """
+    Build the audit trails and notifications of the objects created by ``view``.
+
+    This is a copy of :meth:`AuditTrailMixin.create_audittrail` and
+    :meth:`NotificationMixin.construct_message` for the ``create`` action, except
+    that nothing is saved, so the audit trails can be inserted at once, and every
+    main object is looked up and serialized only once. The bulk create tests compare
+    the output with a regular create, keep it in sync when upgrading the libraries.
+    """
+    audittrails, messages = [], []
+
+    if isinstance(view, AuditTrailMixin):
+        jwt_auth = view.request.jwt_auth
+        applications = jwt_auth.applicaties
+        if applications:
+            application = applications[0]
+            app_id, app_presentation = str(application.uuid), application.label
+        else:
+            app_id = get_header(view.request, "X-NLX-Request-Application-Id")
+            app_presentation = app_id
+
+        common = {
+            "bron": view.audit.component_name,
+            "logrecord_id": get_header(view.request, "X-NLX-Logrecord-ID") or "",
+            "applicatie_id": app_id,
+            "applicatie_weergave": app_presentation,
+            "actie": CommonResourceAction.create,
+            "actie_weergave": CommonResourceAction.labels.get(
+                CommonResourceAction.create, ""
+            ),
+            "gebruikers_id": jwt_auth.payload.get("user_id") or "",
+            "gebruikers_weergave": jwt_auth.payload.get("user_representation") or "",
+            "resultaat": status.HTTP_201_CREATED,
+            "resource": view.basename,
+            "toelichting": get_header(view.request, "X-Audit-Toelichting") or "",
+        }
+        for item, instance in zip(data, instances):
+            if view.basename == view.audit.main_resource:
+                main_object = item["url"]
+            else:
+                main_object = view.get_audittrail_main_object_url(
+                    item, view.audit.main_resource
+                )
+            audittrails.append(
+                AuditTrail(
+                    hoofd_object=main_object,
+                    resource_url=item["url"],
+                    resource_weergave=instance.unique_representation(),
+                    oud=None,
+                    nieuw=item,
+                    **common,
+                )
+            )
+
+    if isinstance(view, NotificationMixin) and not get_setting(
+        "NOTIFICATIONS_DISABLED"
+    ):
+        kanaal = view.get_kanaal()
+        resource = view.get_queryset().model._meta.model_name
+        main_objects: Dict[str, tuple] = {}
+        for item in data:
+            main_object_url = view.get_notification_main_object_url(item, kanaal)
+            if main_object_url not in main_objects:
+                main_object_path = urlparse(main_object_url).path
+                main_object = get_resource_for_path(main_object_path)
+                main_object_view = get_viewset_for_path(main_object_path)
+                serializer = main_object_view.get_serializer_class()(
+                    main_object, context={"request": view.request}
+                )
+                main_objects[main_object_url] = (main_object, serializer.data)
+
+            main_object, main_object_data = main_objects[main_object_url]
+            message_data = {
+                "kanaal": kanaal.label,
+                "hoofd_object": main_object_url,
+                "resource": resource,
+                "resource_url": item["url"],
+                "actie": CommonResourceAction.create,
+                "aanmaakdatum": timezone.now(),
+                "kenmerken": kanaal.get_kenmerken(main_object, main_object_data),
+            }
+            messages.append(camelize(NotificatieSerializer(instance=message_data).data))
+
+    return audittrails, messages
+
+
+class BulkReadSerializer(serializers.Serializer):
+    urls = serializers.ListField(
+        child=serializers.CharField(),
+        allow_empty=False,
+        max_length=BULK_READ_MAX_SIZE,
+        help_text=_("URLs or UUIDs of the resources to retrieve."),
+    )
+
+    def validate_urls(self, urls: List[str]) -> List[UUID]:
+        view = self.context["view"]
+        uuids = []
+        for url in urls:
+            try:
+                uuids.append(UUID(url))
+                continue
+            except ValueError:
+                pass
+
+            path = urlparse(url).path
+            if settings.FORCE_SCRIPT_NAME and path.startswith(
+                settings.FORCE_SCRIPT_NAME
+            ):
+                path = path[len(settings.FORCE_SCRIPT_NAME) :]
+
+            try:
+                viewset = get_viewset_for_path(path)
+            except (ObjectDoesNotExist, NotAViewSet):
+                viewset = None
+
+            if type(viewset) is not type(view) or viewset.action != "retrieve":
+                raise serializers.ValidationError(
+                    _("'{url}' is not a valid URL or UUID of this resource.").format(
+                        url=url
+                    ),
+                    code="invalid-resource",
+                )
+
+            lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+            uuids.append(viewset.kwargs[lookup_url_kwarg])
+        return uuids
+
+
+class BulkReadMixin:
+    """
+    Retrieve multiple resources of a viewset in one request.
+
+    The ``_bulk_read`` action accepts a list of resource URLs and/or UUIDs and
+    responds with the resources found, in a single (non-paginated) array. This
+    replaces many ``retrieve`` calls, each with their own authentication, permission
+    checks and queries.
+
+    Authorizations are applied the same way as for the ``list`` action: resources
+    the client may not see are left out. Viewsets must add the ``_bulk_read`` action
+    to their ``required_scopes``.
+    """
+
+    authorization_filtered_actions = ("list", "_bulk_read")
+
+    @swagger_auto_schema(auto_schema=None)
+    @action(methods=["post"], detail=False)
+    def _bulk_read(self, request, *args, **kwargs):
+        serializer = BulkReadSerializer(
+            data=request.data, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+
+        queryset = self.get_queryset().filter(
+            **{f"{self.lookup_field}__in": serializer.validated_data["urls"]}
+        )
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+
+class BulkCreateMixin:
+    """
+    Create multiple resources of a viewset in one request.
+
+    The ``_bulk_create`` action accepts an array of objects, in the same format as
+    the ``create`` action. All objects are validated and created in a single
+    transaction - if any of them is invalid, none are created and the errors are
+    reported per array index. The audit trails are written in bulk and the
+    notifications are scheduled at once after the transaction is committed.
+
+    Viewsets must add the ``_bulk_create`` action to their ``required_scopes``.
+    """
+
+    @swagger_auto_schema(auto_schema=None)
+    @action(methods=["post"], detail=False)
+    def _bulk_create(self, request, *args, **kwargs):
+        if not isinstance(request.data, list) or not request.data:
+            raise serializers.ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: _(
+                        "Expected a non-empty array of objects."
+                    )
+                },
+                code="invalid",
+            )
+        if len(request.data) > BULK_CREATE_MAX_SIZE:
+            raise serializers.ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: _(
+                        "At most {max_size} objects can be created at once."
+                    ).format(max_size=BULK_CREATE_MAX_SIZE)
+                },
+                code="max-size",
+            )
+
+        with transaction.atomic():
+            # every object is created right after its validation, so validations
+            # involving the existing records (e.g. max one initiator per zaak) take
+            # the preceding objects into account
+            created, errors = [], {}
+            checked_main_objects = set()
+            for index, data in enumerate(request.data):
+                serializer = self.get_serializer(data=data)
+                if not serializer.is_valid():
+                    errors[str(index)] = serializer.errors
+                    continue
+
+                self.check_bulk_create_permissions(
+                    serializer.validated_data, checked_main_objects
+                )
+                self.perform_create(serializer)
+                created.append(serializer)
+
+            if errors:
+                raise serializers.ValidationError(errors)
+
+            data = [serializer.data for serializer in created]
+            audittrails, messages = build_create_records(
+                self, data, [serializer.instance for serializer in created]
+            )
+            AuditTrail.objects.bulk_create(audittrails)
+            if messages:
+                # hard-fail inside the transaction if the configuration is incomplete
+                client = NotificationsConfig.get_client()
+                if client is None:
+                    raise RuntimeError("Could not build a client for Notifications API")
+                schedule_notifications(messages)
+
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def check_bulk_create_permissions(
+        self, validated_data: dict, checked_main_objects: set
+    ) -> None:
+        """
+        Check the permissions for the main object of every created object once.
+
+        Nested viewsets check the permissions for the parent object in
+        ``has_permission`` already.
+        """
+        if bypass_permissions(self.request):
+            return
+
+        main_object_name = getattr(self, "permission_main_object", None)
+        if not main_object_name:
+            return
+
+        main_object = validated_data[main_object_name]
+        if main_object.pk in checked_main_objects:
+            return
+
+        scopes_required = get_required_scopes(self.request, self)
+        for permission in self.get_permissions():
+            if not getattr(permission, "permission_fields", None):
+                continue
+
+            main_object_data = permission.format_data(main_object, self.request)
+            fields = permission.get_fields(main_object_data)
+            if not self.request.jwt_auth.has_auth(
+                scopes_required, permission.get_component(self), **fields
+            ):
+                self.permission_denied(self.request)
+
+        checked_main_objects.add(main_object.pk)
@@ -1,15 +1,22 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+import threading
+import uuid
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Iterable, Union
+from typing import Any, Dict, Hashable, Iterable, Union
 
 from django.conf import settings
-from django.core.cache import caches
+from django.core.cache import cache, caches
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
 
+import requests
 import requests_cache
 from requests_cache import BaseCache, clear, install_cache, uninstall_cache
 from requests_cache.backends.base import KEY_FN
 from requests_cache.cache_keys import create_key
+from vng_api_common.caching.etags import EtagUpdate
 
 
 class DjangoCacheStorage(requests_cache.BaseStorage):
@@ -17,10 +24,11 @@ class DjangoCacheStorage(requests_cache.BaseStorage):
     Custom storage for requests-cache that uses the Django cache framework
     """
 
-    def __init__(self, cache_name: str, **kwargs):
+    def __init__(self, cache_name: str, keep_expired: int = 0, **kwargs):
         super().__init__(**kwargs)
 
         self.cache = caches[cache_name]
+        self.keep_expired = keep_expired
 
     def __contains__(self, key) -> bool:
         return key in self.cache
@@ -29,9 +37,14 @@ class DjangoCacheStorage(requests_cache.BaseStorage):
         return self.cache.get(key)
 
     def __setitem__(self, key, item):
-        """Save an item to the cache, optionally with TTL"""
+        """
+        Save an item to the cache, optionally with TTL.
+
+        Expired items are kept for ``keep_expired`` more seconds, so they can be
+        revalidated with their ``ETag`` or ``Last-Modified`` header.
+        """
         if getattr(item, "ttl", None):
-            self.cache.set(key, item, timeout=item.ttl)
+            self.cache.set(key, item, timeout=item.ttl + self.keep_expired)
         else:
             self.cache.set(key, item)
 
@@ -74,9 +87,12 @@ class DjangoRequestsCache(requests_cache.BaseCache):
         match_headers: Union[Iterable[str], bool] = False,
         ignored_parameters: Iterable[str] = None,
         key_fn: KEY_FN = None,
+        keep_expired: int = 0,
         **kwargs,
     ):
-        self.responses = DjangoCacheStorage(cache_name=cache_name)
+        self.responses = DjangoCacheStorage(
+            cache_name=cache_name, keep_expired=keep_expired
+        )
         self.redirects = DjangoCacheStorage(cache_name=cache_name)
         self.cache_name = cache_name
 
@@ -96,6 +112,32 @@ class DjangoRequestsCache(requests_cache.BaseCache):
         return f"<{self.__class__.__name__}(name={self.cache_name})>"
 
 
+class RequestsCacheStats:
+    """
+    Thread-safe hit/miss counters of a requests cache.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, response: requests.Response) -> None:
+        with self._lock:
+            if getattr(response, "from_cache", False):
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = self.misses = 0
+
+
 @contextmanager
 def requests_cache_enabled(*args, **kwargs):
     """
@@ -108,3 +150,135 @@ def requests_cache_enabled(*args, **kwargs):
     finally:
         clear()
         uninstall_cache()
+
+
+class LocalLRUCache:
+    """
+    Bounded, process-local cache which evicts the least recently used entries.
+
+    Use this for data which is expensive to build and too large or complex to
+    (un)pickle from a shared cache on every request.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def get_cache_generation(name: str) -> str:
+    """
+    Return the current generation token for a group of cached data.
+
+    The token is shared between processes through the default cache, so that local
+    caches can include it in their keys and are invalidated everywhere at once by
+    :func:`invalidate_cache_generation`. If the shared cache is unavailable, a new
+    token is returned on every call, which effectively disables caching.
+    """
+    key = f"cache-generation:{name}"
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(key) or uuid.uuid4().hex
+    return generation
+
+
+def invalidate_cache_generation(name: str) -> None:
+    cache.set(f"cache-generation:{name}", uuid.uuid4().hex, timeout=None)
+
+
+_deferred_etag_updates = threading.local()
+
+_mark_affected = EtagUpdate.__dict__["mark_affected"]
+_mark_affected_lock = threading.Lock()
+_mark_affected_patches = 0
+
+
+def _deferrable_mark_affected(cls, obj: models.Model, using=None) -> None:
+    affected = getattr(_deferred_etag_updates, "objects", None)
+    if affected is None:
+        _mark_affected.__func__(cls, obj, using=using)
+    else:
+        affected[(type(obj), obj.pk)] = obj
+
+
+@contextmanager
+def _patch_mark_affected():
+    """
+    Route the scheduling of ETag updates through :func:`defer_etag_updates`.
+
+    The method is only replaced while some thread defers the updates. Updates in the
+    other threads are scheduled as usual.
+    """
+    global _mark_affected_patches
+
+    with _mark_affected_lock:
+        if not _mark_affected_patches:
+            EtagUpdate.mark_affected = classmethod(_deferrable_mark_affected)
+        _mark_affected_patches += 1
+    try:
+        yield
+    finally:
+        with _mark_affected_lock:
+            _mark_affected_patches -= 1
+            if not _mark_affected_patches:
+                EtagUpdate.mark_affected = _mark_affected
+
+
+@contextmanager
+def defer_etag_updates():
+    """
+    Collect the objects of which the ETag is affected, rather than scheduling an
+    update for each of them.
+
+    Scheduling an update checks all the callbacks scheduled on the transaction, which
+    gets quadratic when a transaction changes many objects, like an import. At the
+    end, the ETag values of the collected objects are cleared, so they're calculated
+    again when the objects are requested.
+    """
+    if getattr(_deferred_etag_updates, "objects", None) is not None:
+        yield
+        return
+
+    _deferred_etag_updates.objects = affected = {}
+    try:
+        with _patch_mark_affected():
+            yield
+    finally:
+        del _deferred_etag_updates.objects
+
+    pks_by_model = {}
+    for (model, pk), obj in affected.items():
+        try:
+            etag_field = model._meta.get_field("_etag")
+        except FieldDoesNotExist:
+            etag_field = None
+
+        if etag_field is not None and etag_field.concrete:
+            pks_by_model.setdefault(model, set()).add(pk)
+        else:
+            EtagUpdate.mark_affected(obj)
+
+    for model, pks in pks_by_model.items():
+        model._default_manager.filter(pk__in=pks).update(_etag="")
@@ -1,5 +1,8 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
+from django.utils.translation import gettext_lazy as _
+
+from djchoices import ChoiceItem, DjangoChoices
 from vng_api_common.constants import ComponentTypes
 
 COMPONENT_MAPPING = {
@@ -9,3 +12,24 @@ COMPONENT_MAPPING = {
     "documenten": ComponentTypes.drc,
     "besluiten": ComponentTypes.brc,
 }
+
+# name of the cache generation shared by all cached authorization data
+AUTHORIZATIONS_CACHE_GENERATION = "autorisaties"
+# name of the cache generation of the cached published zaaktypen
+CATALOGI_CACHE_GENERATION = "catalogi"
+# name of the cache generation of the cached CMIS query results
+CMIS_CACHE_GENERATION = "cmis"
+
+
+class IdentificatieGenerators(DjangoChoices):
+    lock = ChoiceItem("lock", _("Highest existing number, under a global lock"))
+    counter = ChoiceItem("counter", _("Counter per organisation and year"))
+
+
+class DocumentIdentificatieGenerators(DjangoChoices):
+    """
+    Generators of the identifications of documents and besluiten.
+    """
+
+    highest_number = ChoiceItem("highest-number", _("Highest existing number plus one"))
+    counter = ChoiceItem("counter", _("Sequence per organisation and year"))
@@ -13,6 +13,8 @@ class ListFilterByAuthorizationsMixin:
     :class:`openzaak.utils.query.LooseFkAuthorizationsFilterMixin`
     """
 
+    authorization_filtered_actions = ("list",)
+
     def get_queryset(self):
         base = super().get_queryset()
 
@@ -24,7 +26,7 @@ class ListFilterByAuthorizationsMixin:
         # because the resource _does exist_, you just don't have permission
         # to do those operations. A 403 is semantically more correct than a
         # 404, which would be the result if the queryset is always filtered.
-        if not self.action == "list":
+        if self.action not in self.authorization_filtered_actions:
             return base
 
         # get the auth apps that are relevant for this particular request
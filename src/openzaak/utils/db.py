@@ -2,8 +2,11 @@
 # Copyright (C) 2022 Open Zaak maintainers
 import zlib
 from contextlib import contextmanager
+from typing import Any, Callable, Dict, Type
 
-from django.db import connections, transaction
+from django.db import connections, models, router, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
 
 
 @contextmanager
@@ -15,3 +18,54 @@ def pg_advisory_lock(lock_id: str, using="default"):
             sql = f"SELECT pg_advisory_xact_lock({_lock_id})"
             cursor.execute(sql)
             yield
+
+
+def increment_counter(
+    model: Type[models.Model], key: Dict[str, Any], get_start: Callable[[], int]
+) -> int:
+    """
+    Increment the counter identified by ``key`` and return the new value.
+
+    ``model`` must have a ``value`` field and a unique constraint on the fields in
+    ``key``. The counter row is locked until the transaction exits, so concurrent
+    calls for the same counter wait for each other while calls for other counters
+    can proceed. If the counter doesn't exist yet, it's created with the value
+    ``get_start() + 1``.
+    """
+    connection = connections[router.db_for_write(model)]
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = [
+        connection.ops.quote_name(model._meta.get_field(name).column) for name in key
+    ]
+    params = list(key.values())
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} SET value = value + 1 "
+            f"WHERE {' AND '.join(f'{column} = %s' for column in columns)} "
+            "RETURNING value",
+            params,
+        )
+        row = cursor.fetchone()
+        if row is not None:
+            return row[0]
+
+        # concurrent calls may try to create the counter at the same time
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}, value) "
+            f"VALUES ({', '.join(['%s'] * (len(columns) + 1))}) "
+            f"ON CONFLICT ({', '.join(columns)}) "
+            f"DO UPDATE SET value = {table}.value + 1 "
+            "RETURNING value",
+            params + [get_start() + 1],
+        )
+        return cursor.fetchone()[0]
+
+
+def raise_counter(model: Type[models.Model], key: Dict[str, Any], minimum: int) -> None:
+    """
+    Make sure the value of the counter identified by ``key`` is at least ``minimum``.
+    """
+    model._default_manager.filter(**key).update(
+        value=Greatest(F("value"), Value(minimum))
+    )
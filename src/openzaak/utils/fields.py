@@ -8,7 +8,7 @@ from django.db import models
 from django.db.models.base import Options
 from django.utils.translation import gettext_lazy as _
 
-from django_loose_fk.fields import FkOrURLField
+from django_loose_fk.fields import FkOrURLDescriptor, FkOrURLField
 from relativedeltafield import RelativeDeltaField
 from zgw_consumers.models import ServiceUrlField
 
@@ -85,11 +85,37 @@ class AliasServiceUrlField(AliasMixin, ServiceUrlField):
 FORMFIELD_FOR_DBFIELD_DEFAULTS[DurationField] = {"form_class": RelativeDeltaFormField}
 
 
+# instance attribute holding the remote objects set by
+# :func:`openzaak.loaders.prefetch_external_objects`
+PREFETCHED_OBJECTS_ATTR = "_prefetched_external_objects"
+
+
+class FkOrServiceUrlDescriptor(FkOrURLDescriptor):
+    """
+    Return the prefetched remote object, if there is one.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is not None:
+            prefetched = instance.__dict__.get(PREFETCHED_OBJECTS_ATTR, {})
+            if self.field.name in prefetched:
+                return prefetched[self.field.name]
+        return super().__get__(instance, cls=cls)
+
+    def __set__(self, instance, value):
+        instance.__dict__.get(PREFETCHED_OBJECTS_ATTR, {}).pop(self.field.name, None)
+        super().__set__(instance, value)
+
+
 class FkOrServiceUrlField(FkOrURLField):
     """
     Support :class:`zgw_consumers.ServiceUrlField` as 'url_field'
     """
 
+    def contribute_to_class(self, cls, name, private_only=False):
+        super().contribute_to_class(cls, name, private_only=private_only)
+        setattr(cls, self.name, FkOrServiceUrlDescriptor(self))
+
     def _add_check_constraint(
         self, options, name="{prefix}{fk_field}_or_{url_base_field}_filled"
     ) -> None:
@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2023 Dimpact
+"""
+Generate identifications from a PostgreSQL sequence per organisation and year.
+"""
+import re
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List, Set
+
+from django.conf import settings
+from django.db import (
+    IntegrityError,
+    ProgrammingError,
+    connections,
+    models,
+    router,
+    transaction,
+)
+
+
+class SequenceIdentificatieGenerator:
+    """
+    Generate identifications ``<PREFIX>-<year>-<number>`` for ``model``.
+
+    The numbers come from a sequence per organisation and year, which is created
+    when it's first needed and starts after the highest existing number. Unlike a
+    counter row, a sequence is never locked, so concurrent creates don't wait for
+    each other. Numbers of rolled back transactions are not re-used.
+
+    With the ``IDENTIFICATIE_BLOCK_SIZE`` setting, a process reserves blocks of
+    numbers at once, so consecutive creates (for example in a bulk import) don't
+    query the database for every number. The numbers of identifications created by
+    different processes are then no longer in the order of creation.
+
+    Set ``unique`` to ``False`` for models without a unique constraint on the
+    organisation and identification, so every generated identification is checked
+    before the insert.
+    """
+
+    def __init__(
+        self,
+        model: models.Model,
+        organisation_field: str,
+        date_field: str,
+        unique: bool = True,
+    ):
+        self.model = model
+        self.organisation_field = organisation_field
+        self.date_field = date_field
+        self.unique = unique
+
+        self._lock = threading.Lock()
+        self._blocks: Dict[str, List[int]] = defaultdict(list)
+        # sequences that are known to be committed - numbers are only reserved in
+        # advance for these, since the sequence (and thus its numbers) disappears
+        # again if the transaction creating it is rolled back
+        self._committed: Set[str] = set()
+        self._local = threading.local()
+
+    def clear(self) -> None:
+        """
+        Forget the reserved numbers and the known sequences.
+        """
+        with self._lock:
+            self._blocks.clear()
+            self._committed.clear()
+        self._local.__dict__.pop("pending", None)
+
+    def save(self, instance: models.Model, save: Callable[[], None]) -> None:
+        """
+        Generate the identification of ``instance`` and store it with ``save``.
+
+        Numbers that were assigned explicitly are detected when the insert violates
+        the unique constraint, or before the insert for models without one. The
+        sequence then continues after the highest number in use and the save is
+        retried.
+        """
+        organisation = getattr(instance, self.organisation_field)
+        model_name = getattr(
+            self.model, "IDENTIFICATIE_PREFIX", self.model._meta.model_name.upper()
+        )
+        prefix = f"{model_name}-{getattr(instance, self.date_field).year}"
+        sequence = re.sub(r"\W", "_", f"identificatie_{prefix}_{organisation}").lower()
+        using = router.db_for_write(self.model)
+
+        while True:
+            number = self._next_number(sequence, organisation, prefix)
+            instance.identificatie = f"{prefix}-{number:010d}"
+            if not self.unique and self._exists(organisation, instance.identificatie):
+                self._skip_assigned(sequence, organisation, prefix)
+                continue
+
+            try:
+                with transaction.atomic(using=using):
+                    save()
+                return
+            except IntegrityError:
+                if not self._exists(organisation, instance.identificatie):
+                    raise
+                self._skip_assigned(sequence, organisation, prefix)
+
+    def _exists(self, organisation: str, identificatie: str) -> bool:
+        return self.model._default_manager.filter(
+            **{self.organisation_field: organisation}, identificatie=identificatie
+        ).exists()
+
+    def _get_last_number(self, organisation: str, prefix: str) -> int:
+        max_id = self.model._default_manager.filter(
+            **{self.organisation_field: organisation},
+            identificatie__startswith=prefix,
+            identificatie__regex=prefix + r"-\d{10}",
+        ).aggregate(models.Max("identificatie"))["identificatie__max"]
+        return int(max_id.split("-")[-1]) if max_id is not None else 0
+
+    def _next_number(self, sequence: str, organisation: str, prefix: str) -> int:
+        with self._lock:
+            if self._blocks[sequence]:
+                return self._blocks[sequence].pop(0)
+
+        numbers = self._fetch_numbers(sequence, organisation, prefix)
+        with self._lock:
+            self._blocks[sequence] += numbers[1:]
+        return numbers[0]
+
+    def _skip_assigned(self, sequence: str, organisation: str, prefix: str) -> None:
+        """
+        Continue the sequence after the highest number in use.
+        """
+        with self._lock:
+            self._blocks.pop(sequence, None)
+
+        connection = connections[router.db_for_write(self.model)]
+        quoted_name = connection.ops.quote_name(sequence)
+        last_number = self._get_last_number(organisation, prefix)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT setval(%s, GREATEST(%s, last_value)) FROM {quoted_name}",
+                [quoted_name, last_number],
+            )
+
+    def _fetch_numbers(
+        self, sequence: str, organisation: str, prefix: str
+    ) -> List[int]:
+        using = router.db_for_write(self.model)
+        connection = connections[using]
+        quoted_name = connection.ops.quote_name(sequence)
+        pending = self._local.__dict__.setdefault("pending", set())
+
+        with connection.cursor() as cursor:
+            if sequence not in self._committed:
+                cursor.execute("SELECT to_regclass(%s)", [quoted_name])
+                if cursor.fetchone()[0] is None:
+                    try:
+                        with transaction.atomic(using=using):
+                            cursor.execute(
+                                f"CREATE SEQUENCE {quoted_name} START WITH %s",
+                                [self._get_last_number(organisation, prefix) + 1],
+                            )
+                    except (IntegrityError, ProgrammingError):
+                        cursor.execute("SELECT to_regclass(%s)", [quoted_name])
+                        if cursor.fetchone()[0] is None:
+                            # not a concurrent create, for example the CREATE
+                            # privilege is missing
+                            raise
+                        # created by a concurrent transaction in the meantime
+                        self._committed.add(sequence)
+                    else:
+                        pending.add(sequence)
+                        transaction.on_commit(
+                            lambda: self._committed.add(sequence), using=using
+                        )
+                elif sequence not in pending:
+                    # sequences created by other transactions are only visible once
+                    # they are committed
+                    self._committed.add(sequence)
+
+            count = (
+                settings.IDENTIFICATIE_BLOCK_SIZE if sequence in self._committed else 1
+            )
+            cursor.execute(
+                "SELECT nextval(%s) FROM generate_series(1, %s)", [quoted_name, count]
+            )
+            return [row[0] for row in cursor.fetchall()]
@@ -1,19 +1,421 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
-from django.core.paginator import Paginator as DjangoPaginator
+import hashlib
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ValidationError as DjangoValidationError,
+)
+from django.core.paginator import (
+    EmptyPage,
+    InvalidPage,
+    Page as DjangoPage,
+    PageNotAnInteger,
+    Paginator as DjangoPaginator,
+)
+from django.db import connections, models
+from django.db.models import Q
+from django.http import StreamingHttpResponse
 from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
 
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .renderers import RESULTS_PLACEHOLDER, render_json_stream
+
+
+def get_estimated_count(queryset: models.QuerySet) -> Optional[int]:
+    """
+    Return the number of rows the PostgreSQL planner expects the query to return.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_count(queryset: models.QuerySet) -> Tuple[int, bool]:
+    """
+    Count the results of the queryset according to the configured count strategy.
+
+    * if ``PAGINATION_COUNT_ESTIMATE_THRESHOLD`` is set and the planner estimate
+      exceeds it, the estimate is used rather than an exact ``COUNT(*)``
+    * if ``PAGINATION_COUNT_CACHE_TIMEOUT`` is set, the outcome is cached for that
+      many seconds. The compiled SQL (including the filter parameters and the
+      authorizations of the client) is used as cache key.
+
+    :return: a tuple of the count and whether the count is an estimate
+    """
+    timeout = settings.PAGINATION_COUNT_CACHE_TIMEOUT
+    threshold = settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD
+
+    cache_key = None
+    if timeout:
+        sql, params = queryset.query.sql_with_params()
+        digest = hashlib.sha256(repr((sql, params)).encode("utf-8")).hexdigest()
+        cache_key = f"pagination-count:{digest}"
+        result = cache.get(cache_key)
+        if result is not None:
+            return result
+
+    estimate = get_estimated_count(queryset) if threshold else None
+    if estimate is not None and estimate >= threshold:
+        result = (estimate, True)
+    else:
+        result = (queryset.count(), False)
+
+    if cache_key:
+        cache.set(cache_key, result, timeout=timeout)
+    return result
+
+
+class EstimatedCountPage(DjangoPage):
+    def __init__(self, object_list, number, paginator, has_next: bool):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
 
 
 class OptimizedPaginator(DjangoPaginator):
+    is_estimated_count = False
+
     @cached_property
     def count(self):
         """
         ⚡ restricts values to PK to remove implicit join from SQL query
+
+        For large result sets the count can be an estimate, see :func:`get_count`.
         """
-        return self.object_list.values("pk").count()
+        count, self.is_estimated_count = get_count(self.object_list.values("pk"))
+        return count
+
+    def validate_number(self, number):
+        if not self.count or not self.is_estimated_count:
+            return super().validate_number(number)
+
+        # the estimate can be too low, so pages beyond it must remain reachable
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.is_estimated_count:
+            return super().page(number)
+
+        # fetch one extra record to determine if there is a next page, since the
+        # number of pages derived from the estimate is not reliable
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not object_list and number > 1:
+            raise EmptyPage(_("That page contains no results"))
+
+        has_next = len(object_list) > self.per_page
+        return EstimatedCountPage(
+            object_list[: self.per_page], number, self, has_next=has_next
+        )
 
 
 class OptimizedPagination(PageNumberPagination):
     django_paginator_class = OptimizedPaginator
+
+    def paginate_queryset_lazily(self, queryset, request, view=None):
+        """
+        Paginate like :meth:`paginate_queryset`, without evaluating the page.
+
+        This allows the records of large pages to be fetched in chunks.
+        """
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg)
+
+        self.request = request
+        return self.page.object_list
+
+
+def _encode_position_value(value: Any) -> Any:
+    # ``DjangoJSONEncoder`` truncates microseconds, which breaks seeking on timestamps
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+class OptimizedCursorPagination(OptimizedPagination):
+    """
+    Page number pagination with an opt-in keyset (cursor) mode.
+
+    When the ``cursor`` query parameter is present (an empty value requests the first
+    page), the page number and the ``COUNT(*)`` query are skipped. Instead, the
+    ordering values of the last record of a page are encoded in the ``next`` link and
+    used to seek to the following page, so deep pages cost the same as the first one.
+
+    The ordering of the queryset (including the ordering chosen by the client through
+    the filterset) is used as keyset, with the primary key as tie-breaker. Only
+    non-nullable concrete fields can be part of the keyset.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = _("Invalid cursor")
+
+    use_cursor = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.use_cursor = self.cursor_query_param in request.query_params
+        if not self.use_cursor:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.ordering = self.get_keyset_ordering(queryset)
+        queryset = queryset.order_by(*self.ordering)
+
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self.get_seek_filter(position))
+
+        # fetch one extra record to know if there is a next page, without counting
+        results = list(queryset[: page_size + 1])
+        self.has_next = len(results) > page_size
+        self.page = results[:page_size]
+        return self.page
+
+    def paginate_queryset_lazily(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset_lazily(queryset, request, view=view)
+        # the last record is needed for the next link, so the page is evaluated
+        return self.paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        if not self.use_cursor:
+            return super().get_paginated_response(data)
+
+        return Response(
+            OrderedDict([("next", self.get_next_link()), ("results", data)])
+        )
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.use_cursor:
+            return super().get_next_link()
+
+        if not self.has_next:
+            return None
+
+        last = self.page[-1]
+        position = [
+            _encode_position_value(getattr(last, field.lstrip("-")))
+            for field in self.ordering
+        ]
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.page_query_param
+        )
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(position)
+        )
+
+    def get_keyset_ordering(self, queryset: models.QuerySet) -> List[str]:
+        model = queryset.model
+        ordering = list(queryset.query.order_by) or list(model._meta.ordering)
+
+        keyset = []
+        for item in ordering:
+            name = item.lstrip("-") if isinstance(item, str) else None
+            if name in ("pk", model._meta.pk.name):
+                keyset.append(item.replace(name, "pk"))
+                break
+
+            try:
+                field = model._meta.get_field(name) if name else None
+            except FieldDoesNotExist:
+                field = None
+
+            if field is None or not field.concrete or field.null or field.is_relation:
+                raise ValidationError(
+                    {
+                        api_settings.NON_FIELD_ERRORS_KEY: _(
+                            "The ordering '{ordering}' is not supported in combination "
+                            "with cursor pagination."
+                        ).format(ordering=item)
+                    },
+                    code="unsupported-cursor-ordering",
+                )
+            keyset.append(item)
+
+        # the primary key makes the keyset unique
+        if not keyset or keyset[-1].lstrip("-") != "pk":
+            descending = bool(keyset) and keyset[-1].startswith("-")
+            keyset.append("-pk" if descending else "pk")
+        return keyset
+
+    def get_seek_filter(self, position: list) -> Q:
+        """
+        Build the lexicographic "comes after" condition for the keyset.
+
+        For an ordering ``(a, -b, pk)`` this results in
+        ``a > x OR (a = x AND b < y) OR (a = x AND b = y AND pk > z)``.
+        """
+        seek_filter = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            seek_filter |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return seek_filter
+
+    def encode_cursor(self, position: list) -> str:
+        return urlsafe_b64encode(json.dumps(position).encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, request, model) -> Optional[list]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            decoded = urlsafe_b64decode(encoded.encode("ascii")).decode("utf-8")
+            position = json.loads(decoded)
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError("Cursor does not match the ordering")
+
+            return [
+                model._meta.pk.to_python(value)
+                if field.lstrip("-") == "pk"
+                else model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (TypeError, ValueError, UnicodeError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class CursorPaginationMixin:
+    """
+    Accept the cursor query parameter of :class:`OptimizedCursorPagination`.
+
+    :class:`vng_api_common.viewsets.CheckQueryParamsMixin` only knows about the
+    page number parameters and would reject the request otherwise.
+    """
+
+    def _check_query_params(self, request) -> None:
+        cursor_query_param = getattr(self.paginator, "cursor_query_param", None)
+        if cursor_query_param not in request.query_params:
+            return super()._check_query_params(request)
+
+        query_params = request.query_params.copy()
+        del query_params[cursor_query_param]
+        super()._check_query_params(SimpleNamespace(query_params=query_params))
+
+
+class StreamingListMixin:
+    """
+    Stream the JSON of large list and search responses.
+
+    If the page size exceeds ``STREAMING_RESPONSE_CHUNK_SIZE``, the records of the
+    page are fetched and serialized in chunks of that size and written to the
+    response one by one, so memory usage does not grow with the page size. The
+    shape of the response is unchanged.
+
+    Put this mixin after :class:`vng_api_common.viewsets.CheckQueryParamsMixin` and
+    :class:`CursorPaginationMixin`, so the query parameters of streamed lists are
+    validated as well.
+    """
+
+    def should_stream(self) -> bool:
+        chunk_size = settings.STREAMING_RESPONSE_CHUNK_SIZE
+        if not chunk_size or not isinstance(self.paginator, OptimizedPagination):
+            return False
+
+        # cursor pages are fetched with a keyset query by the paginator
+        cursor_query_param = getattr(self.paginator, "cursor_query_param", None)
+        if cursor_query_param in self.request.query_params:
+            return False
+
+        # the browsable API renders HTML
+        if getattr(self.request.accepted_renderer, "format", None) != "json":
+            return False
+
+        page_size = self.paginator.get_page_size(self.request)
+        return bool(page_size) and page_size > chunk_size
+
+    def list(self, request, *args, **kwargs):
+        if not self.should_stream():
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.get_streaming_response(queryset)
+
+    def get_search_output(self, queryset):
+        if not self.should_stream():
+            return super().get_search_output(queryset)
+
+        return self.get_streaming_response(queryset)
+
+    def get_streaming_response(self, queryset) -> StreamingHttpResponse:
+        chunk_size = settings.STREAMING_RESPONSE_CHUNK_SIZE
+        page = self.paginator.paginate_queryset_lazily(
+            queryset, self.request, view=self
+        )
+        data = self.paginator.get_paginated_response(RESULTS_PLACEHOLDER).data
+
+        # ``QuerySet.iterator`` ignores ``prefetch_related``, so the page is sliced
+        # into chunks instead
+        def get_results():
+            start = 0
+            while True:
+                chunk = list(page[start : start + chunk_size])
+                yield from self.get_serializer(chunk, many=True).data
+                if len(chunk) < chunk_size:
+                    break
+                start += chunk_size
+
+        return StreamingHttpResponse(
+            render_json_stream(
+                self.request.accepted_renderer,
+                data,
+                get_results(),
+                accepted_media_type=self.request.accepted_media_type,
+                renderer_context=self.get_renderer_context(),
+            ),
+            content_type=self.request.accepted_media_type,
+        )
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from typing import Any, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from django.conf import settings
@@ -11,6 +12,14 @@ from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
 from vng_api_common.utils import get_resources_for_paths
 
+from .cache import LocalLRUCache, get_cache_generation
+from .constants import AUTHORIZATIONS_CACHE_GENERATION
+
+# pairs of allowed loose-fk object (or URL) and maximum vertrouwelijkheidaanduiding order
+CompiledFilters = List[Tuple[Any, Optional[int]]]
+
+compiled_filters_cache = LocalLRUCache(maxsize=1000)
+
 
 class QueryBlocked(Exception):
     pass
@@ -79,24 +88,18 @@ class LooseFkAuthorizationsFilterMixin:
             queryset = self.filter(_local_filters | _external_filters)
         return queryset
 
-    def get_filters(self, scope, authorizations, local=True) -> dict:
-        prefix = self.prefix
-        loose_fk_field = (
-            f"_{self.loose_fk_field}" if local else f"_{self.loose_fk_field}_url"
-        )
-
+    def compile_filters(self, authorizations, local=True) -> CompiledFilters:
+        """
+        Resolve the authorizations into the allowed loose-fk objects (or URLs for
+        external objects), together with the order of the
+        ``max_vertrouwelijkheidaanduiding`` for each of them.
+        """
         # resource URLs to either use as-is or resolve to database records
         resource_urls = [
             getattr(authorization, self.loose_fk_field)
             for authorization in authorizations
         ]
 
-        # keep a list of allowed loose-fk objects
-        loose_fk_objecten = []
-        # build the case/when to map the max_vertrouwelijkheidaanduiding based
-        # on the ``zaaktype``
-        vertrouwelijkheidaanduiding_whens = []
-
         if not local:
             loose_fk_object_map = dict(zip(resource_urls, resource_urls))
         else:
@@ -113,20 +116,39 @@ class LooseFkAuthorizationsFilterMixin:
                 )
                 loose_fk_object_map = dict(zip(sorted(resource_urls), sorted_objects))
 
+        compiled = []
         for authorization in authorizations:
             resource_url = getattr(authorization, self.loose_fk_field)
-            loose_fk_object = loose_fk_object_map[resource_url]
-            loose_fk_objecten.append(loose_fk_object)
 
             # extract the order and map it to the database value
+            order = None
             if authorization.max_vertrouwelijkheidaanduiding:
-                choice_item = VertrouwelijkheidsAanduiding.get_choice(
+                order = VertrouwelijkheidsAanduiding.get_choice(
                     authorization.max_vertrouwelijkheidaanduiding
-                )
+                ).order
+
+            compiled.append((loose_fk_object_map[resource_url], order))
+        return compiled
+
+    def build_filters(self, compiled: CompiledFilters, local=True) -> dict:
+        prefix = self.prefix
+        loose_fk_field = (
+            f"_{self.loose_fk_field}" if local else f"_{self.loose_fk_field}_url"
+        )
+
+        # keep a list of allowed loose-fk objects
+        loose_fk_objecten = []
+        # build the case/when to map the max_vertrouwelijkheidaanduiding based
+        # on the ``zaaktype``
+        vertrouwelijkheidaanduiding_whens = []
+
+        for loose_fk_object, order in compiled:
+            loose_fk_objecten.append(loose_fk_object)
+            if order is not None:
                 vertrouwelijkheidaanduiding_whens.append(
                     When(
                         **{f"{prefix}{loose_fk_field}": loose_fk_object},
-                        then=Value(choice_item.order),
+                        then=Value(order),
                     )
                 )
 
@@ -160,17 +182,52 @@ class LooseFkAuthorizationsFilterMixin:
 
         return authorizations_local, authorizations_external
 
+    def get_compiled_filters(
+        self, scope: Scope, authorizations: models.QuerySet
+    ) -> Tuple[CompiledFilters, CompiledFilters]:
+        """
+        Return the compiled local and external filters for the authorizations.
+
+        Resolving the authorizations is expensive for applications with many of
+        them, so the result is cached per set of authorizations (which captures the
+        applications and the component) and scope. The cache is invalidated whenever
+        applications, authorizations or catalogi types change.
+        """
+        cache_key = None
+        if isinstance(authorizations, models.QuerySet):
+            cache_key = (
+                get_cache_generation(AUTHORIZATIONS_CACHE_GENERATION),
+                self.loose_fk_field,
+                str(scope),
+                str(authorizations.query),
+            )
+            compiled = compiled_filters_cache.get(cache_key)
+            if compiled is not None:
+                return compiled
+
+        authorizations_local, authorizations_external = self.get_authorizations(
+            scope, authorizations
+        )
+        compiled = (
+            self.compile_filters(authorizations_local, local=True),
+            self.compile_filters(authorizations_external, local=False),
+        )
+
+        if cache_key is not None:
+            compiled_filters_cache.set(cache_key, compiled)
+        return compiled
+
     def filter_for_authorizations(
         self, scope: Scope, authorizations: models.QuerySet
     ) -> models.QuerySet:
 
         # todo implement error if no loose-fk field
 
-        authorizations_local, authorizations_external = self.get_authorizations(
+        compiled_local, compiled_external = self.get_compiled_filters(
             scope, authorizations
         )
 
-        local_filters = self.get_filters(scope, authorizations_local, True)
-        external_filters = self.get_filters(scope, authorizations_external, False)
+        local_filters = self.build_filters(compiled_local, local=True)
+        external_filters = self.build_filters(compiled_external, local=False)
 
         return self.build_queryset(local_filters, external_filters)
@@ -1,8 +1,38 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2021 Dimpact
+import json
+from typing import Iterable, Iterator
+
 from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from rest_framework.renderers import BaseRenderer
 from vng_api_common.views import ERROR_CONTENT_TYPE
 
+RESULTS_PLACEHOLDER = "__streamed_results__"
+
 
 class ProblemJSONRenderer(CamelCaseJSONRenderer):
     media_type = ERROR_CONTENT_TYPE
+
+
+def render_json_stream(
+    renderer: BaseRenderer,
+    data: dict,
+    results: Iterable[dict],
+    accepted_media_type: str = None,
+    renderer_context: dict = None,
+) -> Iterator[bytes]:
+    """
+    Render ``data`` with the JSON ``renderer``, writing the results one by one.
+
+    ``data`` must contain :const:`RESULTS_PLACEHOLDER` as value, which is replaced
+    with the array of ``results``. Only a single result is held in memory at a time.
+    """
+    rendered = renderer.render(data, accepted_media_type, renderer_context)
+    prefix, suffix = rendered.split(json.dumps(RESULTS_PLACEHOLDER).encode(), 1)
+
+    yield prefix + b"["
+    for index, result in enumerate(results):
+        if index:
+            yield b","
+        yield renderer.render(result, accepted_media_type, renderer_context)
+    yield b"]" + suffix
@@ -1,8 +1,12 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from typing import Optional
+from urllib.parse import ParseResult, urlparse
+
+from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
-from django_loose_fk.drf import FKOrURLField, FKOrURLValidator
+from django_loose_fk.drf import FKOrURLField, FKOrURLValidator, Resolver
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from vng_api_common.validators import URLValidator
@@ -51,6 +55,32 @@ class LengthHyperlinkedRelatedField(
     pass
 
 
+class CachedResolver(Resolver):
+    """
+    Resolve local URLs from a cache, falling back to the database.
+
+    Serializers set it as their ``resolver_class`` to resolve the URLs of their
+    :class:`FKOrServiceUrlField` fields with it. Subclasses implement
+    :meth:`get_cached`.
+    """
+
+    def get_cached(self, path: str) -> Optional[models.Model]:
+        """
+        Return the cached object the local API path points to, or ``None``.
+        """
+        raise NotImplementedError
+
+    def resolve_cached(self, host: str, url: str) -> Optional[models.Model]:
+        parsed = urlparse(url)
+        return self.get_cached(parsed.path) if parsed.netloc == host else None
+
+    def resolve_local(self, parsed: ParseResult) -> models.Model:
+        instance = self.get_cached(parsed.path)
+        if instance is not None:
+            return instance
+        return super().resolve_local(parsed)
+
+
 class FKOrServiceUrlValidator(FKOrURLValidator):
     # TODO: move this to validators.py
     RESOLVED_INSTANCE_CONTEXT_KEY = "_resolved_instance"
@@ -64,19 +94,33 @@ class FKOrServiceUrlValidator(FKOrURLValidator):
         if serializer_field.context.get(context_key) is not None:
             return
 
-        try:
-            super().__call__(url, serializer_field)
-        except ValueError as exc:
-            raise serializers.ValidationError(
-                _("The service for this url is unknown"), code="unknown-service"
-            ) from exc
-
-        # if there are no validation errors, the parent class has added the resolver
-        # to the serializer context - we can use this to resolve the object and cache
-        # it for other validators to skip some DB queries
-        resolver = serializer_field.context["resolver"]
+        model, field = serializer_field._get_model_and_field()
+        resolver_class = getattr(serializer_field.parent, "resolver_class", Resolver)
+        resolver = resolver_class(model, field)
         host = serializer_field.context["request"].get_host()
-        resolved_instance = resolver.resolve(host, url)
+
+        # ⚡️ an URL that resolves to a cached object is valid, so the validation by
+        # the parent class is skipped
+        resolved_instance = (
+            resolver.resolve_cached(host, url)
+            if isinstance(resolver, CachedResolver)
+            else None
+        )
+
+        if resolved_instance is None:
+            try:
+                super().__call__(url, serializer_field)
+            except ValueError as exc:
+                raise serializers.ValidationError(
+                    _("The service for this url is unknown"), code="unknown-service"
+                ) from exc
+
+            # if there are no validation errors, resolve the object and cache it for
+            # other validators to skip some DB queries
+            resolved_instance = resolver.resolve(host, url)
+
+        # the field resolves the object with the resolver in the serializer context
+        serializer_field.context["resolver"] = resolver
         serializer_field.context[context_key] = resolved_instance
 
     @staticmethod